@@ -9,9 +9,15 @@ class UISettings:
     ANIMATION_SPEED: float = 0.1
     LAYOUT_UPDATE_INTERVAL: float = 0.016  # ~60fps
     LOG_UPDATE_INTERVAL: float = 1000      # 1초
+    FRAME_RATE: float = 60.0               # 화면 주사율을 알 수 없을 때의 프레임 수 (fps)
     SIMULATION_SPEED_MIN: int = 100        # 최소 시뮬레이션 속도 (ms)
     SIMULATION_SPEED_MAX: int = 2000       # 최대 시뮬레이션 속도 (ms)
     SIMULATION_SPEED_DEFAULT: int = 1000   # 기본 시뮬레이션 속도 (ms)
+    TURBO_FRAME_INTERVAL: int = 16         # 터보 모드 프레임 간격 (ms)
+    TURBO_FRAME_BUDGET_MS: float = 8.0     # 터보 모드 프레임당 단계 처리 시간 예산 (ms)
+    NODE_SPRITE_CACHE_KB: int = 16 * 1024  # 노드 이미지 캐시 최대 크기 (KB)
+    LOD_LABEL_SPACING: float = 40.0        # 이 간격(px) 이상이면 이름이 있는 노드와 곡선 간선
+    LOD_DOT_SPACING: float = 6.0           # 이 간격(px) 미만이면 노드를 점으로 표시
 
 @dataclass
 class LogSettings:
@@ -19,14 +25,31 @@ class LogSettings:
     MAX_LOG_FILES: int = 10
     MAX_LOG_SIZE: int = 1024 * 1024  # 1MB
     LOG_FORMAT: str = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    LEVEL: str = 'INFO'               # 기록할 최소 수준 (단계별 로그는 DEBUG)
+    MEMORY_MAX_RECORDS: int = 10_000  # 메모리에 보관하는 최근 로그 수
+    VIEWER_MAX_LINES: int = 1_000     # 로그 뷰어에 표시하는 최대 줄 수
 
 @dataclass
 class CacheSettings:
     CACHE_DIR: Path = Path.home() / '.recursion_visualizer' / 'cache'
     MAX_CACHE_AGE_DAYS: int = 7
     MAX_CACHE_SIZE: int = 100 * 1024 * 1024  # 100MB
+    TRACE_CACHE_MAX_ENTRIES: int = 4096          # 서브트리 기록 최대 개수
+    TRACE_CACHE_MAX_STEPS: int = 2_000_000       # 전체 기록 단계 수 상한
+    TRACE_CACHE_MAX_ENTRY_STEPS: int = 200_000   # 한 서브트리의 기록 단계 수 상한
+
+@dataclass
+class EngineSettings:
+    CHECKPOINT_INTERVAL: int = 1024   # 체크포인트 간격 (단계 수)
+    UNDO_LOG_LIMIT: int = 1_000_000   # 되돌리기 로그에 보관할 최대 단계 수
+    INTERACTIVE_MAX_STEPS: int = 2_000_000  # 화면 재생을 허용할 예상 단계 수
+    INTERACTIVE_MAX_NODES: int = 200_000    # 호출 트리를 구성할 최대 예상 노드 수
+    HEADLESS_MAX_STEPS: int = 20_000_000    # 요약(헤드리스) 실행을 허용할 예상 단계 수
+    PRODUCER_BATCH_SIZE: int = 256          # 작업 스레드가 한 번에 넘기는 단계 수
+    PRODUCER_QUEUE_BATCHES: int = 64        # 큐에 쌓아 둘 최대 묶음 수
 
 class Settings:
     UI = UISettings()
     LOG = LogSettings()
-    CACHE = CacheSettings() 
\ No newline at end of file
+    CACHE = CacheSettings()
+    ENGINE = EngineSettings() 
\ No newline at end of file
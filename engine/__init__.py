@@ -0,0 +1,9 @@
+from .admission import Admission, admit
+from .runner import HeadlessRunner, RunReport
+from .timeline import Timeline
+from .trace_cache import TraceCache, cached_trace
+
+__all__ = [
+    'Admission', 'admit', 'HeadlessRunner', 'RunReport', 'Timeline',
+    'TraceCache', 'cached_trace'
+]
@@ -0,0 +1,122 @@
+"""헤드리스 실행 진입점
+
+사용 예:
+    python -m engine fibonacci 30
+    python -m engine hanoi 10 --trace hanoi.jsonl
+    python -m engine fibonacci 30 --strategy all
+    python -m engine permutation 10 --estimate
+"""
+import argparse
+import sys
+
+from engine.admission import Admission, admit
+from engine.registry import SIMULATIONS, get_spec
+from engine.runner import HeadlessRunner
+from engine.trace_cache import TraceCache
+from models.call_tree import CallTreeManager
+from utils.logger import Logger
+
+def build_parser() -> argparse.ArgumentParser:
+    usages = "\n".join(f"  {name:<20}{spec.usage}" for name, spec in sorted(SIMULATIONS.items()))
+    parser = argparse.ArgumentParser(
+        prog="python -m engine",
+        description="Qt 없이 재귀 시뮬레이션을 최대 속도로 실행합니다.",
+        epilog=f"시뮬레이션별 인자:\n{usages}",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "simulation",
+        choices=sorted(SIMULATIONS),
+        help="실행할 시뮬레이션"
+    )
+    parser.add_argument("values", type=int, nargs="+", help="정수 인자")
+    parser.add_argument("--trace", metavar="PATH",
+                        help="각 단계를 JSON Lines 형식으로 기록할 파일")
+    parser.add_argument("--tree", action="store_true",
+                        help="CallTreeManager 트리도 함께 구성")
+    parser.add_argument("--cache", action="store_true",
+                        help="같은 인자의 재귀 호출을 기록해 재생하는 트레이스 캐시 사용")
+    parser.add_argument("--strategy",
+                        help="계산 전략 (예: fibonacci의 naive/memo/fast_doubling, "
+                             "'all'이면 모든 전략을 비교)")
+    parser.add_argument("--estimate", action="store_true",
+                        help="실행하지 않고 예상 비용만 출력")
+    parser.add_argument("--force", action="store_true",
+                        help="예상 비용이 예산을 넘어도 실행")
+    return parser
+
+def format_comparison(reports) -> str:
+    """전략별 실행 결과를 표로 정리"""
+    lines = [f"{'전략':<16}{'단계 수':>12}{'노드 수':>12}{'최대 깊이':>10}{'시간(초)':>10}"]
+    for strategy, report in reports:
+        lines.append(
+            f"{strategy:<16}{report.steps:>12}{report.nodes:>12}"
+            f"{report.max_depth:>10}{report.elapsed:>10.3f}"
+        )
+    return "\n".join(lines)
+
+def main(argv=None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    spec = get_spec(args.simulation)
+    try:
+        spec.check_values(args.values)
+    except ValueError as e:
+        parser.error(str(e))
+    name = f"{spec.name} {' '.join(map(str, args.values))}"
+
+    if args.strategy == "all":
+        strategies = list(spec.strategies)
+        if not strategies:
+            print(f"{spec.name}은(는) 선택 가능한 전략이 없습니다", file=sys.stderr)
+            return 2
+    else:
+        strategies = [args.strategy]
+
+    # 실행 전에 비용을 예측해 예산을 넘는 실행은 거부하거나 트리 구성을 생략
+    estimates = []
+    for strategy in strategies:
+        label = name if strategy is None else f"{name} ({strategy})"
+        try:
+            estimate = spec.estimate(args.values, strategy)
+        except ValueError as e:
+            print(str(e), file=sys.stderr)
+            return 2
+        print(f"{label} - {estimate.format()}")
+        estimates.append((strategy, label, estimate))
+    if args.estimate:
+        return 0
+
+    trace = open(args.trace, "w", encoding="utf-8") if args.trace else None
+    reports = []
+    try:
+        for strategy, label, estimate in estimates:
+            admission = admit(estimate)
+            if admission is Admission.REFUSED and not args.force:
+                print(f"{label}: 예상 단계 수가 예산을 초과합니다 "
+                      f"(--force로 강제 실행)", file=sys.stderr)
+                return 3
+            build_tree = args.tree
+            if build_tree and admission is not Admission.INTERACTIVE and not args.force:
+                print(f"{label}: 예상 노드 수가 많아 트리 구성을 생략합니다", file=sys.stderr)
+                build_tree = False
+            runner = HeadlessRunner(
+                call_tree_manager=CallTreeManager() if build_tree else None,
+                trace=trace,
+                trace_cache=TraceCache() if args.cache else None
+            )
+            steps = spec.create(args.values, strategy)
+            reports.append((strategy, runner.run(steps, name=label)))
+    finally:
+        if trace is not None:
+            trace.close()
+        Logger().cleanup()
+
+    if len(reports) > 1:
+        print(format_comparison(reports))
+    else:
+        print(reports[0][1].format())
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
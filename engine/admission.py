@@ -0,0 +1,20 @@
+from enum import Enum
+
+from config.settings import Settings
+from models.cost_estimate import CostEstimate
+
+class Admission(Enum):
+    """예상 비용에 따른 실행 방식"""
+    INTERACTIVE = "interactive"  # 트리를 구성하며 화면에 재생
+    HEADLESS = "headless"        # 트리 없이 결과와 통계만 계산
+    REFUSED = "refused"          # 실행 거부
+
+def admit(estimate: CostEstimate) -> Admission:
+    """예상 비용을 설정된 예산과 비교해 실행 방식 결정"""
+    engine = Settings.ENGINE
+    if estimate.steps > engine.HEADLESS_MAX_STEPS:
+        return Admission.REFUSED
+    if estimate.steps > engine.INTERACTIVE_MAX_STEPS or \
+            estimate.nodes > engine.INTERACTIVE_MAX_NODES:
+        return Admission.HEADLESS
+    return Admission.INTERACTIVE
@@ -0,0 +1,91 @@
+from typing import Any, Generator, List
+
+from models.simulation_step import SimulationStep
+
+class RecordedCall:
+    """하위 호출의 단계를 기록해 달라고 드라이버에게 요청하는 표시
+
+    시뮬레이션 프레임이 이 객체를 yield하면 드라이버는 call을 일반 하위 호출처럼
+    실행하면서 내보낸 단계를 모아 두었다가, 끝나면 (반환값, 단계 튜플)을 돌려준다.
+    기록이 limit 단계를 넘으면 기록을 포기하고 단계 자리에 None을 돌려준다.
+    """
+    __slots__ = ('call', 'limit')
+
+    def __init__(self, call: Generator, limit: int):
+        self.call = call
+        self.limit = limit
+
+def drive(root: Generator) -> Generator[SimulationStep, None, Any]:
+    """명시적 프레임 스택으로 시뮬레이션을 실행하는 트램펄린 드라이버
+
+    시뮬레이션은 하위 호출을 `yield from` 대신 `value = yield Sim.run(...)`처럼
+    하위 제너레이터를 yield해서 요청한다. 드라이버가 그 제너레이터를 스택에
+    올려 실행하고 반환값을 다시 보내 주므로, 단계 하나를 꺼내는 비용은 재귀
+    깊이와 무관하게 O(1)이고 파이썬 재귀 한도에도 걸리지 않는다.
+    """
+    stack: List[Generator] = [root]
+    push = stack.append
+    pop = stack.pop
+    # 기록 중인 호출: [하위 호출의 스택 위치, 로그 시작 위치(포기 시 None), 상한]
+    recordings: List[list] = []
+    log: List[SimulationStep] = []
+    log_limit = 0
+    value = None
+
+    while stack:
+        try:
+            item = stack[-1].send(value)
+        except StopIteration as stop:
+            pop()
+            value = stop.value
+            if recordings and recordings[-1][0] == len(stack):
+                _, start, limit = recordings.pop()
+                # 하위 호출이 없는 호출은 여기서 처음 크기를 확인한다
+                if start is not None and len(log) - start > limit:
+                    start = None
+                value = (value, tuple(log[start:]) if start is not None else None)
+                if not recordings:
+                    log.clear()
+            continue
+
+        value = None
+        if item.__class__ is SimulationStep:
+            if recordings:
+                log.append(item)
+            yield item
+        elif item.__class__ is RecordedCall:
+            if len(log) > log_limit:
+                _trim_recordings(recordings, log)
+            log_limit = item.limit
+            recordings.append([len(stack), len(log), log_limit])
+            push(item.call)
+        else:
+            # 호출 경계에서만 기록 크기를 확인한다
+            if recordings and len(log) > log_limit:
+                _trim_recordings(recordings, log)
+            push(item)
+
+    return value
+
+def _trim_recordings(recordings: List[list], log: List[SimulationStep]) -> None:
+    """상한을 넘긴 기록을 바깥쪽부터 포기하고 더 이상 필요 없는 로그를 버린다
+
+    살아 있는 가장 바깥쪽 기록이 항상 로그의 0번부터 시작하도록 유지하므로
+    드라이버는 len(log)만 보고 이 함수를 부를지 결정할 수 있다.
+    """
+    size = len(log)
+    base = size
+    for record in recordings:
+        start = record[1]
+        if start is None:
+            continue
+        if size - start > record[2]:
+            record[1] = None
+        else:
+            base = start
+            break
+    if base:
+        del log[:base]
+        for record in recordings:
+            if record[1] is not None:
+                record[1] -= base
@@ -0,0 +1,128 @@
+import queue
+import threading
+from typing import Any, Generator, List, Optional
+
+from config.settings import Settings
+from models.simulation_step import SimulationStep
+from utils.logger import Logger
+
+class _Done:
+    """생산 종료 표시 (결과 또는 오류를 함께 전달)"""
+    __slots__ = ('result', 'error')
+
+    def __init__(self, result: Any = None, error: Optional[BaseException] = None):
+        self.result = result
+        self.error = error
+
+class StepProducer:
+    """시뮬레이션 제너레이터를 작업 스레드에서 실행해 단계 묶음을 큐로 전달
+
+    큐의 크기가 제한되어 있어 소비자가 따라오지 못하면 생산자는 자리가 날 때까지
+    기다린다. 큐가 비어 있으면 덜 찬 묶음도 바로 보내 지연을 줄인다.
+    일시정지는 다음 단계 계산 전에, 취소는 현재 단계가 끝나는 즉시 반영된다.
+    """
+
+    def __init__(self, steps: Generator[SimulationStep, None, Any],
+                 batch_size: Optional[int] = None,
+                 max_batches: Optional[int] = None):
+        self.logger = Logger()
+        self.batch_size = max(1, batch_size or Settings.ENGINE.PRODUCER_BATCH_SIZE)
+        self.finished = False
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self._steps = steps
+        self._queue: queue.Queue = queue.Queue(
+            maxsize=max(1, max_batches or Settings.ENGINE.PRODUCER_QUEUE_BATCHES)
+        )
+        self._running = threading.Event()
+        self._running.set()
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(target=self._produce, name="StepProducer", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def pause(self) -> None:
+        self._running.clear()
+
+    def resume(self) -> None:
+        self._running.set()
+
+    def cancel(self, timeout: float = 1.0) -> None:
+        """생산을 중단하고 스레드가 끝나기를 기다림"""
+        self._cancelled.set()
+        self._running.set()
+        # 큐가 가득 차 대기 중인 생산자를 깨운다
+        self._discard_pending()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._discard_pending()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def drain(self) -> List[SimulationStep]:
+        """지금까지 생산된 단계를 기다리지 않고 모두 가져옴"""
+        steps: List[SimulationStep] = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return steps
+            if isinstance(item, _Done):
+                self.finished = True
+                self.result = item.result
+                self.error = item.error
+                return steps
+            steps.extend(item)
+
+    def _produce(self) -> None:
+        steps = self._steps
+        batch: List[SimulationStep] = []
+        done = _Done()
+        try:
+            while not self._cancelled.is_set():
+                if not self._running.is_set():
+                    if batch and self._put(batch):
+                        batch = []
+                    self._running.wait()
+                    continue
+                try:
+                    batch.append(next(steps))
+                except StopIteration as stop:
+                    done.result = stop.value
+                    break
+                # 소비자가 기다리고 있으면 묶음이 덜 찼어도 바로 보낸다
+                if len(batch) >= self.batch_size or self._queue.empty():
+                    if not self._put(batch):
+                        break
+                    batch = []
+        except Exception as e:
+            self.logger.error("단계 생산 중 오류: %s", e)
+            done.error = e
+        finally:
+            steps.close()
+
+        if self._cancelled.is_set():
+            return
+        if batch:
+            self._put(batch)
+        self._put(done)
+
+    def _put(self, item: Any) -> bool:
+        """큐에 자리가 날 때까지 기다리며 넣음 (취소되면 False)"""
+        while not self._cancelled.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _discard_pending(self) -> None:
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                return
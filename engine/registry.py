@@ -0,0 +1,91 @@
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
+from simulations import (
+    FibonacciSimulation,
+    HanoiSimulation,
+    AccumulateSumSimulation,
+    AccumulateProductSimulation,
+    FactorialSimulation,
+    BinomialCoefficientSimulation,
+    GCDSimulation,
+    PowerSimulation,
+    PermutationSimulation,
+    CombinationSimulation
+)
+from simulations.base import BaseSimulation
+from models.cost_estimate import CostEstimate
+
+@dataclass(frozen=True)
+class SimulationSpec:
+    """명령줄 이름과 시뮬레이션 인자 구성 방법"""
+    name: str
+    simulation: Type[BaseSimulation]
+    build_args: Callable[[List[int]], Tuple]
+    usage: str
+    strategies: Tuple[str, ...] = ()
+
+    def check_values(self, values: List[int]) -> None:
+        """정수 인자 개수가 usage와 맞는지 확인 ([]로 감싼 인자는 생략 가능)"""
+        names = self.usage.split()
+        required = sum(1 for name in names if not name.startswith("["))
+        if not required <= len(values) <= len(names):
+            raise ValueError(f"사용법: {self.name} {self.usage}")
+
+    def create(self, values: List[int], strategy: Optional[str] = None):
+        """정수 인자로부터 시뮬레이션 제너레이터 생성"""
+        args = self.build_args(values)
+        if strategy is None:
+            return self.simulation.start(*args)
+        self._check_strategy(strategy)
+        return self.simulation.start(*args, strategy=strategy)
+
+    def estimate(self, values: List[int], strategy: Optional[str] = None) -> CostEstimate:
+        """정수 인자로 실행했을 때의 비용 예측"""
+        args = self.build_args(values)
+        if strategy is None:
+            return self.simulation.estimate(*args)
+        self._check_strategy(strategy)
+        return self.simulation.estimate(*args, strategy=strategy)
+
+    def _check_strategy(self, strategy: str) -> None:
+        if strategy not in self.strategies:
+            raise ValueError(f"{self.name}은(는) '{strategy}' 전략을 지원하지 않습니다")
+
+def _arg(values: List[int], index: int, default: int) -> int:
+    return values[index] if len(values) > index else default
+
+# 기본값은 GUI의 startSimulation과 동일하게 맞춘다
+SIMULATIONS: Dict[str, SimulationSpec] = {
+    spec.name: spec for spec in [
+        SimulationSpec("fibonacci", FibonacciSimulation,
+                       lambda v: (v[0],), "n", FibonacciSimulation.STRATEGIES),
+        SimulationSpec("hanoi", HanoiSimulation,
+                       lambda v: (v[0], "A", "C", "B"), "n"),
+        SimulationSpec("accumulate_sum", AccumulateSumSimulation,
+                       lambda v: (v[0],), "n"),
+        SimulationSpec("accumulate_product", AccumulateProductSimulation,
+                       lambda v: (v[0],), "n"),
+        SimulationSpec("factorial", FactorialSimulation,
+                       lambda v: (v[0],), "n"),
+        SimulationSpec("binomial", BinomialCoefficientSimulation,
+                       lambda v: (v[0], _arg(v, 1, v[0] // 2)), "n [k]"),
+        SimulationSpec("gcd", GCDSimulation,
+                       lambda v: (v[0], _arg(v, 1, v[0] // 2)), "a [b]"),
+        SimulationSpec("power", PowerSimulation,
+                       lambda v: (v[0], _arg(v, 1, 2)), "base [exponent]"),
+        SimulationSpec("permutation", PermutationSimulation,
+                       lambda v: (list(range(1, v[0] + 1)),), "n",
+                       PermutationSimulation.STRATEGIES),
+        SimulationSpec("combination", CombinationSimulation,
+                       lambda v: (list(range(1, v[0] + 1)), _arg(v, 1, v[0] // 2)), "n [k]",
+                       CombinationSimulation.STRATEGIES),
+    ]
+}
+
+def get_spec(name: str) -> SimulationSpec:
+    """이름으로 시뮬레이션 명세 조회"""
+    try:
+        return SIMULATIONS[name]
+    except KeyError:
+        raise KeyError(f"알 수 없는 시뮬레이션: {name}") from None
@@ -0,0 +1,153 @@
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Generator, Optional, TextIO
+
+from models.call_tree import CallTreeManager
+from models.simulation_step import SimulationStep, StepType
+from models.value_preview import exceeds_str_limit, preview
+from utils.logger import Logger
+from .trace_cache import TraceCache
+
+PUSH = StepType.PUSH
+POP = StepType.POP
+RESULT = StepType.RESULT
+# 취소 여부를 확인하는 단계 간격 (2의 거듭제곱 - 1)
+CANCEL_CHECK_MASK = 0xFFF
+
+@dataclass
+class RunReport:
+    """헤드리스 실행 결과 요약"""
+    name: str
+    steps: int
+    nodes: int
+    max_depth: int
+    elapsed: float
+    result: Any = None
+    cache_stats: Optional[Dict[str, int]] = None
+    cancelled: bool = False
+
+    @property
+    def steps_per_sec(self) -> float:
+        return self.steps / self.elapsed if self.elapsed > 0 else float('inf')
+
+    def format(self) -> str:
+        """사람이 읽을 수 있는 형태로 요약"""
+        lines = [
+            f"시뮬레이션: {self.name}",
+            f"단계 수: {self.steps}",
+            f"노드 수: {self.nodes}",
+            f"최대 깊이: {self.max_depth}",
+            f"결과: {preview(self.result)}",
+            f"소요 시간: {self.elapsed:.3f}초 ({self.steps_per_sec:,.0f} 단계/초)",
+        ]
+        if self.cache_stats is not None:
+            stats = self.cache_stats
+            lines.append(
+                f"트레이스 캐시: 히트 {stats['hits']}, 미스 {stats['misses']}, "
+                f"제거 {stats['evictions']}, 항목 {stats['entries']}"
+            )
+        return "\n".join(lines)
+
+class HeadlessRunner:
+    """Qt 없이 시뮬레이션 제너레이터를 최대 속도로 소비하는 실행기
+
+    다른 스레드에서 cancel()을 부르면 몇천 단계 안에 실행을 멈춘다.
+    """
+
+    def __init__(self, call_tree_manager: Optional[CallTreeManager] = None,
+                 trace: Optional[TextIO] = None,
+                 trace_cache: Optional[TraceCache] = None):
+        self.call_tree_manager = call_tree_manager
+        self.trace = trace
+        self.trace_cache = trace_cache
+        self.logger = Logger()
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        """실행 중인 run()을 중단 (어느 스레드에서든 호출 가능)"""
+        self._cancelled.set()
+
+    def run(self, steps: Generator[SimulationStep, None, Any], name: str = "") -> RunReport:
+        """제너레이터를 끝까지 실행하고 통계를 반환"""
+        if self.trace_cache is None:
+            return self._run(steps, name)
+        with self.trace_cache.activate():
+            report = self._run(steps, name)
+        self.trace_cache.log_status()
+        report.cache_stats = self.trace_cache.stats()
+        return report
+
+    def _run(self, steps: Generator[SimulationStep, None, Any], name: str) -> RunReport:
+        manager = self.call_tree_manager
+        trace = self.trace
+        step_count = 0
+        node_count = 0
+        depth = 0
+        max_depth = 0
+        last_result = None
+        result = None
+        cancelled = False
+
+        start_time = time.perf_counter()
+        try:
+            while True:
+                if not step_count & CANCEL_CHECK_MASK and self._cancelled.is_set():
+                    steps.close()
+                    cancelled = True
+                    break
+                step = next(steps)
+                step_count += 1
+                kind = step.kind
+                if kind is PUSH:
+                    node_count += 1
+                    depth += 1
+                    if depth > max_depth:
+                        max_depth = depth
+                    if manager is not None:
+                        manager.push(step.function)
+                elif kind is POP:
+                    depth -= 1
+                    if manager is not None:
+                        manager.pop()
+                elif kind is RESULT:
+                    last_result = step.result
+                if trace is not None:
+                    self._write_trace(trace, step)
+        except StopIteration as stop:
+            result = stop.value if stop.value is not None else last_result
+        elapsed = time.perf_counter() - start_time
+
+        report = RunReport(
+            name=name,
+            steps=step_count,
+            nodes=node_count,
+            max_depth=max_depth,
+            elapsed=elapsed,
+            result=result,
+            cancelled=cancelled
+        )
+        self.logger.info(
+            "헤드리스 실행 %s - %s: %d단계, %d노드, %.3f초",
+            "취소" if report.cancelled else "완료", name, step_count, node_count, elapsed
+        )
+        return report
+
+    @staticmethod
+    def _write_trace(trace: TextIO, step: SimulationStep) -> None:
+        """단계를 JSON 한 줄로 기록"""
+        record = step.to_dict()
+        if 'result' in record:
+            record['result'] = HeadlessRunner._json_value(record['result'])
+        trace.write(json.dumps(record, ensure_ascii=False, default=str))
+        trace.write("\n")
+
+    @staticmethod
+    def _json_value(value: Any) -> Any:
+        """문자열로 바꿀 수 없을 만큼 큰 정수만 요약 문자열로 대체 (중첩된 목록의 모든 항목 포함)"""
+        if exceeds_str_limit(value):
+            return preview(value)
+        if isinstance(value, (list, tuple)):
+            return [HeadlessRunner._json_value(item) for item in value]
+        return value
@@ -0,0 +1,223 @@
+from typing import Any, Dict, Generator, List, NamedTuple, Optional
+
+from config.settings import Settings
+from models.call_tree import CallTreeManager, TreeSnapshot
+from models.simulation_step import SimulationStep, StepType
+from utils.logger import Logger
+from .undo_log import UndoLog
+
+PUSH = StepType.PUSH
+POP = StepType.POP
+HIGHLIGHT = StepType.HIGHLIGHT
+ANIMATE = StepType.ANIMATE
+RESULT = StepType.RESULT
+
+class ViewState(NamedTuple):
+    """화면에 표시되는 마지막 강조/메시지/결과 단계"""
+    highlight: Optional[SimulationStep] = None
+    message: Optional[SimulationStep] = None
+    result: Optional[SimulationStep] = None
+
+class Checkpoint(NamedTuple):
+    """position번째 단계까지 적용한 시점의 상태"""
+    position: int
+    tree: TreeSnapshot
+    view: ViewState
+
+class Timeline:
+    """실행한 단계를 기록하고 임의의 위치로 이동할 수 있게 하는 실행기
+
+    단계는 처음 실행될 때만 제너레이터에서 가져와 기록하고, 적용한 단계 수가
+    체크포인트 간격의 배수가 될 때마다 CallTreeManager 스냅샷을 저장한다.
+    이동할 때는 (앞으로든 뒤로든) 목표 이전의 가장 가까운 체크포인트를 복원한 뒤
+    나머지 단계(간격 미만)만 다시 적용한다.
+
+    적용한 단계는 되돌리기 로그에도 기록되어 한 단계 뒤로 가기는 O(1)이고,
+    앞으로 가기는 기록된 단계를 다시 적용할 뿐 제너레이터를 다시 실행하지 않는다.
+    되돌리기 로그와 트리의 배치 쓰기 기록은 체크포인트를 지날 때마다 비우므로
+    그 이전으로 한 단계 뒤로 가면 체크포인트 복원으로 처리한다.
+
+    steps가 None이면 단계를 직접 가져오지 않고 feed/close로 전달받는다
+    (작업 스레드의 StepProducer와 함께 사용).
+    """
+
+    def __init__(self, steps: Optional[Generator[SimulationStep, None, Any]],
+                 call_tree_manager: CallTreeManager,
+                 checkpoint_interval: Optional[int] = None,
+                 undo_limit: Optional[int] = None,
+                 expected_steps: int = 0):
+        self.logger = Logger()
+        self.manager = call_tree_manager
+        self.interval = max(1, checkpoint_interval or Settings.ENGINE.CHECKPOINT_INTERVAL)
+        # 예상 단계 수만큼 미리 할당해 기록 중 재할당을 피한다
+        self.trace: List[Optional[SimulationStep]] = [None] * expected_steps
+        self.expected_steps = expected_steps
+        self._recorded = 0
+        self.position = 0
+        self.view = ViewState()
+        self.finished = False
+        self.result: Any = None
+        self._stats_logged = False
+        self._source = steps
+        self._undo = UndoLog(undo_limit or Settings.ENGINE.UNDO_LOG_LIMIT)
+        call_tree_manager.record_history()
+        self._checkpoints: List[Checkpoint] = [
+            Checkpoint(0, call_tree_manager.snapshot(), self.view)
+        ]
+
+    def __len__(self) -> int:
+        """지금까지 기록된 단계 수"""
+        return self._recorded
+
+    @property
+    def at_end(self) -> bool:
+        """더 이상 진행할 단계가 없는지 여부"""
+        return self.finished and self.position == self._recorded
+
+    def step_forward(self) -> Optional[SimulationStep]:
+        """다음 단계를 적용하고 반환 (끝이면 None)"""
+        if self.position == self._recorded and not self._fetch():
+            if self.finished:
+                self._log_undo_stats()
+            return None
+        step = self.trace[self.position]
+        self._apply(step)
+        return step
+
+    def seek(self, index: int) -> int:
+        """index개의 단계를 적용한 상태로 이동하고 실제 위치를 반환"""
+        if index < 0:
+            index = 0
+        while index > self._recorded and self._fetch():
+            pass
+        index = min(index, self._recorded)
+
+        if index < self.position:
+            distance = self.position - index
+            if distance <= self.interval and index >= self._undo.base:
+                # 가까운 거리는 되돌리기 로그로 한 단계씩
+                while self.position > index:
+                    self._undo_last()
+            else:
+                self._restore(self._checkpoints[index // self.interval])
+        else:
+            # 앞쪽에 이미 지나간 체크포인트가 있으면 거기서부터 (트리는 앞으로도 복원된다)
+            checkpoint = self._checkpoints[min(index // self.interval, len(self._checkpoints) - 1)]
+            if checkpoint.position > self.position:
+                self._restore(checkpoint)
+
+        trace = self.trace
+        while self.position < index:
+            self._apply(trace[self.position])
+        return self.position
+
+    def _restore(self, checkpoint: Checkpoint) -> None:
+        self.manager.restore(checkpoint.tree)
+        self.view = checkpoint.view
+        self.position = checkpoint.position
+        self._undo.clear(self.position)
+
+    def step_back(self) -> Optional[SimulationStep]:
+        """마지막으로 적용한 단계를 되돌리고 반환 (처음이면 None)"""
+        if self.position == 0:
+            return None
+        if self._undo.end != self.position or not self._undo:
+            # 로그 범위를 벗어나면 체크포인트에서 복원
+            self.seek(self.position - 1)
+            return self.trace[self.position]
+        self._undo_last()
+        return self.trace[self.position]
+
+    def undo_stats(self) -> Dict[str, float]:
+        """되돌리기 로그의 메모리 사용량"""
+        return self._undo.stats()
+
+    def _undo_last(self) -> None:
+        undo = self._undo
+        op = undo.pop()
+        if op >= 0:
+            self.manager.undo_pop(op)
+        elif op == UndoLog.PUSH:
+            self.manager.undo_push()
+        elif op == UndoLog.HIGHLIGHT:
+            message = undo.pop_value()
+            self.view = self.view._replace(highlight=undo.pop_value(), message=message)
+        elif op == UndoLog.MESSAGE:
+            self.view = self.view._replace(message=undo.pop_value())
+        elif op == UndoLog.RESULT:
+            self.view = self.view._replace(result=undo.pop_value())
+        self.position -= 1
+
+    def feed(self, steps: List[SimulationStep]) -> None:
+        """외부에서 가져온 단계를 기록에 추가"""
+        for step in steps:
+            self._record(step)
+
+    def close(self, result: Any = None) -> None:
+        """더 이상 단계가 없음을 표시"""
+        if self.finished:
+            return
+        self.finished = True
+        self.result = result
+        del self.trace[self._recorded:]
+        self.logger.info("타임라인 기록 완료: %d단계", self._recorded)
+
+    def _log_undo_stats(self) -> None:
+        """재생이 끝에 도달했을 때 되돌리기 로그 사용량을 한 번만 기록"""
+        if self._stats_logged:
+            return
+        self._stats_logged = True
+        stats = self._undo.stats()
+        self.logger.info(
+            "되돌리기 로그 %d단계, %d바이트 (단계당 %.1f바이트)",
+            stats['entries'], stats['bytes'], stats['bytes_per_step']
+        )
+
+    def _fetch(self) -> bool:
+        """제너레이터에서 단계 하나를 가져와 기록"""
+        if self.finished or self._source is None:
+            return False
+        try:
+            step = next(self._source)
+        except StopIteration as stop:
+            self.close(stop.value)
+            return False
+        self._record(step)
+        return True
+
+    def _record(self, step: SimulationStep) -> None:
+        if self._recorded < len(self.trace):
+            self.trace[self._recorded] = step
+        else:
+            self.trace.append(step)
+        self._recorded += 1
+
+    def _apply(self, step: SimulationStep) -> None:
+        """단계 하나를 트리와 화면 상태에 반영"""
+        kind = step.kind
+        undo = self._undo
+        view = self.view
+        if kind is PUSH:
+            self.manager.push(step.function)
+            undo.record_push()
+        elif kind is POP:
+            undo.record_pop(self.manager.pop())
+        elif kind is HIGHLIGHT:
+            undo.record_highlight(view.highlight, view.message)
+            self.view = view._replace(highlight=step, message=step)
+        elif kind is ANIMATE:
+            undo.record_message(view.message)
+            self.view = view._replace(message=step)
+        elif kind is RESULT:
+            undo.record_result(view.result)
+            self.view = view._replace(result=step)
+
+        self.position += 1
+        if self.position % self.interval == 0:
+            # 체크포인트 이전으로는 복원해서 가므로 되돌리기 기록은 여기서부터 다시 쌓는다
+            self.manager.clear_history()
+            undo.clear(self.position)
+            if self.position // self.interval == len(self._checkpoints):
+                self._checkpoints.append(
+                    Checkpoint(self.position, self.manager.snapshot(), self.view)
+                )
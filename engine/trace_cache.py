@@ -0,0 +1,118 @@
+import functools
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Generator, Hashable, Iterator, Optional, Tuple
+
+from config.settings import Settings
+from models.simulation_step import SimulationStep
+from utils.logger import Logger
+from .driver import RecordedCall
+
+TraceEntry = Tuple[Tuple[SimulationStep, ...], Any]
+
+class TraceCache:
+    """순수한 재귀 호출의 단계 시퀀스를 기록해 두었다가 재생하는 LRU 캐시
+
+    같은 (시뮬레이션, 인자) 호출은 항상 같은 단계를 만들므로, 처음 실행할 때
+    단계들을 기록하고 이후 호출에서는 제너레이터를 다시 돌리지 않고 기록을
+    그대로 이어 붙인다. @cached_trace로 표시한 run 함수만 대상이 되며,
+    activate()로 설치된 동안에만 동작한다.
+    """
+    active: Optional['TraceCache'] = None
+
+    def __init__(self,
+                 max_entries: int = Settings.CACHE.TRACE_CACHE_MAX_ENTRIES,
+                 max_steps: int = Settings.CACHE.TRACE_CACHE_MAX_STEPS,
+                 max_entry_steps: int = Settings.CACHE.TRACE_CACHE_MAX_ENTRY_STEPS):
+        self.max_entries = max_entries
+        self.max_steps = max_steps
+        self.max_entry_steps = min(max_entry_steps, max_steps)
+        self._entries: 'OrderedDict[Hashable, TraceEntry]' = OrderedDict()
+        self.total_steps = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.logger = Logger()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @contextmanager
+    def activate(self) -> Iterator['TraceCache']:
+        """이 캐시를 현재 실행에 설치"""
+        previous = TraceCache.active
+        TraceCache.active = self
+        try:
+            yield self
+        finally:
+            TraceCache.active = previous
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.total_steps = 0
+
+    def call(self, run: Callable[..., Generator], args: Tuple) -> Generator:
+        """캐시를 거쳐 run(*args)의 단계 제너레이터를 반환"""
+        key = (run.__qualname__, args)
+        try:
+            entry = self._entries.get(key)
+        except TypeError:
+            # 리스트 등 해시할 수 없는 인자는 캐시하지 않는다
+            return run(*args)
+
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self.logger.log_cache_status(True, len(self._entries), self.hits, self.misses)
+            return self._replay(*entry)
+
+        self.misses += 1
+        self.logger.log_cache_status(False, len(self._entries), self.hits, self.misses)
+        return self._record(key, run(*args))
+
+    @staticmethod
+    def _replay(steps: Tuple[SimulationStep, ...], value: Any) -> Generator[SimulationStep, None, Any]:
+        yield from steps
+        return value
+
+    def _record(self, key: Hashable, call: Generator) -> Generator[Any, Any, Any]:
+        # 드라이버가 하위 호출을 실행하며 단계를 모아 준다.
+        # 너무 큰 서브트리는 드라이버가 기록을 포기하고 steps로 None을 보낸다.
+        value, steps = yield RecordedCall(call, self.max_entry_steps)
+        if steps is not None:
+            self._store(key, steps, value)
+        return value
+
+    def _store(self, key: Hashable, steps: Tuple[SimulationStep, ...], value: Any) -> None:
+        self._entries[key] = (steps, value)
+        self.total_steps += len(steps)
+        while self._entries and (len(self._entries) > self.max_entries
+                                 or self.total_steps > self.max_steps):
+            _, (evicted, _) = self._entries.popitem(last=False)
+            self.total_steps -= len(evicted)
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'steps': self.total_steps,
+        }
+
+    def log_status(self) -> None:
+        """누적 히트/미스 통계를 로그로 남김"""
+        self.logger.log_cache_status(
+            self.hits > 0, len(self._entries), self.hits, self.misses
+        )
+
+def cached_trace(run: Callable[..., Generator]) -> Callable[..., Generator]:
+    """순수한 시뮬레이션 run 함수를 TraceCache 대상으로 표시하는 데코레이터"""
+    @functools.wraps(run)
+    def wrapper(*args):
+        cache = TraceCache.active
+        if cache is None:
+            return run(*args)
+        return cache.call(run, args)
+    return wrapper
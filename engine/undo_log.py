@@ -0,0 +1,97 @@
+import sys
+from array import array
+from typing import Any, Dict, List
+
+class UndoLog:
+    """적용한 단계를 되돌리기 위한 압축 로그
+
+    단계마다 8바이트 정수 하나를 기록한다.
+    - PUSH: 마지막으로 추가된 노드를 제거하면 된다
+    - HIGHLIGHT/MESSAGE/RESULT: 덮어쓴 이전 값(단계 참조)을 값 목록에서 꺼내 복원한다
+    - 0 이상: pop으로 닫힌 노드 id
+    항목 수가 limit을 넘으면 오래된 절반을 버리므로 메모리는 limit에 비례해 제한된다.
+    """
+    PUSH = -1
+    HIGHLIGHT = -2  # 이전 강조, 이전 메시지 (값 2개)
+    MESSAGE = -3    # 이전 메시지
+    RESULT = -4     # 이전 결과
+
+    def __init__(self, limit: int):
+        self.limit = max(2, limit)
+        self.base = 0  # 첫 항목이 되돌리는 단계의 위치
+        self.dropped = 0
+        self._ops = array('q')
+        self._values: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self._ops)
+
+    @property
+    def end(self) -> int:
+        """마지막 항목 다음의 단계 위치"""
+        return self.base + len(self._ops)
+
+    def record_push(self) -> None:
+        self._ops.append(self.PUSH)
+        self._trim()
+
+    def record_pop(self, call_id: int) -> None:
+        self._ops.append(call_id)
+        self._trim()
+
+    def record_highlight(self, previous_highlight: Any, previous_message: Any) -> None:
+        self._ops.append(self.HIGHLIGHT)
+        self._values.append(previous_highlight)
+        self._values.append(previous_message)
+        self._trim()
+
+    def record_message(self, previous_message: Any) -> None:
+        self._ops.append(self.MESSAGE)
+        self._values.append(previous_message)
+        self._trim()
+
+    def record_result(self, previous_result: Any) -> None:
+        self._ops.append(self.RESULT)
+        self._values.append(previous_result)
+        self._trim()
+
+    def pop(self) -> int:
+        """마지막 항목의 종류(또는 노드 id)를 꺼냄"""
+        return self._ops.pop()
+
+    def pop_value(self) -> Any:
+        """마지막으로 기록된 이전 값을 꺼냄"""
+        return self._values.pop()
+
+    def clear(self, position: int = 0) -> None:
+        self.base = position
+        del self._ops[:]
+        self._values.clear()
+
+    def _trim(self) -> None:
+        """limit을 넘으면 오래된 절반을 버림 (분할 상환 O(1))"""
+        if len(self._ops) <= self.limit:
+            return
+        half = len(self._ops) // 2
+        del self._values[:self._value_count(self._ops[:half])]
+        del self._ops[:half]
+        self.base += half
+        self.dropped += half
+
+    def _value_count(self, ops: array) -> int:
+        return 2 * ops.count(self.HIGHLIGHT) + ops.count(self.MESSAGE) + ops.count(self.RESULT)
+
+    def stats(self) -> Dict[str, float]:
+        """로그가 차지하는 메모리 측정 (바이트)
+
+        이전 값은 기록된 단계 객체에 대한 참조이므로 포인터 크기만 센다.
+        array와 list의 크기에는 할당된 버퍼가 포함된다.
+        """
+        total = sys.getsizeof(self._ops) + sys.getsizeof(self._values)
+        entries = len(self._ops)
+        return {
+            'entries': entries,
+            'dropped': self.dropped,
+            'bytes': total,
+            'bytes_per_step': total / entries if entries else 0.0,
+        }
@@ -1,73 +1,283 @@
-from typing import Dict, Optional, List, Set
-from dataclasses import dataclass
+from array import array
+from collections.abc import Mapping
+from typing import Dict, Iterator, Optional, List, Set, NamedTuple, Tuple
 import math
 import time
 from config.settings import Settings
 from utils.logger import Logger
+from utils.metrics import Metrics
 from utils.exceptions import LayoutError
+from models.tree_layout import LayoutSnapshot, TidyTreeLayout
+
+try:
+    import numpy as np
+except ImportError:  # NumPy가 없으면 노드별 파이썬 반복으로 처리
+    np = None
+
+# 부모/자식/형제가 없음을 나타내는 id
+NO_NODE = -1
 
-@dataclass
 class Node:
-    """함수 호출 트리의 노드를 표현하는 클래스"""
-    id: int
-    function: str
-    parent: Optional[int]
-    children: List[int]
-    depth: int
-    done: bool
-    x: float = 0.0
-    y: float = 0.0
-    target_x: float = 0.0
-    
+    """CallTreeManager의 열(column)에 저장된 노드 하나를 가리키는 가벼운 뷰
+
+    값을 복사해 두지 않으므로 속성을 읽고 쓰면 곧바로 트리의 배열에 반영된다.
+    """
+    __slots__ = ('_tree', 'id')
+
+    def __init__(self, tree: 'CallTreeManager', node_id: int):
+        self._tree = tree
+        self.id = node_id
+
+    @property
+    def function(self) -> str:
+        return self._tree.label(self.id)
+
+    @property
+    def parent(self) -> Optional[int]:
+        parent_id = self._tree.parents[self.id]
+        return None if parent_id == NO_NODE else parent_id
+
+    @property
+    def children(self) -> List[int]:
+        return list(self._tree.iter_children(self.id))
+
+    @property
+    def depth(self) -> int:
+        return self._tree.depths[self.id]
+
+    @property
+    def done(self) -> bool:
+        return bool(self._tree.done_flags[self.id])
+
+    @done.setter
+    def done(self, value: bool) -> None:
+        self._tree.done_flags[self.id] = 1 if value else 0
+
+    @property
+    def x(self) -> float:
+        return self._tree.xs[self.id]
+
+    @x.setter
+    def x(self, value: float) -> None:
+        self._tree.xs[self.id] = value
+
+    @property
+    def y(self) -> float:
+        return self._tree.ys[self.id]
+
+    @y.setter
+    def y(self, value: float) -> None:
+        self._tree.ys[self.id] = value
+
+    @property
+    def target_x(self) -> float:
+        return self._tree.target_xs[self.id]
+
+    @target_x.setter
+    def target_x(self, value: float) -> None:
+        self._tree.target_xs[self.id] = value
+
+    @property
+    def alpha(self) -> float:
+        return self._tree.alphas[self.id]
+
     def is_position_changed(self, threshold: float = 1.0) -> bool:
         """노드의 위치가 유의미하게 변경되었는지 확인"""
         return abs(self.x - self.target_x) > threshold
 
+    def __repr__(self) -> str:
+        return f"Node(id={self.id}, function={self.function!r}, depth={self.depth}, done={self.done})"
+
+class NodeTable(Mapping):
+    """노드 id → Node 뷰 매핑 (id는 0부터 호출 순서대로 연속)"""
+    __slots__ = ('_tree',)
+
+    def __init__(self, tree: 'CallTreeManager'):
+        self._tree = tree
+
+    def __getitem__(self, node_id: int) -> Node:
+        if type(node_id) is not int or not 0 <= node_id < self._tree.call_id_counter:
+            raise KeyError(node_id)
+        return Node(self._tree, node_id)
+
+    def __contains__(self, node_id: object) -> bool:
+        return type(node_id) is int and 0 <= node_id < self._tree.call_id_counter
+
+    def __len__(self) -> int:
+        return self._tree.call_id_counter
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self._tree.call_id_counter))
+
+class TreeSnapshot(NamedTuple):
+    """CallTreeManager 상태의 압축 스냅샷
+
+    노드는 호출 순서대로 추가만 되고, 스택은 항상 맨 위 노드의 조상 경로이므로
+    노드 개수와 스택 맨 위 노드만으로 전체 상태(노드, 스택, 완료 여부)를 복원할 수 있다.
+    배치 상태는 이후의 pop이 바꿀 수 있는 노드들의 값만 저장한다.
+    """
+    node_count: int
+    top: Optional[int]
+    layout: LayoutSnapshot
+
+class TreeFrontier(NamedTuple):
+    """가장 멀리 진행했던 시점의 열 복사본 (그 이전 시점은 앞부분만 고쳐 복원한다)"""
+    node_count: int
+    stack_depth: int
+    columns: Dict[str, array]
+    layout: Tuple[array, ...]
+
 class CallTreeManager:
+    """함수 호출 트리
+
+    노드는 객체 대신 id로 색인되는 병렬 배열(열)에 저장한다.
+    - parents, depths, done_flags, label_ids: 구조와 상태
+    - last_child, prev_sibling: 자식 목록 연결 (호출 순서)
+    - xs, ys, target_xs, alphas: 화면 좌표와 불투명도 (float32, 목표 y는 깊이로 정해진다)
+    함수 이름은 labels 표에 한 번만 저장하고 label_ids로 참조한다.
+    nodes는 기존 코드와 호환되는 id → Node 뷰 매핑이다.
+
+    레이아웃에 필요한 색인도 push/pop 때 함께 갱신한다.
+    - level_count: 트리의 깊이 수 (가장 깊은 노드의 깊이 + 1)
+    - sibling_index: 형제 사이의 순서
+    - subtree_ends: 끝난 노드의 서브트리 다음 id (노드는 전위 순서이므로 서브트리는 연속 구간)
+    - layout: 정돈 트리 배치 상태 (끝난 서브트리는 pop 때 한 번만 배치)
+    노드가 전위 순서이므로 첫 자식은 node_id + 1, 끝난 자식의 다음 형제는 그
+    서브트리 끝이고 자식 수는 마지막 자식의 sibling_index + 1이다.
+
+    배치 한 번(update_layout)의 비용은 전체 노드 수에 비례한다. 한 번의 pop이
+    형제 서브트리 전체를 옮기고 트리 폭이 바뀌면 모든 노드의 화면 좌표가 바뀌므로,
+    바뀐 노드만 다시 계산하지 않고 두 번째 순회와 목표 위치 갱신을 (NumPy가 있으면
+    배열 연산으로) 모든 노드에 대해 한다.
+    """
+    COLUMN_NAMES = (
+        'parents', 'depths', 'done_flags', 'label_ids',
+        'last_child', 'prev_sibling', 'sibling_index', 'subtree_ends',
+        'xs', 'ys', 'target_xs', 'alphas',
+    )
+    # 이후 시점에 따라 값이 바뀌는 열 (나머지는 노드가 추가될 때 정해진다)
+    STACK_COLUMN_NAMES = (
+        'done_flags', 'last_child', 'subtree_ends',
+    )
+
     def __init__(self):
         self.call_id_counter = 0
         self.stack: List[int] = []
-        self.nodes: Dict[int, Node] = {}
-        self.modified_nodes: Set[int] = set()
-        self._layout_cache: Dict[int, Dict[str, float]] = {}
-        self._cache_invalidated = False
+        self.parents = array('i')
+        self.depths = array('i')
+        self.done_flags = array('B')
+        self.label_ids = array('i')
+        self.last_child = array('i')
+        self.prev_sibling = array('i')
+        self.sibling_index = array('i')
+        self.subtree_ends = array('i')
+        self.xs = array('f')
+        self.ys = array('f')
+        self.target_xs = array('f')
+        self.alphas = array('f')
+        self._columns = tuple(getattr(self, name) for name in self.COLUMN_NAMES)
+        self.level_count = 0
+        self.labels: List[str] = []
+        self._label_index: Dict[str, int] = {}
+        self.nodes = NodeTable(self)
+        self.layout = TidyTreeLayout(self)
+        # 마지막 배치 이후 구조가 바뀐 횟수 (0이 아니면 다시 배치해야 한다)
+        self.pending_changes = 0
+        # 목표 위치/불투명도에 아직 도달하지 않은 노드 (NumPy가 없을 때만 사용)
+        self._moving: Set[int] = set()
+        self._settling = False
+        self._layout_area: Tuple[float, float] = (0.0, 0.0)
+        self._layout_dirty = False
         self._last_update = 0.0
+        # 마지막 배치의 형제 노드 간격 (픽셀, 화면에서 세부 표현 수준을 정할 때 사용)
+        self.node_spacing: float = Settings.UI.MIN_NODE_DISTANCE
+        # 마지막 배치의 층 간격 (픽셀, 멈춰 있을 때 간선의 세로 길이)
+        self.level_spacing: float = Settings.UI.VERTICAL_SPACING
+        # 마지막 배치의 위쪽 여백 (깊이 d인 노드의 목표 y는 여백 + d * level_spacing)
+        self._margin_y: float = Settings.UI.NODE_RADIUS * 2
+        # 뒤로 이동한 동안 보관하는 가장 멀리 진행했던 상태 (그 상태를 넘어서면 버린다)
+        self._frontier: Optional[TreeFrontier] = None
         self.logger = Logger()
 
-    def invalidate_cache(self):
-        """레이아웃 캐시 무효화"""
-        self._layout_cache.clear()
-        self._cache_invalidated = True
+    @property
+    def needs_layout(self) -> bool:
+        """목표 위치를 다시 계산해야 하는지"""
+        return bool(self.pending_changes or self._layout_dirty)
+
+    @property
+    def animating(self) -> bool:
+        """목표 위치나 불투명도에 아직 도달하지 않은 노드가 있는지"""
+        return self._settling
+
+    def label(self, node_id: int) -> str:
+        """노드의 함수 이름"""
+        return self.labels[self.label_ids[node_id]]
+
+    def iter_children(self, node_id: int) -> Iterator[int]:
+        """자식 노드 id를 호출 순서대로 순회"""
+        last = self.last_child[node_id]
+        if last == NO_NODE:
+            return
+        subtree_ends = self.subtree_ends
+        child = node_id + 1
+        while child != last:
+            yield child
+            # 마지막이 아닌 자식은 끝났으므로 다음 형제는 그 서브트리 바로 뒤
+            child = subtree_ends[child]
+        yield last
+
+    def _intern(self, function_name: str) -> int:
+        label_id = self._label_index.get(function_name)
+        if label_id is None:
+            label_id = len(self.labels)
+            self.labels.append(function_name)
+            self._label_index[function_name] = label_id
+        return label_id
 
     def push(self, function_name: str) -> int:
         """새로운 함수 호출을 트리에 추가"""
         try:
-            self.invalidate_cache()
-            parent_id = self.stack[-1] if self.stack else None
-            depth = self.nodes[parent_id].depth + 1 if parent_id is not None else 0
+            parent_id = self.stack[-1] if self.stack else NO_NODE
+            depth = self.depths[parent_id] + 1 if parent_id != NO_NODE else 0
 
             call_id = self.call_id_counter
+            if self._frontier is not None and call_id >= self._frontier.node_count:
+                self._drop_frontier()
             self.call_id_counter += 1
 
-            node = Node(
-                id=call_id,
-                function=function_name,
-                parent=parent_id,
-                children=[],
-                depth=depth,
-                done=False
-            )
-            
-            self.nodes[call_id] = node
-            if parent_id is not None:
-                self.nodes[parent_id].children.append(call_id)
-                self.modified_nodes.add(parent_id)
-            
-            self.modified_nodes.add(call_id)
+            previous = NO_NODE
+            sibling_index = 0
+            if parent_id != NO_NODE:
+                previous = self.last_child[parent_id]
+                if previous != NO_NODE:
+                    sibling_index = self.sibling_index[previous] + 1
+                self.last_child[parent_id] = call_id
+
+            if depth == self.level_count:
+                self.level_count += 1
+
+            self.parents.append(parent_id)
+            self.depths.append(depth)
+            self.done_flags.append(0)
+            self.label_ids.append(self._intern(function_name))
+            self.last_child.append(NO_NODE)
+            self.prev_sibling.append(previous)
+            self.sibling_index.append(sibling_index)
+            self.subtree_ends.append(call_id + 1)
+            # 새 노드는 부모 위치에서 출발한다
+            x = self.xs[parent_id] if parent_id != NO_NODE else 0.0
+            y = self.ys[parent_id] if parent_id != NO_NODE else 0.0
+            self.xs.append(x)
+            self.ys.append(y)
+            self.target_xs.append(x)
+            self.alphas.append(0.0)  # 새 노드는 서서히 나타난다
+            self.layout.push(call_id)
+
+            self.pending_changes += 1
             self.stack.append(call_id)
             return call_id
         except Exception as e:
-            self.logger.error(f"함수 호출 추가 실패: {str(e)}")
+            self.logger.error("함수 호출 추가 실패: %s", e)
             raise
 
     def pop(self) -> Optional[int]:
@@ -76,156 +286,339 @@ class CallTreeManager:
             return None
             
         call_id = self.stack.pop()
-        node = self.nodes[call_id]
-        node.done = True
-        self.modified_nodes.add(call_id)
-        
-        if node.parent is not None:
-            self.modified_nodes.add(node.parent)
-        
+        frontier = self._frontier
+        if frontier is not None and self.call_id_counter == frontier.node_count and \
+                len(self.stack) < frontier.stack_depth:
+            self._drop_frontier()
+        self.done_flags[call_id] = 1
+        self.subtree_ends[call_id] = self.call_id_counter
+        self.layout.pop(call_id)
+        self.pending_changes += 1
         return call_id
 
-    def _calculate_subtree_width(self, node_id: int, level_widths: Dict[int, float]) -> float:
-        """서브트리의 너비를 계산"""
-        node = self.nodes[node_id]
-        if not node.children:
-            level_widths[node.depth] = max(
-                level_widths.get(node.depth, 0),
-                self.min_node_distance
-            )
-            return self.min_node_distance
+    def undo_push(self) -> int:
+        """마지막 push를 되돌림 (O(1))"""
+        self._save_frontier()
+        call_id = self.stack.pop()
+        self._truncate(call_id)
+        return call_id
 
-        children_width = sum(
-            self._calculate_subtree_width(child_id, level_widths)
-            for child_id in node.children
+    def undo_pop(self, call_id: int) -> None:
+        """call_id 노드의 pop을 되돌림 (배치 상태도 pop 이전으로)"""
+        self._save_frontier()
+        self.layout.undo_pop(call_id)
+        self.done_flags[call_id] = 0
+        self.stack.append(call_id)
+        self.pending_changes += 1
+
+    def snapshot(self) -> TreeSnapshot:
+        """현재 상태의 스냅샷 (스택 위 노드와 그 자식들의 윤곽선 길이에 비례)"""
+        return TreeSnapshot(
+            self.call_id_counter, self.stack[-1] if self.stack else None,
+            self.layout.snapshot(self.stack)
         )
-        width = max(self.min_node_distance, children_width)
-        level_widths[node.depth] = max(
-            level_widths.get(node.depth, 0),
-            width
-        )
-        return width
-
-    def _optimize_subtree_positions(self, node_id: int, level_widths: Dict[int, float]) -> float:
-        """서브트리의 위치를 최적화"""
-        node = self.nodes[node_id]
-        if not node.children:
-            return node.x
-
-        # 자식 노드들의 평균 x 좌표 계산
-        children_x = [self._optimize_subtree_positions(child_id, level_widths) 
-                     for child_id in node.children]
-        avg_x = sum(children_x) / len(children_x)
-        
-        # 부모 노드를 자식들의 중앙으로 이동
-        if node.id in self.modified_nodes:
-            node.target_x = avg_x
-            if abs(node.x - avg_x) < 1:
-                node.x = avg_x
-            else:
-                node.x += (avg_x - node.x) * 0.1
 
-        return node.x
+    def record_history(self) -> None:
+        """undo_pop에 필요한 배치 쓰기 기록을 켬 (Timeline이 켠다)"""
+        self.layout.recording = True
+
+    def clear_history(self) -> None:
+        """배치 쓰기 기록을 비움 (이전 시점으로는 restore로만 돌아갈 수 있다)"""
+        self.layout.clear_journal()
+
+    def restore(self, snapshot: TreeSnapshot) -> None:
+        """같은 실행의 다른 시점 스냅샷으로 이동 (앞으로도 뒤로도)
+
+        처음 뒤로 이동할 때 가장 멀리 진행했던 상태(frontier)의 열을 복사해 둔다.
+        그보다 이전 시점의 트리는 frontier 열의 앞부분에서 그 시점 스택 위 노드들의
+        자식 연결과 완료 여부만 고친 것이므로, 비용은 스택 깊이와 추가/제거되는 노드 수
+        (열 복사)에 비례하고 그 사이의 단계를 다시 적용하지 않는다. 배치 상태도
+        frontier 열의 앞부분에 스냅샷 값을 덮어써 복원하며, 배치 쓰기 기록은 비운다.
+        """
+        frontier = self._save_frontier()
+        node_count = snapshot.node_count
+        if node_count > frontier.node_count:
+            raise ValueError("아직 진행하지 않은 시점의 스냅샷으로는 복원할 수 없습니다")
+        current = self.call_id_counter
+        saved = frontier.columns
+
+        # 현재 스택 때문에 frontier와 달라진 값을 되돌린다 (pop 위치도 pop할 때 정해진다)
+        self._restore_stack_columns(saved)
+        self.layout.restore(node_count, frontier.layout, snapshot.layout)
+        if node_count < current:
+            self._moving = self._without_removed(self._moving, node_count)
+
+        for name, column in zip(self.COLUMN_NAMES, self._columns):
+            if node_count < current:
+                del column[node_count:]
+            else:
+                column.extend(saved[name][current:node_count])
+        self.call_id_counter = node_count
+        if node_count < current:
+            self.level_count = self._deepest_level() + 1
+        elif node_count > current:
+            self.level_count = max(self.level_count, max(self.depths[current:]) + 1)
+
+        # 스택은 맨 위 노드의 조상 경로
+        stack = []
+        node_id = NO_NODE if snapshot.top is None else snapshot.top
+        while node_id != NO_NODE:
+            stack.append(node_id)
+            node_id = self.parents[node_id]
+        stack.reverse()
+        self.stack = stack
+        self._cut_stack_columns()
+        self.pending_changes += 1
+        self._layout_dirty = True
+
+    def _save_frontier(self) -> TreeFrontier:
+        """뒤로 이동하기 전에 현재(가장 멀리 진행한) 상태를 복사해 둠"""
+        if self._frontier is None:
+            self._frontier = TreeFrontier(
+                self.call_id_counter,
+                len(self.stack),
+                {name: column[:] for name, column in zip(self.COLUMN_NAMES, self._columns)},
+                self.layout.copy_columns()
+            )
+        return self._frontier
+
+    def _drop_frontier(self) -> None:
+        """frontier를 넘어 진행하면 현재 상태가 새 frontier가 된다"""
+        self._frontier = None
+
+    def _restore_stack_columns(self, saved: Dict[str, array]) -> None:
+        """스택 위 노드의 값을 frontier 값으로 (나머지 노드는 이미 같다)"""
+        for name in self.STACK_COLUMN_NAMES:
+            column = getattr(self, name)
+            source = saved[name]
+            for node_id in self.stack:
+                column[node_id] = source[node_id]
+
+    def _cut_stack_columns(self) -> None:
+        """frontier 값을 현재 노드 수 시점으로 자름
+
+        진행 중인 호출만 아직 추가되지 않은 자식을 가질 수 있으므로 스택 위 노드의
+        마지막 자식과 완료 여부만 고치면 된다.
+        """
+        stack = self.stack
+        count = self.call_id_counter
+        parents = self.parents
+        for position, node_id in enumerate(stack):
+            self.done_flags[node_id] = 0
+            if position + 1 < len(stack):
+                last = stack[position + 1]
+            else:
+                # 맨 위 호출의 마지막 자식은 마지막 노드의 조상 중 하나
+                last = count - 1
+                if last == node_id:
+                    last = NO_NODE
+                else:
+                    while parents[last] != node_id:
+                        last = parents[last]
+            self.last_child[node_id] = last
+
+    def _truncate(self, node_count: int) -> None:
+        """node_count 이후에 추가된 노드를 모두 제거"""
+        parents = self.parents
+        deepest = -1
+        # 나중에 추가된 노드부터 떼어낸다 (항상 부모의 마지막 자식이다)
+        for node_id in range(self.call_id_counter - 1, node_count - 1, -1):
+            deepest = max(deepest, self.depths[node_id])
+            parent_id = parents[node_id]
+            if parent_id == NO_NODE or parent_id >= node_count:
+                continue
+            self.last_child[parent_id] = self.prev_sibling[node_id]
+        for column in self._columns:
+            del column[node_count:]
+        self.layout.truncate(node_count)
+        self._moving = self._without_removed(self._moving, node_count)
+        self.call_id_counter = node_count
+        # 가장 깊은 층의 노드를 뗀 경우에만 다시 센다
+        if deepest + 1 == self.level_count:
+            self.level_count = self._deepest_level() + 1
+        self.pending_changes += 1
+
+    def _deepest_level(self) -> int:
+        """가장 깊은 노드의 깊이 (노드가 없으면 -1)"""
+        if not self.call_id_counter:
+            return -1
+        if np is not None:
+            return int(np.frombuffer(self.depths, dtype=np.int32).max())
+        return max(self.depths)
+
+    def _without_removed(self, node_ids: Set[int], node_count: int) -> Set[int]:
+        """node_count 이상의 id를 뺀 집합 (제거된 수와 집합 크기 중 작은 쪽에 비례)"""
+        removed = self.call_id_counter - node_count
+        if removed < len(node_ids):
+            for node_id in range(node_count, self.call_id_counter):
+                node_ids.discard(node_id)
+            return node_ids
+        return {node_id for node_id in node_ids if node_id < node_count}
 
     def update_layout(self, width: int, height: int) -> None:
-        """트리 레이아웃 업데이트"""
+        """구조나 영역이 바뀌었으면 목표 위치를 다시 계산 (이동은 advance에서)"""
+        # 여백 계산
+        margin_x = Settings.UI.NODE_RADIUS * 2
+        margin_y = Settings.UI.NODE_RADIUS * 2
+        available_width = width - 2 * margin_x
+        available_height = height - 2 * margin_y
+
+        if (available_width, available_height) != self._layout_area:
+            # 영역이 바뀌면 모든 노드의 목표 위치를 다시 계산
+            self._layout_area = (available_width, available_height)
+            self._layout_dirty = True
+
         if not self._should_update_layout():
             return
 
         try:
-            start_time = time.time()
-            
-            if not self.nodes:
+            if not self.call_id_counter:
+                self.pending_changes = 0
+                self._layout_dirty = False
                 return
 
-            # 여백 계산
-            margin_x = Settings.UI.NODE_RADIUS * 2
-            margin_y = Settings.UI.NODE_RADIUS * 2
-            available_width = width - 2 * margin_x
-            available_height = height - 2 * margin_y
+            modified_count = self.pending_changes
+            metrics = Metrics()
 
             # 레이아웃 최적화
-            self._optimize_layout(available_width, available_height, margin_x, margin_y)
+            with metrics.timer('layout.ms'):
+                self._optimize_layout(available_width, available_height, margin_x, margin_y)
 
             # 성능 로깅
-            duration = time.time() - start_time
-            self.logger.log_performance("레이아웃 업데이트", duration)
+            metrics.gauge('tree.nodes').set(self.call_id_counter)
+            metrics.gauge('tree.depth').set(self.level_count)
+            self.logger.log_performance("레이아웃 업데이트", metrics.histogram('layout.ms').last / 1000)
             self.logger.log_layout_update(
-                node_count=len(self.nodes),
-                modified_count=len(self.modified_nodes)
+                node_count=self.call_id_counter,
+                modified_count=modified_count
             )
 
-            self.modified_nodes.clear()
-            self._cache_layout()
-            self._cache_invalidated = False
-
         except Exception as e:
-            self.logger.error(f"레이아웃 업데이트 실패: {str(e)}")
+            self.logger.error("레이아웃 업데이트 실패: %s", e)
             self._apply_fallback_layout(width, height)
             raise LayoutError("레이아웃 계산 중 오류 발생")
 
     def _optimize_layout(self, available_width: float, available_height: float,
                         margin_x: float, margin_y: float) -> None:
-        """레이아웃 최적화 수행"""
+        """정돈 트리 배치로 모든 노드의 목표 위치를 계산"""
         try:
-            # 각 레벨별 노드 수 계산
-            level_nodes: Dict[int, List[Node]] = {}
-            for node in self.nodes.values():
-                if node.depth not in level_nodes:
-                    level_nodes[node.depth] = []
-                level_nodes[node.depth].append(node)
-
-            if not level_nodes:  # 노드가 없는 경우
-                return
-
-            # 각 레벨별 간격 계산
-            max_depth = max(level_nodes.keys())
-            vertical_spacing = available_height / (max_depth + 1)
-
-            for depth, nodes in level_nodes.items():
-                # 수평 간격 계산
-                level_width = available_width
-                node_spacing = level_width / (len(nodes) + 1)
-
-                # 노드 위치 업데이트
-                for i, node in enumerate(nodes, 1):
-                    target_x = margin_x + (node_spacing * i)
-                    target_y = margin_y + (depth * vertical_spacing)
-
-                    if node.id in self.modified_nodes:
-                        if abs(node.x - target_x) < 1:
-                            node.x = target_x
-                        else:
-                            node.x += (target_x - node.x) * Settings.UI.ANIMATION_SPEED
-                        node.target_x = target_x
-                        node.y = target_y
-
-            # 부모-자식 관계 최적화
-            self._optimize_parent_child_positions()
+            self.pending_changes = 0
+            self._layout_dirty = False
+            units, span = self.layout.positions(self.stack)
+
+            # 형제 간격은 최소 노드 간격, 다 들어가지 않으면 영역에 맞게 줄인다
+            spacing = Settings.UI.MIN_NODE_DISTANCE
+            if span * spacing > available_width:
+                spacing = available_width / span
+            offset = margin_x + (available_width - span * spacing) / 2
+            vertical_spacing = available_height / self.level_count
+            self.node_spacing = spacing
+            self.level_spacing = vertical_spacing
+            self._margin_y = margin_y
+
+            if np is not None:
+                self._set_targets_vectorized(units, offset, spacing)
+            else:
+                self._set_targets(units, offset, spacing)
 
         except Exception as e:
-            self.logger.error(f"레이아웃 최적화 실패: {str(e)}")
+            self.logger.error("레이아웃 최적화 실패: %s", e)
             raise
 
-    def _optimize_parent_child_positions(self) -> None:
-        """부모-자식 노드 간의 위치 관계 최적화"""
-        for node_id in self.nodes:
-            node = self.nodes[node_id]
-            if node.parent is not None:
-                parent = self.nodes[node.parent]
-                siblings = [self.nodes[c] for c in parent.children]
-                if len(siblings) > 1:
-                    avg_x = sum(s.x for s in siblings) / len(siblings)
-                    if parent.id in self.modified_nodes:
-                        parent.target_x = avg_x
-                        if abs(parent.x - avg_x) < 1:
-                            parent.x = avg_x
-                        else:
-                            parent.x += (avg_x - parent.x) * Settings.UI.ANIMATION_SPEED
+    def _level_ys(self) -> array:
+        """깊이별 목표 y (ys와 같은 float32이므로 그대로 비교할 수 있다)"""
+        return array('f', [self._margin_y + depth * self.level_spacing
+                           for depth in range(self.level_count)])
+
+    def _set_targets(self, units: array, offset: float, spacing: float) -> None:
+        depths = self.depths
+        xs = self.xs
+        ys = self.ys
+        target_xs = self.target_xs
+        level_ys = self._level_ys()
+        alphas = self.alphas
+        moving = self._moving
+        for node_id in range(self.call_id_counter):
+            target_xs[node_id] = offset + units[node_id] * spacing
+            if xs[node_id] != target_xs[node_id] or ys[node_id] != level_ys[depths[node_id]] or \
+                    alphas[node_id] < 1.0:
+                moving.add(node_id)
+        self._settling = bool(moving)
+
+    def _set_targets_vectorized(self, units, offset: float, spacing: float) -> None:
+        # 배열 열의 버퍼를 그대로 쓰는 뷰 (함수가 끝나면 해제되어 열의 크기를 바꿀 수 있다)
+        target_xs = np.frombuffer(self.target_xs, dtype=np.float32)
+        np.multiply(units, spacing, out=units)
+        units += offset
+        target_xs[:] = units
+        self._settling = True
+
+    def advance(self, elapsed: float, fade_duration: float) -> bool:
+        """경과 시간(초)만큼 노드를 목표 위치로 이동하고 불투명도를 높임
+
+        위치는 지수적으로 다가가며 60fps 기준 한 프레임에 남은 거리의
+        ANIMATION_SPEED만큼 이동한다. 프레임 간격이 달라도 같은 시간에 같은 거리를 간다.
+        아직 움직이는 노드가 있으면 True를 반환한다.
+        """
+        if not self._settling or not self.call_id_counter:
+            self._settling = False
+            return False
+        fraction = 1.0 - (1.0 - Settings.UI.ANIMATION_SPEED) ** (elapsed * 60.0)
+        fade = elapsed / fade_duration if fade_duration > 0 else 1.0
+        if np is not None:
+            self._advance_vectorized(fraction, fade)
+        else:
+            self._advance_nodes(fraction, fade)
+        return self._settling
+
+    def _advance_nodes(self, fraction: float, fade: float) -> None:
+        xs = self.xs
+        ys = self.ys
+        target_xs = self.target_xs
+        level_ys = self._level_ys()
+        depths = self.depths
+        alphas = self.alphas
+        settled = []
+        for node_id in self._moving:
+            target_y = level_ys[depths[node_id]]
+            dx = target_xs[node_id] - xs[node_id]
+            dy = target_y - ys[node_id]
+            if abs(dx) < 1 and abs(dy) < 1:
+                xs[node_id] = target_xs[node_id]
+                ys[node_id] = target_y
+            else:
+                xs[node_id] += dx * fraction
+                ys[node_id] += dy * fraction
+            alpha = min(1.0, alphas[node_id] + fade)
+            alphas[node_id] = alpha
+            if alpha >= 1.0 and xs[node_id] == target_xs[node_id] and ys[node_id] == target_y:
+                settled.append(node_id)
+        for node_id in settled:
+            self._moving.discard(node_id)
+        self._settling = bool(self._moving)
+
+    def _advance_vectorized(self, fraction: float, fade: float) -> None:
+        """모든 노드를 한 번의 배열 연산으로 이동"""
+        settled = True
+        target_ys = np.frombuffer(self._level_ys(), dtype=np.float32)[
+            np.frombuffer(self.depths, dtype=np.int32)
+        ]
+        for column, targets in ((self.xs, np.frombuffer(self.target_xs, dtype=np.float32)),
+                                (self.ys, target_ys)):
+            values = np.frombuffer(column, dtype=np.float32)
+            delta = targets - values
+            near = np.abs(delta) < 1
+            delta *= fraction
+            values += delta
+            np.copyto(values, targets, where=near)
+            settled = settled and bool(near.all())
+        alphas = np.frombuffer(self.alphas, dtype=np.float32)
+        np.minimum(alphas + fade, 1.0, out=alphas)
+        self._settling = not (settled and bool((alphas >= 1.0).all()))
 
     def _should_update_layout(self) -> bool:
         """레이아웃 업데이트가 필요한지 확인"""
-        if not self.modified_nodes:
+        if not self.needs_layout:
             return False
         
         current_time = time.time()
@@ -238,47 +631,11 @@ class CallTreeManager:
     def _apply_fallback_layout(self, width: int, height: int) -> None:
         """레이아웃 실패 시 기본 레이아웃 적용"""
         margin = Settings.UI.NODE_RADIUS * 2
-        for node in self.nodes.values():
-            node.x = width / 2
-            node.y = margin + node.depth * Settings.UI.VERTICAL_SPACING
-
-    def _balance_subtree(self, node_id: int) -> None:
-        """서브트리의 균형을 맞춤"""
-        node = self.nodes[node_id]
-        if not node.children:
-            return
-
-        # 자식 노드들의 위치를 재조정
-        children = [self.nodes[child_id] for child_id in node.children]
-        total_width = sum(self._calculate_subtree_width(c.id, {}) for c in children)
-        current_x = node.x - total_width / 2
-
-        for child in children:
-            child_width = self._calculate_subtree_width(child.id, {})
-            target_x = current_x + child_width / 2
-            child.target_x = target_x
-            current_x += child_width
-            self._balance_subtree(child.id)
-
-    def _optimize_layout(self) -> None:
-        """전체 트리 레이아웃 최적화"""
-        root_nodes = [nid for nid, node in self.nodes.items() if node.parent is None]
-        for root_id in root_nodes:
-            self._balance_subtree(root_id)
-
-    def _cache_layout(self) -> None:
-        """현재 레이아웃을 캐시에 저장"""
-        for node_id, node in self.nodes.items():
-            self._layout_cache[node_id] = {
-                'x': node.x,
-                'y': node.y,
-                'target_x': node.target_x
-            } 
-
-    def _restore_from_cache(self) -> None:
-        """캐시된 레이아웃을 복원"""
-        for node_id, node in self.nodes.items():
-            if node_id in self._layout_cache:
-                node.x = self._layout_cache[node_id]['x']
-                node.y = self._layout_cache[node_id]['y']
-                node.target_x = self._layout_cache[node_id]['target_x'] 
\ No newline at end of file
+        self.level_spacing = Settings.UI.VERTICAL_SPACING
+        self._margin_y = margin
+        for node_id in range(self.call_id_counter):
+            self.xs[node_id] = self.target_xs[node_id] = width / 2
+            self.ys[node_id] = margin + self.depths[node_id] * Settings.UI.VERTICAL_SPACING
+            self.alphas[node_id] = 1.0
+        self._moving.clear()
+        self._settling = False
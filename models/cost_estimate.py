@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class CostEstimate:
+    """시뮬레이션 실행 비용 예측 (실행 전에 입력값만으로 계산)"""
+    steps: int       # 전체 단계 수
+    nodes: int       # 호출 트리 노드 수
+    max_depth: int   # 최대 호출 깊이
+    exact: bool = True
+
+    def format(self) -> str:
+        prefix = "" if self.exact else "약 "
+        return (
+            f"예상 비용: {prefix}{self.steps:,}단계, {prefix}{self.nodes:,}노드, "
+            f"최대 깊이 {self.max_depth:,}"
+        )
+
+# 입력 검증에 실패한 호출: push, result, pop
+INVALID_INPUT = CostEstimate(steps=3, nodes=1, max_depth=1)
@@ -0,0 +1,56 @@
+from functools import lru_cache
+from typing import Any, Tuple
+from models.value_preview import is_large, preview
+
+# 서식화된 메시지 캐시 크기 (같은 템플릿과 인자가 반복될 때 재사용)
+MESSAGE_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=MESSAGE_CACHE_SIZE)
+def _format_cached(template: str, args: Tuple) -> str:
+    return template.format(*args)
+
+def format_message(template: str, args: Tuple = ()) -> str:
+    """템플릿(str.format 형식)과 인자로 메시지 문자열을 만든다
+
+    큰 정수나 긴 리스트 인자는 요약 문자열로 바꿔 넣는다.
+    """
+    if not args:
+        return template
+    if any(is_large(arg) for arg in args):
+        args = tuple(preview(arg) if is_large(arg) else arg for arg in args)
+    try:
+        return _format_cached(template, args)
+    except TypeError:
+        # 리스트처럼 해시할 수 없는 인자는 캐시 없이 서식화
+        return template.format(*args)
+
+def message_cache_info():
+    """메시지 캐시 통계 (hits, misses, maxsize, currsize)"""
+    return _format_cached.cache_info()
+
+class LazyMessage:
+    """문자열로 변환될 때 비로소 서식화되는 메시지"""
+    __slots__ = ('template', 'args')
+
+    def __init__(self, template: str, args: Tuple = ()):
+        self.template = template
+        self.args = args
+
+    def __str__(self) -> str:
+        return format_message(self.template, self.args)
+
+    def __format__(self, spec: str) -> str:
+        return format(str(self), spec)
+
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyMessage):
+            return self.template == other.template and self.args == other.args
+        if isinstance(other, str):
+            return str(self) == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(str(self))
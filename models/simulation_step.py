@@ -1,8 +1,138 @@
-from dataclasses import dataclass
-from typing import Dict, Any
+from enum import IntEnum
+from typing import Any, Dict, Optional, Tuple
+from models.messages import format_message
+from models.value_preview import preview
+
+class StepType(IntEnum):
+    """시뮬레이션 단계의 종류"""
+    PUSH = 0
+    POP = 1
+    HIGHLIGHT = 2
+    ANIMATE = 3
+    RESULT = 4
 
-@dataclass
 class SimulationStep:
-    """시뮬레이션의 각 단계를 나타내는 데이터 클래스"""
-    step_type: str  # "push", "pop", "highlight", "animate", "result"
-    details: Dict[str, Any] 
\ No newline at end of file
+    """시뮬레이션의 각 단계를 나타내는 경량 클래스
+
+    단계마다 사전을 만들지 않도록 고정 필드만 가진다.
+    - function: push/pop/result 단계의 함수 호출 이름
+    - keyword: highlight 단계에서 강조할 코드 키워드
+    - template, args: highlight/animate 단계의 설명 메시지 템플릿과 인자
+      (message 속성을 읽을 때 비로소 서식화된다)
+    - result: result 단계의 값
+    - extra: 단계별 부가 정보 (예: 하노이 원판 이동의 (원판, 출발, 도착))
+    """
+    __slots__ = ('kind', 'function', 'keyword', 'template', 'args', 'result', 'extra')
+
+    def __init__(self, kind: StepType, function: Optional[str] = None,
+                 keyword: Optional[str] = None, template: Optional[str] = None,
+                 args: Tuple = (), result: Any = None, extra: Optional[Tuple] = None):
+        self.kind = kind
+        self.function = function
+        self.keyword = keyword
+        self.template = template
+        self.args = args
+        self.result = result
+        self.extra = extra
+
+    @property
+    def message(self) -> Optional[str]:
+        """서식화된 설명 메시지 (표시할 때만 계산)"""
+        if self.template is None:
+            return None
+        return format_message(self.template, self.args)
+
+    @property
+    def step_type(self) -> str:
+        """단계 종류 이름 ("push", "pop", "highlight", "animate", "result")"""
+        return _STEP_TYPE_NAMES[self.kind]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """직렬화를 위한 사전 표현 (설정된 필드만 포함)"""
+        record: Dict[str, Any] = {"type": self.step_type}
+        for field in ('function', 'keyword', 'message', 'result', 'extra'):
+            value = getattr(self, field)
+            if value is not None:
+                record[field] = value
+        return record
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{k}={preview(v) if k == 'result' else repr(v)}"
+            for k, v in self.to_dict().items() if k != "type"
+        )
+        return f"SimulationStep({self.step_type}, {fields})"
+
+_STEP_TYPE_NAMES = tuple(kind.name.lower() for kind in StepType)
+
+# 단계 생성 함수
+# 시뮬레이션은 단계를 수백만 개 만들 수 있으므로 키워드 인자 처리와
+# __init__ 호출을 건너뛰고 슬롯을 직접 채운다.
+_new_step = object.__new__
+_NO_ARGS = ()
+_PUSH = StepType.PUSH
+_POP = StepType.POP
+_HIGHLIGHT = StepType.HIGHLIGHT
+_ANIMATE = StepType.ANIMATE
+_RESULT = StepType.RESULT
+
+def push_step(function: str) -> SimulationStep:
+    """함수 호출 시작 단계"""
+    step = _new_step(SimulationStep)
+    step.kind = _PUSH
+    step.function = function
+    step.keyword = None
+    step.template = None
+    step.args = _NO_ARGS
+    step.result = None
+    step.extra = None
+    return step
+
+def pop_step(function: str) -> SimulationStep:
+    """함수 호출 종료 단계"""
+    step = _new_step(SimulationStep)
+    step.kind = _POP
+    step.function = function
+    step.keyword = None
+    step.template = None
+    step.args = _NO_ARGS
+    step.result = None
+    step.extra = None
+    return step
+
+def highlight_step(keyword: str, template: str, args: Tuple = _NO_ARGS) -> SimulationStep:
+    """코드 강조 단계 (메시지는 template.format(*args)로 지연 생성)"""
+    step = _new_step(SimulationStep)
+    step.kind = _HIGHLIGHT
+    step.function = None
+    step.keyword = keyword
+    step.template = template
+    step.args = args
+    step.result = None
+    step.extra = None
+    return step
+
+def animate_step(template: str, args: Tuple = _NO_ARGS,
+                 extra: Optional[Tuple] = None) -> SimulationStep:
+    """애니메이션 단계 (메시지는 template.format(*args)로 지연 생성)"""
+    step = _new_step(SimulationStep)
+    step.kind = _ANIMATE
+    step.function = None
+    step.keyword = None
+    step.template = template
+    step.args = args
+    step.result = None
+    step.extra = extra
+    return step
+
+def result_step(function: str, result: Any) -> SimulationStep:
+    """함수 결과 단계"""
+    step = _new_step(SimulationStep)
+    step.kind = _RESULT
+    step.function = function
+    step.keyword = None
+    step.template = None
+    step.args = _NO_ARGS
+    step.result = result
+    step.extra = None
+    return step
@@ -0,0 +1,417 @@
+from array import array
+import struct
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Set, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy가 없으면 두 번째 순회를 노드별 반복으로 수행
+    np = None
+
+if TYPE_CHECKING:
+    from models.call_tree import CallTreeManager
+
+NO_NODE = -1
+
+# 되돌리기 기록에서 열을 구분하는 번호 (앞의 넷은 노드별 배열, 나머지는 사전)
+_PRELIM, _MOD, _THREAD, _ANCESTOR, _SHIFT, _CHANGE, _DEFAULT_ANCESTOR = range(7)
+_DENSE_COUNT = 4
+# 사전 열에 없는 노드의 값
+_DEFAULTS = (0.0, 0.0, NO_NODE)
+# 사전 열의 실수도 배열 열처럼 float32로 반올림해 두어 기록에서 정확히 되돌린다
+_FLOAT32 = struct.Struct('f')
+
+class LayoutSnapshot(NamedTuple):
+    """체크포인트 시점에 이후의 pop이 바꿀 수 있는 노드들의 배치 상태
+
+    values[k]는 k번째 배열 열에서 node_ids 순서대로 가져온 값이고,
+    sparse는 사전 열 전체의 복사본이다.
+    """
+    node_ids: array
+    values: Tuple[array, ...]
+    sparse: Tuple[Dict[int, Any], ...]
+
+class TidyTreeLayout:
+    """Buchheim-Jünger-Leipert(2002)의 선형 시간 정돈 트리 배치
+
+    Reingold-Tilford 방식으로 각 서브트리를 왼쪽 형제들의 윤곽선에 최대한 붙여
+    배치하고 부모를 첫 자식과 마지막 자식의 가운데에 둔다. 윤곽선은 스레드로
+    이어 두므로 전체 비용은 노드 수에 비례한다.
+
+    첫 번째 순회(후위)는 호출이 끝날 때(pop) 그 노드에 대해 한 번만 수행한다.
+    아직 진행 중인 호출(스택)은 positions()에서 임시로 마무리해 배치한 뒤 되돌린다.
+
+    recording이 켜져 있으면(Timeline이 켠다) 배치 상태를 바꾸는 쓰기의 이전 값을
+    기록해 undo_pop으로 pop 이전 상태로 돌아갈 수 있다. 기록은 마지막 체크포인트
+    이후만 보관하고(clear_journal), 그보다 앞 시점은 snapshot/restore로 복원한다.
+
+    좌표 단위는 형제 노드 사이의 최소 간격(1)이며 float32로 저장한다.
+    shift/change/default_ancestor는 부모가 끝나기 전(스택 위에 있는 동안)에만
+    쓰이므로 노드별 배열 대신 사전에 두고 부모가 끝날 때 지운다.
+    """
+
+    def __init__(self, tree: 'CallTreeManager'):
+        self.tree = tree
+        self.prelim = array('f')
+        self.mod = array('f')
+        self.thread = array('i')
+        self.ancestor = array('i')
+        self.shift: Dict[int, float] = {}
+        self.change: Dict[int, float] = {}
+        self.default_ancestor: Dict[int, int] = {}
+        self._dense = (self.prelim, self.mod, self.thread, self.ancestor)
+        self._sparse = (self.shift, self.change, self.default_ancestor)
+        self._columns = self._dense + self._sparse
+        self.recording = False
+        # 쓰기 기록: 열 번호, 노드 id, 이전 값
+        # (노드 id는 INTERACTIVE_MAX_NODES보다 작으므로 float32로도 정확하다)
+        self._log_columns = array('b')
+        self._log_indices = array('i')
+        self._log_values = array('f')
+        self._log = (self._log_columns, self._log_indices, self._log_values)
+        # 기록을 비운 뒤 pop마다 그 직전의 기록 길이 (undo_pop은 마지막 pop을 되돌린다)
+        self._pop_marks = array('i')
+
+    def push(self, node_id: int) -> None:
+        """새 노드의 배치 상태 추가"""
+        self.prelim.append(0.0)
+        self.mod.append(0.0)
+        self.thread.append(NO_NODE)
+        self.ancestor.append(node_id)
+
+    def pop(self, node_id: int) -> None:
+        """호출이 끝난 노드의 첫 번째 순회를 수행 (자식은 모두 끝난 상태)"""
+        if self.recording:
+            self._pop_marks.append(len(self._log_columns))
+        self._first_walk(node_id)
+
+    def undo_pop(self, node_id: int) -> None:
+        """마지막 pop(node_id)의 쓰기를 되돌림"""
+        if not self._pop_marks:
+            raise ValueError("되돌릴 배치 기록이 없습니다")
+        self.rollback(self._pop_marks.pop())
+
+    def rollback(self, length: int) -> None:
+        """기록을 length까지 되돌림 (나중 쓰기부터)"""
+        codes, indices, values = self._log
+        for position in range(len(codes) - 1, length - 1, -1):
+            self._put(codes[position], indices[position], values[position])
+        for column in self._log:
+            del column[length:]
+
+    def clear_journal(self) -> None:
+        """쓰기 기록을 비움 (이 시점 이전의 pop은 더 이상 undo_pop할 수 없다)"""
+        for column in self._log:
+            del column[:]
+        del self._pop_marks[:]
+
+    def copy_columns(self) -> Tuple[array, ...]:
+        """restore에서 쓸 배열 열의 복사본 (사전 열은 스냅샷에 들어 있다)"""
+        return tuple(column[:] for column in self._dense)
+
+    def snapshot(self, stack: List[int]) -> LayoutSnapshot:
+        """이후의 pop이 바꿀 수 있는 노드들의 현재 값을 저장"""
+        node_ids = array('i', sorted(self._live_nodes(stack)))
+        return LayoutSnapshot(
+            node_ids,
+            tuple(array(column.typecode, [column[i] for i in node_ids]) for column in self._dense),
+            tuple(dict(column) for column in self._sparse)
+        )
+
+    def _live_nodes(self, stack: List[int]) -> Set[int]:
+        """이후의 첫 번째 순회가 쓸 수 있는 (새 노드가 아닌) 노드
+
+        스택 위 노드와 그 자식들, 그리고 끝난 자식들이 이루는 숲의 왼쪽/오른쪽
+        윤곽선이다. 끝난 형제들의 윤곽선은 스레드로 이어져 있으므로 첫 자식과
+        마지막으로 끝난 자식에서 윤곽선을 따라가면 된다.
+        """
+        prev_sibling = self.tree.prev_sibling
+        last_child = self.tree.last_child
+        live = set(stack)
+        for position, parent in enumerate(stack):
+            last = last_child[parent]
+            if last == NO_NODE:
+                continue
+            running = stack[position + 1] if position + 1 < len(stack) else NO_NODE
+            child = last
+            while child != NO_NODE:
+                live.add(child)
+                child = prev_sibling[child]
+            # 전위 순서이므로 첫 자식은 parent + 1
+            starts = (
+                (parent + 1, self._next_left),
+                (prev_sibling[last] if last == running else last, self._next_right),
+            )
+            for node, next_node in starts:
+                if node == running:
+                    continue
+                while node != NO_NODE:
+                    live.add(node)
+                    node = next_node(node)
+        return live
+
+    def restore(self, node_count: int, columns: Tuple[array, ...], snapshot: LayoutSnapshot) -> None:
+        """snapshot 시점으로 복원
+
+        columns는 그 시점보다 나중(같은 실행)의 열 복사본이다. 그 사이에 바뀐 칸은
+        모두 snapshot에 들어 있으므로 앞부분을 복사한 뒤 snapshot 값만 덮어쓴다.
+        """
+        node_ids = snapshot.node_ids
+        for column, source, values in zip(self._dense, columns, snapshot.values):
+            column[:] = source[:node_count]
+            for node_id, value in zip(node_ids, values):
+                column[node_id] = value
+        for column, source in zip(self._sparse, snapshot.sparse):
+            column.clear()
+            column.update(source)
+        self.clear_journal()
+
+    def truncate(self, node_count: int) -> None:
+        """node_count 이후의 노드 상태를 제거 (관련 기록은 먼저 되돌려야 한다)"""
+        for column in self._dense:
+            del column[node_count:]
+        for column in self._sparse:
+            for node_id in [node_id for node_id in column if node_id >= node_count]:
+                del column[node_id]
+
+    def positions(self, stack: List[int]) -> Tuple[Any, float]:
+        """모든 노드의 x 좌표(최솟값 0)와 전체 폭을 계산
+
+        진행 중인 호출은 맨 위부터 뿌리까지 임시로 마무리해 배치하고 끝나면 되돌린다.
+        뿌리가 여러 개이면 왼쪽부터 나란히 놓는다.
+        NumPy가 있으면 좌표를 float64 ndarray로, 없으면 array('d')로 반환한다.
+        """
+        recording = self.recording
+        self.recording = True
+        length = len(self._log_columns)
+        for node_id in reversed(stack):
+            self._first_walk(node_id)
+        try:
+            if np is not None:
+                return self._second_walk_vectorized(stack)
+            return self._second_walk()
+        finally:
+            self.rollback(length)
+            self.recording = recording
+
+    def _set(self, code: int, node_id: int, value: float) -> None:
+        column = self._columns[code]
+        if code < _DENSE_COUNT:
+            if self.recording:
+                self._log_columns.append(code)
+                self._log_indices.append(node_id)
+                self._log_values.append(column[node_id])
+            column[node_id] = value
+            return
+        if self.recording:
+            self._log_columns.append(code)
+            self._log_indices.append(node_id)
+            self._log_values.append(column.get(node_id, _DEFAULTS[code - _DENSE_COUNT]))
+        self._put(code, node_id, value)
+
+    def _put(self, code: int, node_id: int, value: float) -> None:
+        """기록된 값을 열에 씀 (사전 열은 기본값이면 항목을 지운다)"""
+        column = self._columns[code]
+        if code < _THREAD:
+            column[node_id] = value
+        elif code < _DENSE_COUNT:
+            column[node_id] = int(value)
+        elif value == _DEFAULTS[code - _DENSE_COUNT]:
+            column.pop(node_id, None)
+        elif code == _DEFAULT_ANCESTOR:
+            column[node_id] = int(value)
+        else:
+            column[node_id] = _FLOAT32.unpack(_FLOAT32.pack(value))[0]
+
+    def _first_walk(self, v: int) -> None:
+        """v의 예비 좌표를 정하고 왼쪽 형제들 옆에 배치"""
+        tree = self.tree
+        prelim = self.prelim
+        left = tree.prev_sibling[v]
+        if tree.last_child[v] == NO_NODE:
+            self._set(_PRELIM, v, prelim[left] + 1.0 if left != NO_NODE else 0.0)
+        else:
+            self._execute_shifts(v)
+            if v in self.default_ancestor:
+                self._set(_DEFAULT_ANCESTOR, v, NO_NODE)
+            # 전위 순서이므로 첫 자식은 v + 1
+            midpoint = (prelim[v + 1] + prelim[tree.last_child[v]]) / 2
+            if left != NO_NODE:
+                self._set(_PRELIM, v, prelim[left] + 1.0)
+                self._set(_MOD, v, prelim[v] - midpoint)
+            else:
+                self._set(_PRELIM, v, midpoint)
+
+        parent = tree.parents[v]
+        if parent != NO_NODE:
+            default = self.default_ancestor.get(parent, NO_NODE)
+            if left == NO_NODE:
+                default = v
+            self._set(_DEFAULT_ANCESTOR, parent, self._apportion(v, default))
+
+    def _execute_shifts(self, v: int) -> None:
+        """apportion에서 미뤄 둔 이동량을 자식들에게 한 번에 반영 (반영한 값은 지운다)"""
+        tree = self.tree
+        shifts = self.shift
+        changes = self.change
+        shift = 0.0
+        change = 0.0
+        w = tree.last_child[v]
+        while w != NO_NODE:
+            if shift:
+                self._set(_PRELIM, w, self.prelim[w] + shift)
+                self._set(_MOD, w, self.mod[w] + shift)
+            if w in changes:
+                change += changes[w]
+                self._set(_CHANGE, w, 0.0)
+            if w in shifts:
+                shift += shifts[w]
+                self._set(_SHIFT, w, 0.0)
+            shift += change
+            w = tree.prev_sibling[w]
+
+    def _next_left(self, v: int) -> int:
+        return v + 1 if self.tree.last_child[v] != NO_NODE else self.thread[v]
+
+    def _next_right(self, v: int) -> int:
+        child = self.tree.last_child[v]
+        return child if child != NO_NODE else self.thread[v]
+
+    def _apportion(self, v: int, default: int) -> int:
+        """v의 서브트리를 왼쪽 형제 숲의 윤곽선에 겹치지 않게 붙임"""
+        tree = self.tree
+        w = tree.prev_sibling[v]
+        if w == NO_NODE:
+            return default
+        prelim = self.prelim
+        mod = self.mod
+        vir = vor = v
+        vil = w
+        vol = tree.parents[v] + 1
+        sir = sor = mod[vir]
+        sil = mod[vil]
+        sol = mod[vol]
+        next_left = self._next_left
+        next_right = self._next_right
+        while True:
+            right = next_right(vil)
+            left = next_left(vir)
+            if right == NO_NODE or left == NO_NODE:
+                break
+            vil = right
+            vir = left
+            vol = next_left(vol)
+            vor = next_right(vor)
+            self._set(_ANCESTOR, vor, v)
+            shift = (prelim[vil] + sil) - (prelim[vir] + sir) + 1.0
+            if shift > 0:
+                self._move_subtree(self._ancestor_of(vil, v, default), v, shift)
+                sir += shift
+                sor += shift
+            sil += mod[vil]
+            sir += mod[vir]
+            sol += mod[vol]
+            sor += mod[vor]
+
+        right = next_right(vil)
+        if right != NO_NODE and next_right(vor) == NO_NODE:
+            self._set(_THREAD, vor, right)
+            self._set(_MOD, vor, mod[vor] + sil - sor)
+            return default
+        left = next_left(vir)
+        if left != NO_NODE and next_left(vol) == NO_NODE:
+            self._set(_THREAD, vol, left)
+            self._set(_MOD, vol, mod[vol] + sir - sol)
+        return v
+
+    def _ancestor_of(self, vil: int, v: int, default: int) -> int:
+        """vil이 속한 v의 형제 서브트리 뿌리 (알 수 없으면 default)"""
+        ancestor = self.ancestor[vil]
+        if self.tree.parents[ancestor] == self.tree.parents[v]:
+            return ancestor
+        return default
+
+    def _move_subtree(self, wl: int, wr: int, shift: float) -> None:
+        """wr 서브트리를 shift만큼 옮기고 사이의 형제들에게 나눌 이동량을 기록"""
+        subtrees = self.tree.sibling_index[wr] - self.tree.sibling_index[wl]
+        self._set(_CHANGE, wr, self.change.get(wr, 0.0) - shift / subtrees)
+        self._set(_SHIFT, wr, self.shift.get(wr, 0.0) + shift)
+        self._set(_CHANGE, wl, self.change.get(wl, 0.0) + shift / subtrees)
+        self._set(_PRELIM, wr, self.prelim[wr] + shift)
+        self._set(_MOD, wr, self.mod[wr] + shift)
+
+    def _second_walk(self) -> Tuple[array, float]:
+        """조상들의 mod 합을 더해 최종 좌표 계산 (노드는 전위 순서로 저장되어 있다)"""
+        tree = self.tree
+        count = tree.call_id_counter
+        parents = tree.parents
+        prelim = self.prelim
+        mod = self.mod
+        xs = array('d', prelim)
+        offsets = array('d', bytes(8 * count))  # 자신을 포함한 조상들의 mod 합
+        left = 0.0
+        right = 0.0
+        root_left = 0.0
+        root_right = 0.0
+        root_shift = 0.0
+        for node_id in range(count):
+            parent = parents[node_id]
+            if parent == NO_NODE:
+                # 새 뿌리는 앞선 트리의 오른쪽에 붙인다
+                if node_id:
+                    left = min(left, root_left)
+                    right = max(right, root_right)
+                    root_shift = right + 1.0 - prelim[node_id]
+                else:
+                    root_shift = -prelim[node_id]
+                offsets[node_id] = mod[node_id] + root_shift
+                x = prelim[node_id] + root_shift
+                root_left = root_right = x
+            else:
+                base = offsets[parent]
+                offsets[node_id] = base + mod[node_id]
+                x = prelim[node_id] + base
+                if x < root_left:
+                    root_left = x
+                elif x > root_right:
+                    root_right = x
+            xs[node_id] = x
+        left = min(left, root_left)
+        right = max(right, root_right)
+        if left:
+            for node_id in range(count):
+                xs[node_id] -= left
+        return xs, right - left
+
+    def _second_walk_vectorized(self, stack: List[int]) -> Tuple[Any, float]:
+        """두 번째 순회를 배열 연산으로 수행
+
+        전위 순서에서 v의 서브트리는 [v, subtree_end(v)) 구간이므로 조상들의 mod 합은
+        구간마다 mod[v]를 더하는 차분 배열의 누적합이다. 구간 끝에서 빼는 값은
+        bincount로 끝 위치별로 묶어 더한다.
+        """
+        tree = self.tree
+        count = tree.call_id_counter
+        # 누적 오차를 줄이려고 float64로 더한다
+        prelim = np.frombuffer(self.prelim, dtype=np.float32).astype(np.float64)
+        mod = np.frombuffer(self.mod, dtype=np.float32).astype(np.float64)
+        ends = np.frombuffer(tree.subtree_ends, dtype=np.int32).copy()
+        # 진행 중인 호출의 서브트리는 지금까지 추가된 모든 노드까지
+        ends[stack] = count
+        offsets = mod - np.bincount(ends, weights=mod, minlength=count + 1)[:count]
+        np.cumsum(offsets, out=offsets)
+        xs = prelim + offsets
+        xs -= mod
+
+        roots = np.flatnonzero(np.frombuffer(tree.parents, dtype=np.int32) == NO_NODE)
+        if len(roots) == 1:
+            xs -= xs.min()
+            return xs, float(xs.max())
+        # 새 뿌리는 앞선 트리의 오른쪽에 붙인다
+        right = None
+        for root in roots.tolist():
+            subtree = xs[root:ends[root]]
+            subtree += (right + 1.0 if right is not None else 0.0) - prelim[root]
+            top = float(subtree.max())
+            right = top if right is None else max(right, top)
+        xs -= xs.min()
+        return xs, float(xs.max())
@@ -0,0 +1,122 @@
+import math
+import sys
+from typing import Any
+
+# 그대로 표시할 최대 자릿수 / 컬렉션 항목 수 / 문자 수
+PREVIEW_MAX_DIGITS = 40
+PREVIEW_MAX_ITEMS = 8
+PREVIEW_MAX_CHARS = 200
+PREVIEW_MAX_DEPTH = 3
+# 앞자리를 정확히 계산할 최대 자릿수 (그보다 크면 부동소수점 근사)
+EXACT_LEADING_MAX_DIGITS = 5_000
+LEADING_DIGITS = 12
+TRAILING_DIGITS = 6
+
+# 이 비트 수 이하의 정수는 자릿수가 PREVIEW_MAX_DIGITS를 넘지 않는다
+_INLINE_BITS = int(PREVIEW_MAX_DIGITS / math.log10(2))
+
+def digit_count(n: int) -> int:
+    """10진수 자릿수 (문자열 변환 없이 로그로 계산)"""
+    n = abs(n)
+    if n < 10:
+        return 1
+    log = math.log10(n)
+    digits = int(log) + 1
+    # 10의 거듭제곱 근처에서는 부동소수점 오차를 정수 비교로 보정
+    fraction = log - int(log)
+    if fraction < 1e-9 or fraction > 1 - 1e-9:
+        power = 10 ** (digits - 1)
+        if n < power:
+            digits -= 1
+        elif n >= power * 10:
+            digits += 1
+    return digits
+
+def is_large(value: Any) -> bool:
+    """그대로 문자열로 만들면 비용이 큰 값인지 (큰 정수, 긴 리스트/튜플)"""
+    if type(value) is int:
+        return value.bit_length() > _INLINE_BITS
+    if isinstance(value, (list, tuple)):
+        return len(value) > PREVIEW_MAX_ITEMS or any(is_large(item) for item in value)
+    return False
+
+def exceeds_str_limit(value: Any) -> bool:
+    """정수→문자열 자릿수 제한(sys.get_int_max_str_digits)에 걸리는 정수인지"""
+    get_limit = getattr(sys, 'get_int_max_str_digits', None)
+    if type(value) is not int or get_limit is None:
+        return False
+    limit = get_limit()
+    # 자릿수가 limit을 넘으면 비트 수는 limit·log2(10) > 3·limit을 넘는다
+    return limit > 0 and value.bit_length() > 3 * limit and digit_count(value) > limit
+
+def preview_int(n: int) -> str:
+    """큰 정수를 앞자리…뒷자리 (자릿수) 형태로 요약"""
+    if n.bit_length() <= _INLINE_BITS:
+        return str(n)
+    sign = "-" if n < 0 else ""
+    n = abs(n)
+    digits = digit_count(n)
+    if digits <= PREVIEW_MAX_DIGITS:
+        return sign + str(n)
+    trailing = str(n % 10 ** TRAILING_DIGITS).zfill(TRAILING_DIGITS)
+    if digits <= EXACT_LEADING_MAX_DIGITS:
+        leading = str(n // 10 ** (digits - LEADING_DIGITS))
+        return f"{sign}{leading}…{trailing} ({digits:,}자리)"
+    # 매우 큰 수는 로그로 과학적 표기만 계산
+    log = math.log10(n)
+    mantissa = 10 ** (log - int(log))
+    return f"{sign}≈{mantissa:.6f}e+{int(log)} ({digits:,}자리)"
+
+def _preview_repr(value: Any, depth: int) -> str:
+    """컨테이너 항목용 요약 (repr과 같은 모양)"""
+    if type(value) is int:
+        return preview_int(value)
+    if isinstance(value, (list, tuple)):
+        return _preview_sequence(value, depth)
+    text = repr(value)
+    if len(text) > PREVIEW_MAX_CHARS:
+        text = text[:PREVIEW_MAX_CHARS] + "…"
+    return text
+
+def _preview_sequence(seq: Any, depth: int) -> str:
+    is_tuple = isinstance(seq, tuple)
+    open_, close = ("(", ")") if is_tuple else ("[", "]")
+    if depth >= PREVIEW_MAX_DEPTH:
+        return f"{open_}…{close}" if seq else f"{open_}{close}"
+    items = [_preview_repr(item, depth + 1) for item in seq[:PREVIEW_MAX_ITEMS]]
+    if len(seq) > PREVIEW_MAX_ITEMS:
+        items.append(f"… 총 {len(seq):,}개")
+    elif is_tuple and len(seq) == 1:
+        return f"({items[0]},)"
+    return open_ + ", ".join(items) + close
+
+def preview(value: Any, max_chars: int = PREVIEW_MAX_CHARS) -> str:
+    """화면 표시용 요약 문자열 (값의 크기와 무관하게 짧고 빠르다)
+
+    작은 값은 str(value)와 같고, 큰 정수는 앞뒤 자릿수와 자릿수 개수로,
+    긴 리스트/튜플은 앞 항목 몇 개와 전체 개수로 줄인다.
+    """
+    if type(value) is int:
+        text = preview_int(value)
+    elif isinstance(value, (list, tuple)):
+        text = _preview_sequence(value, 0)
+    else:
+        text = str(value)
+    if len(text) > max_chars:
+        text = text[:max_chars] + "…"
+    return text
+
+def format_full(value: Any) -> str:
+    """전체 값을 문자열로 변환 (오래 걸릴 수 있으므로 사용자가 요청할 때만 호출)
+
+    정수→문자열 자릿수 제한(기본 4300자리)을 변환하는 동안만 해제한다.
+    """
+    get_limit = getattr(sys, 'get_int_max_str_digits', None)
+    if get_limit is None:
+        return str(value)
+    limit = get_limit()
+    sys.set_int_max_str_digits(0)
+    try:
+        return str(value)
+    finally:
+        sys.set_int_max_str_digits(limit)
@@ -1,48 +1,44 @@
 from typing import Generator, Any
 from ..base import BaseSimulation
-from models.simulation_step import SimulationStep
+from models.cost_estimate import CostEstimate, INVALID_INPUT
+from models.simulation_step import (
+    SimulationStep, push_step, pop_step, highlight_step, result_step
+)
 
 class AccumulateSumSimulation(BaseSimulation):
+    @staticmethod
+    def estimate(n: int) -> CostEstimate:
+        if n < 0:
+            return INVALID_INPUT
+        # n, n-1, ..., 0의 사슬: 기저 4단계, 나머지 6단계
+        return CostEstimate(6 * n + 4, n + 1, n + 1)
+
     @staticmethod
     def run(n: int) -> Generator[SimulationStep, None, Any]:
         func_name = f"accumulate_sum({n})"
-        yield SimulationStep("push", {"function": func_name})
+        yield push_step(func_name)
 
         if n < 0:
-            yield SimulationStep("result", {
-                "result": "오류: 음수 입력",
-                "function": func_name
-            })
-            yield SimulationStep("pop", {"function": func_name})
+            yield result_step(func_name, "오류: 음수 입력")
+            yield pop_step(func_name)
             return None
 
-        yield SimulationStep("highlight", {
-            "keyword": "기저 조건",
-            "message": f"n={n} 확인"
-        })
+        yield highlight_step("기저 조건", "n={} 확인", (n,))
 
         if n == 0:
-            yield SimulationStep("result", {
-                "result": 0,
-                "function": func_name
-            })
-            yield SimulationStep("pop", {"function": func_name})
+            yield result_step(func_name, 0)
+            yield pop_step(func_name)
             return 0
 
-        yield SimulationStep("highlight", {
-            "keyword": "재귀 호출",
-            "message": f"accumulate_sum({n-1}) + {n} 계산"
-        })
-        prev_sum = yield from AccumulateSumSimulation.run(n - 1)
+        yield highlight_step("재귀 호출", "accumulate_sum({}) + {} 계산", (n-1, n))
+        prev_sum = yield AccumulateSumSimulation.run(n - 1)
         
         total = prev_sum + n
-        yield SimulationStep("highlight", {
-            "keyword": "반환",
-            "message": f"accumulate_sum({n}) = accumulate_sum({n-1}) + {n} = {prev_sum} + {n} = {total}"
-        })
-        yield SimulationStep("result", {
-            "result": total,
-            "function": func_name
-        })
-        yield SimulationStep("pop", {"function": func_name})
+        yield highlight_step(
+            "반환",
+            "accumulate_sum({0}) = accumulate_sum({1}) + {0} = {2} + {0} = {3}",
+            (n, n-1, prev_sum, total)
+        )
+        yield result_step(func_name, total)
+        yield pop_step(func_name)
         return total 
\ No newline at end of file
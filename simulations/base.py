@@ -1,11 +1,29 @@
 from abc import ABC, abstractmethod
 from typing import Generator, Any
+from engine.driver import drive
+from models.cost_estimate import CostEstimate
 from models.simulation_step import SimulationStep
 
 class BaseSimulation(ABC):
-    """시뮬레이션의 기본 클래스"""
+    """시뮬레이션의 기본 클래스
+
+    run은 SimulationStep을 yield하고, 재귀 호출은 `value = yield Sim.run(...)`처럼
+    하위 제너레이터를 yield해서 요청한다. 이렇게 만든 제너레이터는 드라이버가
+    실행해야 하므로, 평탄한 단계 스트림이 필요하면 start를 사용한다.
+    """
     
     @abstractmethod
-    def run(self, *args, **kwargs) -> Generator[SimulationStep, None, Any]:
-        """시뮬레이션을 실행하고 각 단계를 생성"""
-        pass 
\ No newline at end of file
+    def run(self, *args, **kwargs) -> Generator[Any, Any, Any]:
+        """시뮬레이션을 실행하고 각 단계와 하위 호출을 생성"""
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def estimate(*args, **kwargs) -> CostEstimate:
+        """run과 같은 인자로 실행했을 때의 단계 수, 노드 수, 최대 깊이 예측"""
+        pass
+
+    @classmethod
+    def start(cls, *args, **kwargs) -> Generator[SimulationStep, None, Any]:
+        """명시적 스택 드라이버로 실행되는 평탄한 단계 제너레이터를 반환"""
+        return drive(cls.run(*args, **kwargs))
@@ -1,46 +1,106 @@
 from typing import Generator, Any, List
 from ..base import BaseSimulation
-from models.simulation_step import SimulationStep
+from models.cost_estimate import CostEstimate
+from models.simulation_step import (
+    SimulationStep, push_step, pop_step, highlight_step, result_step
+)
 
 class CombinationSimulation(BaseSimulation):
+    # 결과 처리 방식
+    COLLECT = "collect"  # 단계마다 하위 결과 목록을 모아 반환
+    STREAM = "stream"    # 완성된 조합을 한 번씩만 내보내고 내부 노드는 개수만 반환
+    STRATEGIES = (COLLECT, STREAM)
+
+    @staticmethod
+    def estimate(elements: List[int], k: int, start: int = 0,
+                 current: List[int] = None, strategy: str = COLLECT) -> CostEstimate:
+        n = len(elements)
+        chosen = len(current) if current else 0
+        # (선택한 개수, 시작 위치)별 서브트리 비용을 선택 개수가 많은 쪽부터 채운다 (O(n·k))
+        # 완성 리프 4단계, 원소가 남지 않은 리프 2단계,
+        # 내부 노드 3단계 + 남은 원소마다 강조 1단계
+        below = None
+        for taken in range(min(k, chosen + n), chosen - 1, -1):
+            row = [(1, 2, 1)] * (n + 1)
+            nodes_sum = steps_sum = depth_max = 0
+            for s in range(n, -1, -1):
+                if taken == k:
+                    row[s] = (1, 4, 1)
+                elif s < n and below is not None:
+                    child = below[s + 1]
+                    nodes_sum += child[0]
+                    steps_sum += child[1]
+                    depth_max = max(depth_max, child[2])
+                    row[s] = (1 + nodes_sum, 3 + (n - s) + steps_sum, 1 + depth_max)
+            below = row
+        nodes, steps, depth = below[min(start, n)]
+        return CostEstimate(steps, nodes, depth)
+
     @staticmethod
-    def run(elements: List[int], k: int, start: int = 0, current: List[int] = None) -> Generator[SimulationStep, None, Any]:
+    def run(elements: List[int], k: int, start: int = 0, current: List[int] = None,
+            strategy: str = COLLECT) -> Generator[SimulationStep, None, Any]:
         if current is None:
             current = []
-            
+        if strategy == CombinationSimulation.COLLECT:
+            return CombinationSimulation._run_collect(elements, k, start, current)
+        if strategy == CombinationSimulation.STREAM:
+            return CombinationSimulation._run_stream(elements, k, start, list(current))
+        raise ValueError(f"알 수 없는 조합 전략: {strategy}")
+
+    @staticmethod
+    def _run_collect(elements: List[int], k: int, start: int,
+                     current: List[int]) -> Generator[SimulationStep, None, Any]:
         func_name = f"combination({elements}, {k}, current={current})"
-        yield SimulationStep("push", {"function": func_name})
+        yield push_step(func_name)
 
         if len(current) == k:
-            yield SimulationStep("highlight", {
-                "keyword": "기저 조건",
-                "message": "조합 완성"
-            })
-            yield SimulationStep("result", {
-                "result": current,
-                "function": func_name
-            })
-            yield SimulationStep("pop", {"function": func_name})
+            yield highlight_step("기저 조건", "조합 완성")
+            yield result_step(func_name, current)
+            yield pop_step(func_name)
             return [current]
 
         if start >= len(elements):
-            yield SimulationStep("pop", {"function": func_name})
+            yield pop_step(func_name)
             return []
 
         results = []
         for i in range(start, len(elements)):
-            yield SimulationStep("highlight", {
-                "keyword": "재귀 호출",
-                "message": f"원소 {elements[i]} 선택"
-            })
+            yield highlight_step("재귀 호출", "원소 {} 선택", (elements[i],))
             
             new_current = current + [elements[i]]
-            sub_results = yield from CombinationSimulation.run(elements, k, i + 1, new_current)
+            sub_results = yield CombinationSimulation._run_collect(elements, k, i + 1, new_current)
             results.extend(sub_results)
 
-        yield SimulationStep("result", {
-            "result": results,
-            "function": func_name
-        })
-        yield SimulationStep("pop", {"function": func_name})
-        return results 
\ No newline at end of file
+        yield result_step(func_name, results)
+        yield pop_step(func_name)
+        return results
+
+    @staticmethod
+    def _run_stream(elements: List[int], k: int, start: int,
+                    current: List[int]) -> Generator[SimulationStep, None, Any]:
+        """current를 모든 호출이 공유하고 되돌려 놓는다 (결과 수와 무관하게 O(n) 메모리)"""
+        func_name = f"combination({elements}, {k}, current={current})"
+        yield push_step(func_name)
+
+        if len(current) == k:
+            # 완성된 조합은 여기서 한 번만 내보낸다
+            yield highlight_step("기저 조건", "조합 완성")
+            yield result_step(func_name, tuple(current))
+            yield pop_step(func_name)
+            return 1
+
+        if start >= len(elements):
+            yield pop_step(func_name)
+            return 0
+
+        count = 0
+        for i in range(start, len(elements)):
+            yield highlight_step("재귀 호출", "원소 {} 선택", (elements[i],))
+
+            current.append(elements[i])
+            count += yield CombinationSimulation._run_stream(elements, k, i + 1, current)
+            current.pop()
+
+        yield result_step(func_name, count)
+        yield pop_step(func_name)
+        return count
@@ -1,44 +1,96 @@
+import math
 from typing import Generator, Any, List
 from ..base import BaseSimulation
-from models.simulation_step import SimulationStep
+from models.cost_estimate import CostEstimate
+from models.simulation_step import (
+    SimulationStep, push_step, pop_step, highlight_step, result_step
+)
 
 class PermutationSimulation(BaseSimulation):
+    # 결과 처리 방식
+    COLLECT = "collect"  # 단계마다 하위 결과 목록을 모아 반환
+    STREAM = "stream"    # 완성된 순열을 한 번씩만 내보내고 내부 노드는 개수만 반환
+    STRATEGIES = (COLLECT, STREAM)
+
+    @staticmethod
+    def estimate(elements: List[int], current: List[int] = None,
+                 strategy: str = COLLECT) -> CostEstimate:
+        n = len(elements)
+        # 깊이 d의 노드 수는 n!/(n-d)!, 합은 floor(e·n!) (n ≥ 1)
+        nodes = 0
+        level = 1
+        for remaining in range(n, -1, -1):
+            nodes += level
+            level *= remaining
+        leaves = math.factorial(n)
+        # 리프 4단계, 내부 노드 3단계 + 자식마다 강조 1단계 (간선 수 = 노드 수 - 1)
+        steps = 4 * leaves + 3 * (nodes - leaves) + (nodes - 1)
+        return CostEstimate(steps, nodes, n + 1)
+
     @staticmethod
-    def run(elements: List[int], current: List[int] = None) -> Generator[SimulationStep, None, Any]:
+    def run(elements: List[int], current: List[int] = None,
+            strategy: str = COLLECT) -> Generator[SimulationStep, None, Any]:
         if current is None:
             current = []
-        
+        if strategy == PermutationSimulation.COLLECT:
+            return PermutationSimulation._run_collect(elements, current)
+        if strategy == PermutationSimulation.STREAM:
+            return PermutationSimulation._run_stream(
+                elements, list(current), [False] * len(elements)
+            )
+        raise ValueError(f"알 수 없는 순열 전략: {strategy}")
+
+    @staticmethod
+    def _run_collect(elements: List[int], current: List[int]) -> Generator[SimulationStep, None, Any]:
         func_name = f"permutation({elements}, {current})"
-        yield SimulationStep("push", {"function": func_name})
+        yield push_step(func_name)
 
         if not elements:
-            yield SimulationStep("highlight", {
-                "keyword": "기저 조건",
-                "message": "순열 완성"
-            })
-            yield SimulationStep("result", {
-                "result": current,
-                "function": func_name
-            })
-            yield SimulationStep("pop", {"function": func_name})
+            yield highlight_step("기저 조건", "순열 완성")
+            yield result_step(func_name, current)
+            yield pop_step(func_name)
             return [current]
 
         results = []
         for i, elem in enumerate(elements):
-            yield SimulationStep("highlight", {
-                "keyword": "재귀 호출",
-                "message": f"원소 {elem} 선택"
-            })
+            yield highlight_step("재귀 호출", "원소 {} 선택", (elem,))
             
             new_elements = elements[:i] + elements[i+1:]
             new_current = current + [elem]
             
-            sub_results = yield from PermutationSimulation.run(new_elements, new_current)
+            sub_results = yield PermutationSimulation._run_collect(new_elements, new_current)
             results.extend(sub_results)
 
-        yield SimulationStep("result", {
-            "result": results,
-            "function": func_name
-        })
-        yield SimulationStep("pop", {"function": func_name})
-        return results 
\ No newline at end of file
+        yield result_step(func_name, results)
+        yield pop_step(func_name)
+        return results
+
+    @staticmethod
+    def _run_stream(elements: List[int], current: List[int],
+                    used: List[bool]) -> Generator[SimulationStep, None, Any]:
+        """current와 used를 모든 호출이 공유하고 되돌려 놓는다 (결과 수와 무관하게 O(n) 메모리)"""
+        func_name = f"permutation({[e for e, u in zip(elements, used) if not u]}, {current})"
+        yield push_step(func_name)
+
+        if all(used):
+            # 완성된 순열은 여기서 한 번만 내보낸다
+            yield highlight_step("기저 조건", "순열 완성")
+            yield result_step(func_name, tuple(current))
+            yield pop_step(func_name)
+            return 1
+
+        count = 0
+        for i, elem in enumerate(elements):
+            if used[i]:
+                continue
+            yield highlight_step("재귀 호출", "원소 {} 선택", (elem,))
+
+            used[i] = True
+            current.append(elem)
+            count += yield PermutationSimulation._run_stream(elements, current, used)
+            current.pop()
+            used[i] = False
+
+        yield result_step(func_name, count)
+        yield pop_step(func_name)
+        return count
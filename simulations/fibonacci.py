@@ -1,58 +1,180 @@
-from typing import Generator, Any
+from typing import Generator, Any, Dict, Optional, Tuple
 from .base import BaseSimulation
-from models.simulation_step import SimulationStep
+from engine.trace_cache import cached_trace
+from models.cost_estimate import CostEstimate, INVALID_INPUT
+from models.simulation_step import (
+    SimulationStep, push_step, pop_step, highlight_step, result_step
+)
 
 class FibonacciSimulation(BaseSimulation):
+    # 계산 전략
+    NAIVE = "naive"                  # 단순 재귀: O(φ^n) 호출
+    MEMO = "memo"                    # 하향식 메모이제이션: O(n) 호출
+    FAST_DOUBLING = "fast_doubling"  # 빠른 배가: O(log n) 깊이
+    STRATEGIES = (NAIVE, MEMO, FAST_DOUBLING)
+
+    @staticmethod
+    def run(n: int, strategy: str = NAIVE) -> Generator[SimulationStep, None, Any]:
+        if strategy == FibonacciSimulation.NAIVE:
+            return FibonacciSimulation._run_naive(n)
+        if strategy == FibonacciSimulation.MEMO:
+            return FibonacciSimulation._run_memo(n, {})
+        if strategy == FibonacciSimulation.FAST_DOUBLING:
+            return FibonacciSimulation._run_fast_doubling(n)
+        raise ValueError(f"알 수 없는 피보나치 전략: {strategy}")
+
+    @staticmethod
+    def estimate(n: int, strategy: str = NAIVE) -> CostEstimate:
+        if n < 0:
+            return INVALID_INPUT
+        if strategy == FibonacciSimulation.NAIVE:
+            # 리프 F(n+1)개(4단계), 내부 노드 F(n+1)-1개(7단계)
+            leaves = FibonacciSimulation._fib(n + 1)
+            return CostEstimate(11 * leaves - 7, 2 * leaves - 1, max(n, 1))
+        if strategy == FibonacciSimulation.MEMO:
+            if n <= 1:
+                return CostEstimate(4, 1, 1)
+            # 내부 노드 n-1개, 리프(기저 조건 또는 메모 적중) n개
+            return CostEstimate(11 * n - 7, 2 * n - 1, n)
+        if strategy == FibonacciSimulation.FAST_DOUBLING:
+            # fibonacci(n) 5단계 + fib_pair 사슬 (n을 반씩 줄여 0까지)
+            chain = n.bit_length()
+            return CostEstimate(9 + 7 * chain, chain + 2, chain + 2)
+        raise ValueError(f"알 수 없는 피보나치 전략: {strategy}")
+
+    @staticmethod
+    def _fib(n: int) -> int:
+        a, b = 0, 1
+        for _ in range(n):
+            a, b = b, a + b
+        return a
+
     @staticmethod
-    def run(n: int) -> Generator[SimulationStep, None, Any]:
+    @cached_trace
+    def _run_naive(n: int) -> Generator[SimulationStep, None, Any]:
         func_name = f"fibonacci({n})"
-        yield SimulationStep("push", {"function": func_name})
+        yield push_step(func_name)
 
         if n < 0:
-            yield SimulationStep("result", {
-                "result": "오류: 음수 입력",
-                "function": func_name
-            })
-            yield SimulationStep("pop", {"function": func_name})
+            yield result_step(func_name, "오류: 음수 입력")
+            yield pop_step(func_name)
             return None
 
         # 기저 조건 먼저 확인
-        yield SimulationStep("highlight", {
-            "keyword": "기저 조건",
-            "message": f"n={n} 확인"
-        })
-        
+        yield highlight_step("기저 조건", "n={} 확인", (n,))
+
         if n <= 1:
-            yield SimulationStep("result", {
-                "result": n,
-                "function": func_name
-            })
-            yield SimulationStep("pop", {"function": func_name})
+            yield result_step(func_name, n)
+            yield pop_step(func_name)
             return n
 
         # 첫 번째 재귀 호출 (n-1)
-        yield SimulationStep("highlight", {
-            "keyword": "재귀 호출",
-            "message": f"fibonacci({n-1}) 계산"
-        })
-        result1 = yield from FibonacciSimulation.run(n - 1)
+        yield highlight_step("재귀 호출", "fibonacci({}) 계산", (n-1,))
+        result1 = yield FibonacciSimulation._run_naive(n - 1)
 
         # 두 번째 재귀 호출 (n-2)
-        yield SimulationStep("highlight", {
-            "keyword": "재귀 호출",
-            "message": f"fibonacci({n-2}) 계산"
-        })
-        result2 = yield from FibonacciSimulation.run(n - 2)
+        yield highlight_step("재귀 호출", "fibonacci({}) 계산", (n-2,))
+        result2 = yield FibonacciSimulation._run_naive(n - 2)
 
         # 결과 계산 및 반환
         total = result1 + result2
-        yield SimulationStep("highlight", {
-            "keyword": "반환",
-            "message": f"fibonacci({n}) = fibonacci({n-1}) + fibonacci({n-2}) = {result1} + {result2} = {total}"
-        })
-        yield SimulationStep("result", {
-            "result": total,
-            "function": func_name
-        })
-        yield SimulationStep("pop", {"function": func_name})
-        return total 
\ No newline at end of file
+        yield highlight_step(
+            "반환",
+            "fibonacci({}) = fibonacci({}) + fibonacci({}) = {} + {} = {}",
+            (n, n-1, n-2, result1, result2, total)
+        )
+        yield result_step(func_name, total)
+        yield pop_step(func_name)
+        return total
+
+    @staticmethod
+    def _run_memo(n: int, memo: Dict[int, int]) -> Generator[SimulationStep, None, Any]:
+        # 메모 적중은 별도의 리프 노드로 표시
+        if n in memo:
+            func_name = f"fibonacci({n}) [메모]"
+            yield push_step(func_name)
+            yield highlight_step("메모 확인", "fibonacci({}) 메모 적중 = {}", (n, memo[n]))
+            yield result_step(func_name, memo[n])
+            yield pop_step(func_name)
+            return memo[n]
+
+        func_name = f"fibonacci({n})"
+        yield push_step(func_name)
+
+        if n < 0:
+            yield result_step(func_name, "오류: 음수 입력")
+            yield pop_step(func_name)
+            return None
+
+        yield highlight_step("기저 조건", "n={} 확인", (n,))
+
+        if n <= 1:
+            yield result_step(func_name, n)
+            yield pop_step(func_name)
+            return n
+
+        yield highlight_step("재귀 호출", "fibonacci({}) 계산", (n-1,))
+        result1 = yield FibonacciSimulation._run_memo(n - 1, memo)
+
+        yield highlight_step("재귀 호출", "fibonacci({}) 계산", (n-2,))
+        result2 = yield FibonacciSimulation._run_memo(n - 2, memo)
+
+        total = result1 + result2
+        memo[n] = total
+        yield highlight_step(
+            "반환",
+            "fibonacci({}) = {} + {} = {} (메모에 저장)",
+            (n, result1, result2, total)
+        )
+        yield result_step(func_name, total)
+        yield pop_step(func_name)
+        return total
+
+    @staticmethod
+    def _run_fast_doubling(n: int) -> Generator[SimulationStep, None, Any]:
+        func_name = f"fibonacci({n})"
+        yield push_step(func_name)
+
+        if n < 0:
+            yield result_step(func_name, "오류: 음수 입력")
+            yield pop_step(func_name)
+            return None
+
+        yield highlight_step("재귀 호출", "fib_pair({})로 (F({}), F({})) 계산", (n, n, n+1))
+        pair = yield FibonacciSimulation._run_pair(n)
+
+        yield highlight_step("반환", "fibonacci({}) = {}", (n, pair[0]))
+        yield result_step(func_name, pair[0])
+        yield pop_step(func_name)
+        return pair[0]
+
+    @staticmethod
+    def _run_pair(n: int) -> Generator[SimulationStep, None, Optional[Tuple[int, int]]]:
+        """(F(n), F(n+1))을 빠른 배가 공식으로 계산"""
+        func_name = f"fib_pair({n})"
+        yield push_step(func_name)
+
+        yield highlight_step("기저 조건", "n={} 확인", (n,))
+
+        if n == 0:
+            yield result_step(func_name, (0, 1))
+            yield pop_step(func_name)
+            return (0, 1)
+
+        yield highlight_step("재귀 호출", "fib_pair({}) 계산", (n // 2,))
+        a, b = yield FibonacciSimulation._run_pair(n // 2)
+
+        # F(2k) = F(k)(2F(k+1) - F(k)), F(2k+1) = F(k)^2 + F(k+1)^2
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        yield highlight_step(
+            "배가 공식",
+            "F({}) = {}, F({}) = {}",
+            (n // 2 * 2, c, n // 2 * 2 + 1, d)
+        )
+
+        pair = (c, d) if n % 2 == 0 else (d, c + d)
+        yield highlight_step("반환", "fib_pair({}) = ({}, {})", (n, pair[0], pair[1]))
+        yield result_step(func_name, pair)
+        yield pop_step(func_name)
+        return pair
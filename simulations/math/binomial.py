@@ -1,53 +1,55 @@
+import math
 from typing import Generator, Any
 from ..base import BaseSimulation
-from models.simulation_step import SimulationStep
+from engine.trace_cache import cached_trace
+from models.cost_estimate import CostEstimate, INVALID_INPUT
+from models.simulation_step import (
+    SimulationStep, push_step, pop_step, highlight_step, result_step
+)
 
 class BinomialCoefficientSimulation(BaseSimulation):
     @staticmethod
+    def estimate(n: int, k: int) -> CostEstimate:
+        if n < 0 or k < 0 or k > n:
+            return INVALID_INPUT
+        if k == 0 or k == n:
+            return CostEstimate(4, 1, 1)
+        # 리프마다 1을 반환하므로 리프 C(n,k)개(4단계), 내부 노드 C(n,k)-1개(6단계)
+        leaves = math.comb(n, k)
+        return CostEstimate(10 * leaves - 6, 2 * leaves - 1, n)
+
+    @staticmethod
+    @cached_trace
     def run(n: int, k: int) -> Generator[SimulationStep, None, Any]:
         func_name = f"binomial({n}, {k})"
-        yield SimulationStep("push", {"function": func_name})
+        yield push_step(func_name)
 
         # 입력값 검증
         if n < 0 or k < 0 or k > n:
-            yield SimulationStep("result", {
-                "result": "오류: 잘못된 입력",
-                "function": func_name
-            })
-            yield SimulationStep("pop", {"function": func_name})
+            yield result_step(func_name, "오류: 잘못된 입력")
+            yield pop_step(func_name)
             return None
 
-        yield SimulationStep("highlight", {
-            "keyword": "기저 조건",
-            "message": f"n={n}, k={k} 확인"
-        })
+        yield highlight_step("기저 조건", "n={}, k={} 확인", (n, k))
 
         # 기저 조건
         if k == 0 or k == n:
-            yield SimulationStep("result", {
-                "result": 1,
-                "function": func_name
-            })
-            yield SimulationStep("pop", {"function": func_name})
+            yield result_step(func_name, 1)
+            yield pop_step(func_name)
             return 1
 
         # 재귀 호출: C(n,k) = C(n-1,k-1) + C(n-1,k)
-        yield SimulationStep("highlight", {
-            "keyword": "재귀 호출",
-            "message": f"C({n},{k}) = C({n-1},{k-1}) + C({n-1},{k}) 계산"
-        })
+        yield highlight_step("재귀 호출", "C({0},{1}) = C({2},{3}) + C({2},{1}) 계산", (n, k, n-1, k-1))
         
-        left = yield from BinomialCoefficientSimulation.run(n - 1, k - 1)
-        right = yield from BinomialCoefficientSimulation.run(n - 1, k)
+        left = yield BinomialCoefficientSimulation.run(n - 1, k - 1)
+        right = yield BinomialCoefficientSimulation.run(n - 1, k)
         
         result = left + right
-        yield SimulationStep("highlight", {
-            "keyword": "반환",
-            "message": f"C({n},{k}) = C({n-1},{k-1}) + C({n-1},{k}) = {left} + {right} = {result}"
-        })
-        yield SimulationStep("result", {
-            "result": result,
-            "function": func_name
-        })
-        yield SimulationStep("pop", {"function": func_name})
+        yield highlight_step(
+            "반환",
+            "C({0},{1}) = C({2},{3}) + C({2},{1}) = {4} + {5} = {6}",
+            (n, k, n-1, k-1, left, right, result)
+        )
+        yield result_step(func_name, result)
+        yield pop_step(func_name)
         return result 
\ No newline at end of file
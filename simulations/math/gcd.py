@@ -1,47 +1,43 @@
 from typing import Generator, Any
 from ..base import BaseSimulation
-from models.simulation_step import SimulationStep
+from models.cost_estimate import CostEstimate, INVALID_INPUT
+from models.simulation_step import (
+    SimulationStep, push_step, pop_step, highlight_step, result_step
+)
 
 class GCDSimulation(BaseSimulation):
+    @staticmethod
+    def estimate(a: int, b: int) -> CostEstimate:
+        if a < 0 or b < 0:
+            return INVALID_INPUT
+        # 유클리드 호제법의 반복 횟수만큼 사슬이 이어진다 (O(log b))
+        nodes = 1
+        while b:
+            a, b = b, a % b
+            nodes += 1
+        return CostEstimate(6 * nodes - 2, nodes, nodes)
+
     @staticmethod
     def run(a: int, b: int) -> Generator[SimulationStep, None, Any]:
         func_name = f"gcd({a}, {b})"
-        yield SimulationStep("push", {"function": func_name})
+        yield push_step(func_name)
 
         if a < 0 or b < 0:
-            yield SimulationStep("result", {
-                "result": "오류: 음수 입력",
-                "function": func_name
-            })
-            yield SimulationStep("pop", {"function": func_name})
+            yield result_step(func_name, "오류: 음수 입력")
+            yield pop_step(func_name)
             return None
 
-        yield SimulationStep("highlight", {
-            "keyword": "기저 조건",
-            "message": f"b={b} 확인"
-        })
+        yield highlight_step("기저 조건", "b={} 확인", (b,))
 
         if b == 0:
-            yield SimulationStep("result", {
-                "result": a,
-                "function": func_name
-            })
-            yield SimulationStep("pop", {"function": func_name})
+            yield result_step(func_name, a)
+            yield pop_step(func_name)
             return a
 
-        yield SimulationStep("highlight", {
-            "keyword": "재귀 호출",
-            "message": f"gcd({b}, {a}%{b}) 계산"
-        })
-        result = yield from GCDSimulation.run(b, a % b)
+        yield highlight_step("재귀 호출", "gcd({1}, {0}%{1}) 계산", (a, b))
+        result = yield GCDSimulation.run(b, a % b)
         
-        yield SimulationStep("highlight", {
-            "keyword": "반환",
-            "message": f"gcd({a}, {b}) = gcd({b}, {a}%{b}) = {result}"
-        })
-        yield SimulationStep("result", {
-            "result": result,
-            "function": func_name
-        })
-        yield SimulationStep("pop", {"function": func_name})
+        yield highlight_step("반환", "gcd({0}, {1}) = gcd({1}, {0}%{1}) = {2}", (a, b, result))
+        yield result_step(func_name, result)
+        yield pop_step(func_name)
         return result 
\ No newline at end of file
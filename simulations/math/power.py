@@ -1,57 +1,55 @@
 from typing import Generator, Any
 from ..base import BaseSimulation
-from models.simulation_step import SimulationStep
+from models.cost_estimate import CostEstimate, INVALID_INPUT
+from models.simulation_step import (
+    SimulationStep, push_step, pop_step, highlight_step, result_step
+)
 
 class PowerSimulation(BaseSimulation):
+    @staticmethod
+    def estimate(base: int, exponent: int) -> CostEstimate:
+        if exponent < 0:
+            return INVALID_INPUT
+        # 지수를 반씩 줄여 0까지: 지수의 비트 수 + 1개 노드
+        nodes = exponent.bit_length() + 1
+        return CostEstimate(6 * nodes - 2, nodes, nodes)
+
     @staticmethod
     def run(base: int, exponent: int) -> Generator[SimulationStep, None, Any]:
         func_name = f"power({base}, {exponent})"
-        yield SimulationStep("push", {"function": func_name})
+        yield push_step(func_name)
 
         if exponent < 0:
-            yield SimulationStep("result", {
-                "result": "오류: 음수 지수",
-                "function": func_name
-            })
-            yield SimulationStep("pop", {"function": func_name})
+            yield result_step(func_name, "오류: 음수 지수")
+            yield pop_step(func_name)
             return None
 
-        yield SimulationStep("highlight", {
-            "keyword": "기저 조건",
-            "message": f"지수 {exponent} 확인"
-        })
+        yield highlight_step("기저 조건", "지수 {} 확인", (exponent,))
 
         if exponent == 0:
-            yield SimulationStep("result", {
-                "result": 1,
-                "function": func_name
-            })
-            yield SimulationStep("pop", {"function": func_name})
+            yield result_step(func_name, 1)
+            yield pop_step(func_name)
             return 1
 
-        yield SimulationStep("highlight", {
-            "keyword": "재귀 호출",
-            "message": f"지수가 {'짝수' if exponent % 2 == 0 else '홀수'}인 경우 처리"
-        })
+        yield highlight_step("재귀 호출", "지수가 {}인 경우 처리", ('짝수' if exponent % 2 == 0 else '홀수',))
 
-        half = yield from PowerSimulation.run(base, exponent // 2)
+        half = yield PowerSimulation.run(base, exponent // 2)
         
         if exponent % 2 == 0:
             result = half * half
-            yield SimulationStep("highlight", {
-                "keyword": "반환",
-                "message": f"{base}^{exponent} = ({base}^{exponent//2})^2 = {half}^2 = {result}"
-            })
+            yield highlight_step(
+                "반환",
+                "{0}^{1} = ({0}^{2})^2 = {3}^2 = {4}",
+                (base, exponent, exponent//2, half, result)
+            )
         else:
             result = half * half * base
-            yield SimulationStep("highlight", {
-                "keyword": "반환",
-                "message": f"{base}^{exponent} = ({base}^{exponent//2})^2 × {base} = {half}^2 × {base} = {result}"
-            })
-
-        yield SimulationStep("result", {
-            "result": result,
-            "function": func_name
-        })
-        yield SimulationStep("pop", {"function": func_name})
+            yield highlight_step(
+                "반환",
+                "{0}^{1} = ({0}^{2})^2 × {0} = {3}^2 × {0} = {4}",
+                (base, exponent, exponent//2, half, result)
+            )
+
+        yield result_step(func_name, result)
+        yield pop_step(func_name)
         return result 
\ No newline at end of file
@@ -0,0 +1,88 @@
+import unittest
+from typing import Any, Generator, List, Tuple
+
+from engine.driver import drive
+from engine.registry import SIMULATIONS
+from models.simulation_step import SimulationStep, StepType
+from simulations import AccumulateSumSimulation, FactorialSimulation
+
+# 등록된 시뮬레이션마다 비교에 사용할 작은 입력
+SAMPLE_VALUES = {
+    'fibonacci': [7],
+    'hanoi': [4],
+    'accumulate_sum': [12],
+    'accumulate_product': [8],
+    'factorial': [8],
+    'binomial': [6, 3],
+    'gcd': [48, 18],
+    'power': [3, 10],
+    'permutation': [3],
+    'combination': [5, 2],
+}
+
+def step_key(step: SimulationStep) -> Tuple:
+    """단계를 비교 가능한 값으로 (단계 객체는 실행마다 새로 만들어진다)"""
+    return (step.kind, step.function, step.keyword, step.message, step.result, step.extra)
+
+def nested(call: Generator) -> Generator[SimulationStep, None, Any]:
+    """드라이버 이전 방식: 하위 호출마다 제너레이터를 yield from으로 위임"""
+    value = None
+    while True:
+        try:
+            item = call.send(value)
+        except StopIteration as stop:
+            return stop.value
+        if isinstance(item, SimulationStep):
+            value = None
+            yield item
+        else:
+            value = yield from nested(item)
+
+def collect(steps: Generator[SimulationStep, None, Any]) -> Tuple[List[Tuple], Any]:
+    """단계 스트림을 끝까지 실행해 (단계 목록, 반환값)을 반환"""
+    keys = []
+    while True:
+        try:
+            keys.append(step_key(next(steps)))
+        except StopIteration as stop:
+            return keys, stop.value
+
+class DriverTest(unittest.TestCase):
+    def test_every_simulation_has_sample_values(self):
+        self.assertEqual(set(SIMULATIONS), set(SAMPLE_VALUES))
+
+    def test_matches_nested_delegation(self):
+        for name, spec in SIMULATIONS.items():
+            for strategy in (None,) + spec.strategies:
+                with self.subTest(simulation=name, strategy=strategy):
+                    args = spec.build_args(SAMPLE_VALUES[name])
+                    kwargs = {} if strategy is None else {'strategy': strategy}
+                    expected = collect(nested(spec.simulation.run(*args, **kwargs)))
+                    actual = collect(drive(spec.simulation.run(*args, **kwargs)))
+                    self.assertEqual(actual, expected)
+                    self.assertTrue(expected[0])
+
+    def test_start_uses_driver(self):
+        spec = SIMULATIONS['fibonacci']
+        self.assertEqual(
+            collect(spec.create([6])),
+            collect(nested(spec.simulation.run(*spec.build_args([6]))))
+        )
+
+    def test_deep_recursion(self):
+        # yield from 사슬이었다면 파이썬 재귀 한도를 넘는 깊이
+        for simulation, n in ((AccumulateSumSimulation, 5000), (FactorialSimulation, 3000)):
+            with self.subTest(simulation=simulation.__name__):
+                depth = 0
+                deepest = 0
+                for step in simulation.start(n):
+                    if step.kind is StepType.PUSH:
+                        depth += 1
+                        deepest = max(deepest, depth)
+                    elif step.kind is StepType.POP:
+                        depth -= 1
+                self.assertEqual(depth, 0)
+                self.assertGreaterEqual(deepest, n)
+
+if __name__ == '__main__':
+    unittest.main()
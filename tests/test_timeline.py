@@ -0,0 +1,96 @@
+import random
+import unittest
+
+from engine.registry import SIMULATIONS
+from engine.timeline import Timeline
+from models.call_tree import CallTreeManager
+from tests.test_driver import SAMPLE_VALUES, step_key
+
+# 체크포인트를 자주 지나도록 작은 간격을 쓴다
+INTERVAL = 7
+NAMES = ('fibonacci', 'hanoi', 'permutation', 'accumulate_sum', 'combination')
+
+def new_timeline(name, **options):
+    spec = SIMULATIONS[name]
+    return Timeline(spec.create(SAMPLE_VALUES[name]), CallTreeManager(), INTERVAL, **options)
+
+def state(timeline):
+    """위치, 트리 구조, 배치 결과, 화면 상태"""
+    manager = timeline.manager
+    count = manager.call_id_counter
+    units = tuple(float(x) for x in manager.layout.positions(manager.stack)[0]) if count else ()
+    return (
+        timeline.position, count, tuple(manager.stack), manager.level_count,
+        tuple(manager.parents), tuple(manager.label_ids), tuple(manager.done_flags),
+        tuple(tuple(manager.iter_children(node_id)) for node_id in range(count)),
+        units,
+        tuple(step_key(step) if step is not None else None for step in timeline.view),
+    )
+
+def linear_states(name):
+    """처음부터 한 단계씩 진행하며 모은 위치별 상태"""
+    timeline = new_timeline(name)
+    states = [state(timeline)]
+    while timeline.step_forward() is not None:
+        states.append(state(timeline))
+    return states
+
+class TimelineSeekTest(unittest.TestCase):
+    def test_random_seek_matches_linear_replay(self):
+        for name in NAMES:
+            with self.subTest(simulation=name):
+                expected = linear_states(name)
+                timeline = new_timeline(name)
+                rng = random.Random(name)
+                for _ in range(200):
+                    target = rng.randrange(len(expected) + 2)
+                    position = timeline.seek(target)
+                    self.assertEqual(position, min(target, len(expected) - 1))
+                    self.assertEqual(state(timeline), expected[position])
+
+    def test_seek_to_start_and_end(self):
+        expected = linear_states('hanoi')
+        timeline = new_timeline('hanoi')
+        end = timeline.seek(10 ** 9)
+        self.assertTrue(timeline.at_end)
+        self.assertEqual(state(timeline), expected[end])
+        self.assertEqual(timeline.seek(-5), 0)
+        self.assertEqual(state(timeline), expected[0])
+        self.assertEqual(timeline.seek(end), end)
+        self.assertEqual(state(timeline), expected[end])
+
+class TimelineStepTest(unittest.TestCase):
+    def test_random_steps_match_linear_replay(self):
+        for name in NAMES:
+            # 작은 상한이면 되돌리기 로그가 잘려 체크포인트 복원으로도 돌아간다
+            for undo_limit in (5, None):
+                with self.subTest(simulation=name, undo_limit=undo_limit):
+                    expected = linear_states(name)
+                    timeline = new_timeline(name, undo_limit=undo_limit)
+                    rng = random.Random(name)
+                    for _ in range(400):
+                        choice = rng.random()
+                        if choice < 0.4:
+                            at_start = timeline.position == 0
+                            self.assertEqual(timeline.step_back() is None, at_start)
+                        elif choice < 0.8:
+                            timeline.step_forward()
+                        else:
+                            timeline.seek(rng.randrange(len(expected)))
+                        self.assertEqual(state(timeline), expected[timeline.position])
+
+    def test_step_back_returns_undone_step(self):
+        timeline = new_timeline('fibonacci')
+        applied = [timeline.step_forward() for _ in range(3 * INTERVAL)]
+        for step in reversed(applied):
+            self.assertIs(timeline.step_back(), step)
+        self.assertIsNone(timeline.step_back())
+        self.assertEqual(timeline.position, 0)
+
+    def test_undo_log_is_bounded(self):
+        timeline = new_timeline('fibonacci')
+        timeline.seek(10 ** 9)
+        self.assertLessEqual(timeline.undo_stats()['entries'], INTERVAL)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+from engine.registry import SIMULATIONS
+from engine.trace_cache import TraceCache
+from tests.test_driver import SAMPLE_VALUES, collect
+
+class TraceCacheTest(unittest.TestCase):
+    def run_all(self, name, cache=None):
+        """모든 전략으로 실행한 (단계 목록, 반환값) 목록"""
+        spec = SIMULATIONS[name]
+        runs = []
+        for strategy in (None,) + spec.strategies:
+            if cache is None:
+                runs.append(collect(spec.create(SAMPLE_VALUES[name], strategy)))
+            else:
+                with cache.activate():
+                    runs.append(collect(spec.create(SAMPLE_VALUES[name], strategy)))
+        return runs
+
+    def test_cached_replay_matches_uncached_run(self):
+        for name in SIMULATIONS:
+            with self.subTest(simulation=name):
+                expected = self.run_all(name)
+                cache = TraceCache()
+                self.assertEqual(self.run_all(name, cache), expected)
+                # 두 번째 실행은 캐시에 저장된 기록을 재생한다
+                self.assertEqual(self.run_all(name, cache), expected)
+
+    def test_repeated_subcalls_hit(self):
+        cache = TraceCache()
+        with cache.activate():
+            steps, value = collect(SIMULATIONS['fibonacci'].create([12]))
+        self.assertEqual(value, 144)
+        self.assertGreater(cache.hits, 0)
+        self.assertEqual(cache.stats()['entries'], len(cache))
+
+    def test_bounded_cache_matches_uncached_run(self):
+        expected = self.run_all('fibonacci')[0]
+        for bounds in ({'max_entries': 2}, {'max_steps': 40}, {'max_entry_steps': 10}):
+            with self.subTest(**bounds):
+                cache = TraceCache(**bounds)
+                with cache.activate():
+                    actual = collect(SIMULATIONS['fibonacci'].create(SAMPLE_VALUES['fibonacci']))
+                self.assertEqual(actual, expected)
+                self.assertLessEqual(len(cache), cache.max_entries)
+                self.assertLessEqual(cache.total_steps, cache.max_steps)
+                for entry_steps, _ in cache._entries.values():
+                    self.assertLessEqual(len(entry_steps), cache.max_entry_steps)
+
+    def test_inactive_outside_context(self):
+        cache = TraceCache()
+        with cache.activate():
+            self.assertIs(TraceCache.active, cache)
+        self.assertIsNone(TraceCache.active)
+        collect(SIMULATIONS['fibonacci'].create([6]))
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 0, 0))
+
+if __name__ == '__main__':
+    unittest.main()
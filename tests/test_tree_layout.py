@@ -0,0 +1,92 @@
+import random
+import unittest
+
+from engine.registry import SIMULATIONS
+from engine.timeline import Timeline
+from models.call_tree import CallTreeManager
+from models.simulation_step import StepType
+from tests.test_driver import SAMPLE_VALUES
+
+# 좌표는 float32로 저장되므로 비교에 여유를 둔다
+TOLERANCE = 1e-3
+
+def build(name, values=None):
+    """시뮬레이션을 끝까지 실행한 호출 트리 (Timeline 없이)"""
+    manager = CallTreeManager()
+    for step in SIMULATIONS[name].create(values or SAMPLE_VALUES[name]):
+        if step.kind is StepType.PUSH:
+            manager.push(step.function)
+        elif step.kind is StepType.POP:
+            manager.pop()
+    return manager
+
+class TidyTreeLayoutTest(unittest.TestCase):
+    def assert_tidy(self, manager):
+        """같은 깊이의 이웃 노드는 최소 간격(1) 이상 떨어지고 부모는 자식들의 가운데에 온다"""
+        xs, span = manager.layout.positions(manager.stack)
+        xs = [float(x) for x in xs]
+        self.assertAlmostEqual(min(xs), 0.0, delta=TOLERANCE)
+        self.assertAlmostEqual(max(xs), span, delta=TOLERANCE)
+        previous = {}
+        # 전위 순서에서 같은 깊이의 노드는 왼쪽부터 나온다
+        for node_id, x in enumerate(xs):
+            depth = manager.depths[node_id]
+            if depth in previous:
+                self.assertGreaterEqual(x - previous[depth], 1.0 - TOLERANCE, (node_id, depth))
+            previous[depth] = x
+            children = list(manager.iter_children(node_id))
+            if children:
+                self.assertAlmostEqual(x, (xs[children[0]] + xs[children[-1]]) / 2,
+                                       delta=TOLERANCE, msg=node_id)
+
+    def test_finished_trees(self):
+        for name in SIMULATIONS:
+            with self.subTest(simulation=name):
+                self.assert_tidy(build(name))
+
+    def test_larger_trees(self):
+        for name, values in (('fibonacci', [14]), ('hanoi', [8]), ('permutation', [5]),
+                             ('binomial', [10, 5])):
+            with self.subTest(simulation=name):
+                self.assert_tidy(build(name, values))
+
+    def test_running_calls(self):
+        # 진행 중인 호출도 임시로 마무리해 같은 규칙으로 배치된다
+        for name in ('fibonacci', 'hanoi', 'combination'):
+            with self.subTest(simulation=name):
+                manager = CallTreeManager()
+                timeline = Timeline(SIMULATIONS[name].create(SAMPLE_VALUES[name]), manager, 7)
+                end = timeline.seek(10 ** 9)
+                rng = random.Random(name)
+                for _ in range(50):
+                    timeline.seek(rng.randrange(1, end + 1))
+                    if manager.call_id_counter:
+                        self.assert_tidy(manager)
+
+    def test_compact_shapes(self):
+        # 자식이 하나뿐인 사슬은 한 줄로, 완전 이진 트리는 잎 간격 1로 놓인다
+        self.assertEqual(build('factorial', [20]).layout.positions([])[1], 0.0)
+        hanoi = build('hanoi', [4])
+        self.assertAlmostEqual(hanoi.layout.positions([])[1], 2 ** 3 - 1, delta=TOLERANCE)
+
+    def test_positions_leave_layout_unchanged(self):
+        manager = CallTreeManager()
+        timeline = Timeline(SIMULATIONS['fibonacci'].create([8]), manager, 7)
+        timeline.seek(100)
+        layout = manager.layout
+        before = [list(column) if not isinstance(column, dict) else dict(column)
+                  for column in layout._columns]
+        first = [float(x) for x in layout.positions(manager.stack)[0]]
+        after = [list(column) if not isinstance(column, dict) else dict(column)
+                 for column in layout._columns]
+        self.assertEqual(after, before)
+        self.assertEqual([float(x) for x in layout.positions(manager.stack)[0]], first)
+
+    def test_no_journal_without_timeline(self):
+        manager = build('fibonacci', [10])
+        manager.layout.positions(manager.stack)
+        self.assertFalse(manager.layout.recording)
+        self.assertEqual(len(manager.layout._log_columns), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+from typing import Dict, Hashable, Optional
+
+from models.call_tree import CallTreeManager
+
+# 프레임 사이 간격의 상한 (멈췄다 다시 시작할 때 한 번에 크게 뛰지 않도록)
+MAX_FRAME_INTERVAL = 0.25
+
+class Tween:
+    """start에서 end까지 duration초 동안 선형으로 변하는 값"""
+    __slots__ = ('start', 'end', 'duration', 'elapsed')
+
+    def __init__(self, start: float, end: float, duration: float):
+        self.start = start
+        self.end = end
+        self.duration = duration
+        self.elapsed = 0.0
+
+    @property
+    def value(self) -> float:
+        if self.finished:
+            return self.end
+        return self.start + (self.end - self.start) * (self.elapsed / self.duration)
+
+    @property
+    def finished(self) -> bool:
+        return self.elapsed >= self.duration
+
+    def advance(self, elapsed: float) -> None:
+        self.elapsed += elapsed
+
+class AnimationEngine:
+    """경과 시간으로 모든 애니메이션을 진행하는 엔진
+
+    노드별 위치 이동과 나타나기는 CallTreeManager의 열에서, 강조 빛 같은 개별
+    값은 Tween으로 진행한다. 프레임이 늦어져도 같은 시간에 같은 만큼 움직이고,
+    움직일 것이 없으면 active가 False가 되어 호출하는 쪽이 타이머를 멈출 수 있다.
+    """
+
+    def __init__(self, node_fade_duration: float = 0.5, highlight_duration: float = 0.5):
+        self.manager: Optional[CallTreeManager] = None
+        self.node_fade_duration = node_fade_duration
+        self.highlight_duration = highlight_duration
+        self._tweens: Dict[Hashable, Tween] = {}
+        self._last_time: Optional[float] = None
+
+    def set_manager(self, manager: Optional[CallTreeManager]) -> None:
+        self.manager = manager
+
+    def animate(self, key: Hashable, start: float, end: float, duration: float) -> None:
+        """key 값의 트윈을 새로 시작 (같은 key의 이전 트윈은 대체)"""
+        self._tweens[key] = Tween(start, end, duration)
+
+    def value(self, key: Hashable, default: float = 0.0) -> float:
+        tween = self._tweens.get(key)
+        return tween.value if tween is not None else default
+
+    @property
+    def active(self) -> bool:
+        """다음 프레임에 진행할 애니메이션이 있는지"""
+        manager = self.manager
+        return bool(self._tweens) or (
+            manager is not None and (manager.needs_layout or manager.animating)
+        )
+
+    def tick(self, now: float) -> bool:
+        """now(초)까지 애니메이션을 진행하고, 계속 진행할 것이 있는지 반환"""
+        last = self._last_time
+        self._last_time = now
+        elapsed = 0.0 if last is None else min(max(now - last, 0.0), MAX_FRAME_INTERVAL)
+
+        if self.manager is not None:
+            self.manager.advance(elapsed, self.node_fade_duration)
+
+        finished = []
+        for key, tween in self._tweens.items():
+            tween.advance(elapsed)
+            if tween.finished:
+                finished.append(key)
+        for key in finished:
+            del self._tweens[key]
+
+        active = self.active
+        if not active:
+            # 쉬었다가 다시 시작할 때 쉰 시간이 한 프레임으로 잡히지 않도록
+            self._last_time = None
+        return active
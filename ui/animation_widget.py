@@ -1,118 +1,215 @@
-from typing import Optional, Dict, TYPE_CHECKING
+import time
+from itertools import compress
+from typing import Optional, List
 from PyQt5.QtWidgets import QWidget
-from PyQt5.QtCore import QTimer, Qt, QRect
+from PyQt5.QtCore import Qt, QRect, QLineF, QPointF, pyqtSignal
 from PyQt5.QtGui import (
     QPainter, QPen, QColor, QLinearGradient, QRadialGradient, 
-    QPainterPath, QFont
+    QPainterPath, QFont, QPolygonF
 )
 
-from models.call_tree import CallTreeManager
-from models.simulation_step import SimulationStep
+from config.settings import Settings
+from models.call_tree import CallTreeManager, NO_NODE
+from utils.exceptions import LayoutError
+from utils.metrics import Metrics
 from ui.styles import Styles
+from ui.animation_engine import AnimationEngine
+from ui.frame_scheduler import FrameScheduler
+from ui.node_sprites import NodeSpriteCache
+from ui.spatial_index import NodeGrid
 
-if TYPE_CHECKING:
-    from models.call_tree import Node
+try:
+    import numpy as np
+except ImportError:  # NumPy가 없으면 보이는 노드를 NodeGrid에서 고른다
+    np = None
+
+# 세부 표현 수준: 이름이 있는 노드와 곡선 간선 / 작은 원과 직선 간선 / 점과 직선 간선
+LOD_FULL, LOD_SIMPLE, LOD_DOTS = range(3)
+# 픽셀 좌표를 16비트 키로 바꿀 때 더하는 값 (화면 밖 음수 좌표용)
+PIXEL_KEY_OFFSET = 1 << 15
+# 노드가 작게 그려져도 마우스로 고를 수 있는 최소 반지름 (픽셀)
+MIN_PICK_RADIUS = 4
+
+def _polygon(points) -> QPolygonF:
+    """(n, 2) float64 배열을 점마다 객체를 만들지 않고 QPolygonF로 복사"""
+    polygon = QPolygonF()
+    polygon.fill(QPointF(), len(points))
+    if len(points):
+        buffer = polygon.data()
+        buffer.setsize(points.nbytes)
+        np.frombuffer(buffer, dtype=np.float64).reshape(-1, 2)[:] = points
+    return polygon
 
 class AnimationWidget(QWidget):
-    def __init__(self, parent: Optional[QWidget] = None):
+    # 클릭한 노드 id
+    nodeClicked = pyqtSignal(int)
+
+    def __init__(self, parent: Optional[QWidget] = None,
+                 scheduler: Optional[FrameScheduler] = None):
         super().__init__(parent)
         self.message = ""
         self.call_tree_manager: Optional[CallTreeManager] = None
         self.dark_mode = False
         
-        # 애니메이션 효과를 위한 속성들
+        # 강조 표시할 노드 (빛의 세기는 애니메이션 엔진의 트윈)
         self.highlight_node = None
-        self.highlight_alpha = 0
-        self.fade_timer = QTimer()
-        self.fade_timer.timeout.connect(self.updateHighlight)
-        self.fade_timer.setInterval(50)  # 20fps
         
         # 노드 스타일 설정
         self.node_radius = 25
         self.node_spacing = 120
         self.level_height = 100
         
-        # 애니메이션 상태
-        self.animation_progress = 0
-        self.animation_timer = QTimer()
-        self.animation_timer.timeout.connect(self.updateAnimation)
-        self.animation_timer.setInterval(16)  # 약 60fps
-        
         # 색상 설정
         self.colors = Styles.get_colors(self.dark_mode)
-
-        # 레이아웃 업데이트 타이머 추가
-        self.layout_timer = QTimer()
-        self.layout_timer.timeout.connect(self.updateLayout)
-        self.layout_timer.setInterval(16)  # 60fps
-        self.layout_timer.start()
+        # 노드 이미지 캐시 (라벨, 상태, 테마, 크기, 화면 배율별)
+        self.sprites = NodeSpriteCache()
+        # 마우스 위치의 노드를 찾는 격자 색인
+        self.node_grid = NodeGrid()
 
         # 애니메이션 설정
         self.animation_settings = {
             'node_fade_duration': 500,    # ms
             'edge_animation_duration': 300,# ms
-            'highlight_duration': 1000,    # ms
-            'smooth_factor': 0.1          # 부드러운 이동 계수
+            'highlight_duration': 500,     # ms
         }
+
+        # 레이아웃, 노드 이동, 강조 빛을 프레임 스케줄러의 작업 하나로 진행
+        # (진행할 애니메이션이 없으면 작업이 잠든다)
+        self.animation = AnimationEngine(
+            self.animation_settings['node_fade_duration'] / 1000,
+            self.animation_settings['highlight_duration'] / 1000
+        )
+        self.scheduler = scheduler if scheduler is not None else FrameScheduler(self)
+        self.scheduler.add('animation', self.advanceFrame, repeat=True)
+
+        # 부모 레이아웃에서 높이가 0으로 줄어들지 않도록
+        self.setMinimumSize(400, 300)
         
         # 툴팁 활성화
         self.setToolTip("재귀 호출 트리 시각화")
         self.setMouseTracking(True)  # 마우스 이동 추적
 
+        # 프레임 시간 지표와 화면 표시(HUD) 여부
+        self.metrics = Metrics()
+        self.show_hud = False
+
     def setDarkMode(self, enabled: bool):
         self.dark_mode = enabled
         self.colors = Styles.get_colors(enabled)
-        self.update()
+        self.scheduler.request_repaint(self)
         
-    def updateAnimation(self):
-        smooth_factor = self.animation_settings['smooth_factor']
-        self.animation_progress = min(1.0, self.animation_progress + smooth_factor)
-        self.update()
-        if self.animation_progress >= 1.0:
-            self.animation_timer.stop()
+    def setShowHud(self, enabled: bool):
+        self.show_hud = enabled
+        self.scheduler.request_repaint(self)
 
     def setMessage(self, msg: str):
         self.message = msg
-        self.update()
+        self.scheduler.request_repaint(self)
 
     def setCallTreeManager(self, manager: CallTreeManager):
         self.call_tree_manager = manager
+        self.animation.set_manager(manager)
+        self.node_grid.reset(manager)
         if manager:
             manager.node_radius = self.node_radius
-            manager.update_layout(self.width(), self.height())
-        self.animation_progress = 0
-        self.animation_timer.start()
+        self.scheduleFrame()
 
     def highlightNode(self, node_id: int):
         self.highlight_node = node_id
-        self.highlight_alpha = 255
-        self.fade_timer.start()
-        
-    def updateHighlight(self):
-        fade_step = 255 / (self.animation_settings['node_fade_duration'] / 50)
-        self.highlight_alpha = max(0, self.highlight_alpha - fade_step)
-        if self.highlight_alpha == 0:
-            self.fade_timer.stop()
-        self.update()
+        self.animation.animate('highlight', 255, 0, self.animation.highlight_duration)
+        self.scheduleFrame()
+
+    @property
+    def highlight_alpha(self) -> float:
+        return self.animation.value('highlight')
+
+    def scheduleFrame(self):
+        """트리나 애니메이션이 바뀌었음을 알리고 다음 프레임에 진행하도록 예약"""
+        self.node_grid.invalidate()
+        self.scheduler.wake('animation')
+        self.scheduler.request_repaint(self)
+
+    def advanceFrame(self):
+        """한 프레임: 필요하면 레이아웃을 다시 계산하고 경과 시간만큼 애니메이션 진행"""
+        with self.metrics.timer('animation.ms'):
+            manager = self.call_tree_manager
+            if manager is not None and manager.needs_layout:
+                try:
+                    manager.update_layout(self.width(), self.height())
+                except LayoutError:
+                    pass  # 기본 배치로 대체되었고 오류는 이미 기록됨
+            if not self.animation.tick(time.perf_counter()):
+                self.scheduler.sleep('animation')
+            self.node_grid.invalidate()
+            self.scheduler.request_repaint(self)
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
         if self.call_tree_manager:
             self.call_tree_manager.update_layout(self.width(), self.height())
+        self.scheduleFrame()
 
     def paintEvent(self, event):
+        start = time.perf_counter()
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
         self.drawBackground(painter)
         
-        if self.call_tree_manager and self.call_tree_manager.nodes:
-            self.drawEdges(painter)
-            self.drawNodes(painter)
+        manager = self.call_tree_manager
+        if manager and manager.call_id_counter:
+            # 보이는 영역(과 노드 크기만큼의 여유) 밖의 노드와 간선은 그리지 않는다
+            lod = self._level_of_detail()
+            node_ids, edge_ids = self._visible(event.rect(), self.node_radius * 2,
+                                               as_list=lod != LOD_DOTS)
+            self.drawEdges(painter, edge_ids, lod)
+            self.drawNodes(painter, node_ids, lod)
             self.drawHighlights(painter)
+            self.metrics.gauge('paint.visible_nodes').set(len(node_ids))
         
         self.drawMessage(painter)
 
+        # HUD는 직전 프레임까지의 값을 표시한다
+        if self.show_hud:
+            self.drawHud(painter)
+        self.metrics.counter('paint.frames').inc()
+        self.metrics.histogram('paint.ms').observe((time.perf_counter() - start) * 1000)
+
+    def drawHud(self, painter: QPainter):
+        """왼쪽 위에 프레임 시간과 처리량 표시"""
+        metrics = self.metrics
+        paint = metrics.histogram('paint.ms')
+        layout = metrics.histogram('layout.ms')
+        animation = metrics.histogram('animation.ms')
+        steps = metrics.histogram('steps.ms')
+        rows = [
+            ("FPS", f"{metrics.counter('paint.frames').rate():.1f}"),
+            ("그리기", f"{paint.last:.2f} ms (p95 {paint.quantile(0.95):.2f})"),
+            ("레이아웃", f"{layout.last:.2f} ms (p95 {layout.quantile(0.95):.2f})"),
+            ("애니메이션", f"{animation.last:.2f} ms (p95 {animation.quantile(0.95):.2f})"),
+            ("단계 처리", f"{steps.last:.2f} ms (p95 {steps.quantile(0.95):.2f})"),
+            ("단계/초", f"{metrics.counter('steps').rate():,.0f}"),
+            ("노드", f"{int(metrics.gauge('tree.nodes').value):,}"),
+        ]
+        painter.setFont(QFont("Arial", 9))
+        font_metrics = painter.fontMetrics()
+        line_height = font_metrics.height()
+        label_width = max(font_metrics.horizontalAdvance(label) for label, _ in rows)
+        value_width = max(font_metrics.horizontalAdvance(value) for _, value in rows)
+        hud_rect = QRect(10, 10, label_width + value_width + 28, line_height * len(rows) + 12)
+
+        painter.setOpacity(1.0)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(0, 0, 0, 160))
+        painter.drawRoundedRect(hud_rect, 6, 6)
+        painter.setPen(QPen(QColor(230, 230, 230)))
+        for row, (label, value) in enumerate(rows):
+            top = hud_rect.top() + 6 + line_height * row
+            painter.drawText(QRect(hud_rect.left() + 8, top, label_width, line_height),
+                             Qt.AlignLeft | Qt.AlignVCenter, label)
+            painter.drawText(QRect(hud_rect.right() - 8 - value_width, top, value_width, line_height),
+                             Qt.AlignRight | Qt.AlignVCenter, value)
+
     def drawBackground(self, painter: QPainter):
         gradient = QLinearGradient(0, 0, 0, self.height())
         gradient.setColorAt(0, self.colors['background_start'])
@@ -127,119 +224,226 @@ class AnimationWidget(QWidget):
         for i in range(0, self.height(), grid_size):
             painter.drawLine(0, i, self.width(), i)
 
-    def drawEdges(self, painter: QPainter):
-        if not self.call_tree_manager:
-            return
-            
-        for node in self.call_tree_manager.nodes.values():
-            if node.parent is not None:
-                parent = self.call_tree_manager.nodes[node.parent]
-                
+    def _level_of_detail(self) -> int:
+        """형제 노드 간격(화면에서 노드가 차지하는 크기)에 따른 세부 표현 수준"""
+        spacing = self.call_tree_manager.node_spacing
+        if spacing >= Settings.UI.LOD_LABEL_SPACING:
+            return LOD_FULL
+        if spacing >= Settings.UI.LOD_DOT_SPACING:
+            return LOD_SIMPLE
+        return LOD_DOTS
+
+    def _circle_radius(self) -> int:
+        """LOD_SIMPLE에서 형제 간격에 맞춰 그리는 원의 반지름"""
+        return max(2, min(self.node_radius, int(self.call_tree_manager.node_spacing * 0.45)))
+
+    def _dot_size(self) -> float:
+        """LOD_DOTS에서 그리는 점의 크기"""
+        return max(2.0, self.call_tree_manager.node_spacing * 0.8)
+
+    def _visible(self, rect: QRect, margin: int, as_list: bool = True):
+        """rect(여유 margin 포함)에 걸치는 노드 id와, 그 안을 지나는 간선의 자식 id
+
+        아직 나타나지 않은(불투명도 0) 노드는 제외한다. NumPy가 있고 as_list가
+        False이면 id를 배열 그대로 반환한다 (점 표시에서 다시 배열 연산에 쓴다).
+        NumPy가 없으면 모든 노드가 영역 안에 있을 때(보통의 전체 다시 그리기)는
+        좌표를 하나씩 비교하지 않고, 일부만 다시 그릴 때는 NodeGrid로 주변 칸만 본다.
+        """
+        manager = self.call_tree_manager
+        count = manager.call_id_counter
+        left, right = rect.left() - margin, rect.right() + margin
+        top, bottom = rect.top() - margin, rect.bottom() + margin
+        if np is not None:
+            xs = np.frombuffer(manager.xs, dtype=np.float32, count=count)
+            ys = np.frombuffer(manager.ys, dtype=np.float32, count=count)
+            shown = np.frombuffer(manager.alphas, dtype=np.float32, count=count) > 0
+            parents = np.frombuffer(manager.parents, dtype=np.int32, count=count)
+            inside = shown & (xs >= left) & (xs <= right) & (ys >= top) & (ys <= bottom)
+            # 간선은 양 끝점을 감싸는 사각형이 영역과 겹치면 그린다
+            px = xs[parents]
+            py = ys[parents]
+            crossing = shown & (parents != NO_NODE) & \
+                (np.maximum(xs, px) >= left) & (np.minimum(xs, px) <= right) & \
+                (np.maximum(ys, py) >= top) & (np.minimum(ys, py) <= bottom)
+            node_ids, edge_ids = np.flatnonzero(inside), np.flatnonzero(crossing)
+            if as_list:
+                return node_ids.tolist(), edge_ids.tolist()
+            return node_ids, edge_ids
+
+        xs, ys, alphas, parents = manager.xs, manager.ys, manager.alphas, manager.parents
+        min_x, max_x = min(xs), max(xs)
+        if left <= min_x and max_x <= right and top <= min(ys) and max(ys) <= bottom:
+            # 간선도 양 끝점이 모두 영역 안에 있다
+            node_ids = list(compress(range(count), alphas))
+            return node_ids, [node_id for node_id in node_ids if parents[node_id] != NO_NODE]
+
+        grid = self.node_grid
+        grid.set_radius(self._pick_radius())
+        node_ids = sorted(
+            node_id for node_id in grid.nodes_in(left, top, right, bottom)
+            if alphas[node_id] > 0 and left <= xs[node_id] <= right and top <= ys[node_id] <= bottom
+        )
+        # 자식은 부모보다 층 간격만큼 아래에 있으므로, 영역을 지나는 간선의 자식은
+        # 영역 아래로 층 간격만큼 넓힌 띠 안에 있다 (가로 위치는 어디든)
+        edge_ids = []
+        for node_id in grid.nodes_in(min_x, top, max_x, bottom + manager.level_spacing):
+            parent = parents[node_id]
+            if parent == NO_NODE or alphas[node_id] <= 0:
+                continue
+            x, y = xs[node_id], ys[node_id]
+            px, py = xs[parent], ys[parent]
+            if max(x, px) >= left and min(x, px) <= right and \
+                    max(y, py) >= top and min(y, py) <= bottom:
+                edge_ids.append(node_id)
+        edge_ids.sort()
+        return node_ids, edge_ids
+
+    def _pixel_batches(self, node_ids: List[int], with_parent: bool):
+        """노드(와 부모)의 정수 픽셀 좌표를 (진행 중, 완료) 두 묶음으로, 같은 좌표는 한 번만
+
+        NumPy가 있으면 그대로 그릴 수 있는 QPolygonF(간선은 두 점씩 한 선분)로,
+        없으면 QPointF/QLineF 목록으로 반환한다.
+        """
+        manager = self.call_tree_manager
+        if np is not None:
+            count = manager.call_id_counter
+            ids = np.asarray(node_ids, dtype=np.intp)
+            xs = np.frombuffer(manager.xs, dtype=np.float32, count=count)
+            ys = np.frombuffer(manager.ys, dtype=np.float32, count=count)
+            done = np.frombuffer(manager.done_flags, dtype=np.uint8, count=count)[ids]
+            columns = [xs[ids], ys[ids]]
+            if with_parent:
+                parents = np.frombuffer(manager.parents, dtype=np.int32, count=count)[ids]
+                columns += [xs[parents], ys[parents]]
+            # 좌표마다 16비트씩 이어 붙인 정수 키로 중복 제거 (화면 크기는 ±32767 이내)
+            pixels = np.clip(np.column_stack(columns), -PIXEL_KEY_OFFSET, PIXEL_KEY_OFFSET - 1)
+            pixels = pixels.astype(np.int64)
+            keys = np.zeros(len(ids), dtype=np.uint64)
+            for column in range(pixels.shape[1]):
+                keys <<= np.uint64(16)
+                keys |= (pixels[:, column] + PIXEL_KEY_OFFSET).astype(np.uint64)
+            batches = []
+            for flag in (0, 1):
+                group = np.flatnonzero(done == flag)
+                _, first = np.unique(keys[group], return_index=True)
+                # 간선은 두 점씩 한 선분
+                points = pixels[group[first]].reshape(-1, 2)
+                batches.append(_polygon(points.astype(np.float64)))
+            return batches
+
+        xs, ys, parents, done_flags = manager.xs, manager.ys, manager.parents, manager.done_flags
+        batches = (set(), set())
+        for node_id in node_ids:
+            if with_parent:
+                parent = parents[node_id]
+                row = (int(xs[node_id]), int(ys[node_id]), int(xs[parent]), int(ys[parent]))
+            else:
+                row = (int(xs[node_id]), int(ys[node_id]))
+            batches[done_flags[node_id]].add(row)
+        return (
+            [QLineF(*row) if with_parent else QPointF(*row) for row in batch]
+            for batch in batches
+        )
+
+    def drawEdges(self, painter: QPainter, edge_ids: List[int], lod: int):
+        manager = self.call_tree_manager
+        xs, ys, alphas = manager.xs, manager.ys, manager.alphas
+        parents, done_flags = manager.parents, manager.done_flags
+        colors = (self.colors['edge_active'], self.colors['edge_inactive'])
+
+        if lod == LOD_FULL:
+            for node_id in edge_ids:
+                parent = parents[node_id]
+                painter.setOpacity(alphas[node_id])
+
                 path = QPainterPath()
-                start_x = node.x
-                start_y = node.y
-                end_x = parent.x
-                end_y = parent.y
-                
+                start_x = xs[node_id]
+                start_y = ys[node_id]
+                end_x = xs[parent]
+                end_y = ys[parent]
+
                 # 제어점 계산
                 ctrl1_x = start_x
                 ctrl1_y = start_y - (start_y - end_y) * 0.5
                 ctrl2_x = end_x
                 ctrl2_y = end_y + (start_y - end_y) * 0.5
-                
+
                 path.moveTo(start_x, start_y)
                 path.cubicTo(ctrl1_x, ctrl1_y, ctrl2_x, ctrl2_y, end_x, end_y)
-                
-                gradient = QLinearGradient(start_x, start_y, end_x, end_y)
-                if node.done:
-                    gradient.setColorAt(0, self.colors['edge_inactive'])
-                    gradient.setColorAt(1, self.colors['edge_inactive'])
-                else:
-                    gradient.setColorAt(0, self.colors['edge_active'])
-                    gradient.setColorAt(1, self.colors['edge_active'])
-                
-                pen = QPen()
-                pen.setBrush(gradient)
-                pen.setWidth(2)
-                painter.setPen(pen)
+
+                painter.setPen(QPen(colors[done_flags[node_id]], 2))
                 painter.drawPath(path)
+            painter.setOpacity(1.0)
+            return
+
+        # 축소된 화면에서는 직선을 색깔별로 모아 한 번에 그린다
+        if lod == LOD_DOTS:
+            # 픽셀보다 작은 노드는 나타나는 효과 없이, 같은 픽셀을 잇는 간선은 한 번만
+            batches = tuple(self._pixel_batches(edge_ids, with_parent=True))
+        else:
+            # 나타나는 중인 간선만 따로 투명도를 적용
+            batches = ([], [])
+            for node_id in edge_ids:
+                parent = parents[node_id]
+                line = QLineF(xs[node_id], ys[node_id], xs[parent], ys[parent])
+                alpha = alphas[node_id]
+                if alpha < 1.0:
+                    painter.setOpacity(alpha)
+                    painter.setPen(QPen(colors[done_flags[node_id]], 1))
+                    painter.drawLine(line)
+                    continue
+                batches[done_flags[node_id]].append(line)
+            painter.setOpacity(1.0)
+        # 픽셀 단위 간선은 안티앨리어싱 없이
+        painter.setRenderHint(QPainter.Antialiasing, lod != LOD_DOTS)
+        for done in (1, 0):
+            if len(batches[done]):
+                painter.setPen(QPen(colors[done], 1))
+                painter.drawLines(batches[done])
+        painter.setRenderHint(QPainter.Antialiasing)
+
+    def drawNodes(self, painter: QPainter, node_ids: List[int], lod: int):
+        manager = self.call_tree_manager
+        done_flags = manager.done_flags
+        xs, ys, alphas = manager.xs, manager.ys, manager.alphas
+        dark_mode = self.dark_mode
+        colors = self.colors
+        ratio = self.devicePixelRatioF()
 
-    def drawNodes(self, painter: QPainter):
-        if not self.call_tree_manager:
+        if lod == LOD_DOTS:
+            # 점은 색깔별로 모아 한 번에, 같은 픽셀에 겹치는 노드는 한 번만
+            batches = tuple(self._pixel_batches(node_ids, with_parent=False))
+            size = self._dot_size()
+            painter.setRenderHint(QPainter.Antialiasing, False)
+            for done, key in ((1, 'node_inactive'), (0, 'node_active')):
+                if len(batches[done]):
+                    pen = QPen(colors[key], size)
+                    pen.setCapStyle(Qt.SquareCap)
+                    painter.setPen(pen)
+                    painter.drawPoints(batches[done] if np is not None else QPolygonF(batches[done]))
+            painter.setRenderHint(QPainter.Antialiasing)
             return
-            
-        for node in self.call_tree_manager.nodes.values():
-            x, y = node.x, node.y
-            
-            # 노드 그림자
-            shadow = QRadialGradient(x, y, self.node_radius + 5)
-            shadow.setColorAt(0, QColor(0, 0, 0, 50))
-            shadow.setColorAt(1, QColor(0, 0, 0, 0))
-            painter.setBrush(shadow)
-            painter.setPen(Qt.NoPen)
-            painter.drawEllipse(
-                int(x - self.node_radius - 5),
-                int(y - self.node_radius - 5),
-                int(2 * (self.node_radius + 5)),
-                int(2 * (self.node_radius + 5))
-            )
-            
-            # 노드 본체
-            if node.done:
-                color = self.colors['node_inactive']
-                border_color = QColor(150, 150, 150)
+
+        # 노드는 미리 그려 둔 이미지를 복사하기만 한다
+        if lod == LOD_FULL:
+            get_sprite = self.sprites.get
+            labels = manager.labels
+            label_ids = manager.label_ids
+            radius = self.node_radius
+        else:
+            # 작은 원은 이름과 그림자 없이, 형제 간격에 맞는 크기로
+            get_circle = self.sprites.get_circle
+            radius = self._circle_radius()
+        for node_id in node_ids:
+            if lod == LOD_FULL:
+                sprite = get_sprite(labels[label_ids[node_id]], bool(done_flags[node_id]),
+                                    dark_mode, colors, radius, ratio)
             else:
-                color = self.colors['node_active']
-                border_color = QColor(255, 255, 255)
-            
-            # 노드 배경
-            painter.setBrush(color)
-            painter.setPen(QPen(border_color, 2))
-            painter.drawEllipse(
-                int(x - self.node_radius),
-                int(y - self.node_radius),
-                int(2 * self.node_radius),
-                int(2 * self.node_radius)
-            )
-            
-            # 텍스트 설정
-            text_color = self.colors['text']
-            if node.done:
-                text_color = QColor(100, 100, 100)
-            
-            painter.setPen(QPen(text_color, 1))
-            
-            # 함수 이름과 파라미터 분리
-            func_parts = node.function.split('(')
-            func_name = func_parts[0]
-            params = '(' + func_parts[1] if len(func_parts) > 1 else ''
-            
-            # 함수 이름 그리기
-            font = QFont("Arial", 10)
-            font.setBold(True)
-            painter.setFont(font)
-            name_rect = QRect(
-                int(x - self.node_radius),
-                int(y - 10),
-                int(2 * self.node_radius),
-                20
-            )
-            painter.drawText(name_rect, Qt.AlignCenter, func_name)
-            
-            # 파라미터 그리기 (작은 폰트)
-            if params:
-                font.setPointSize(8)
-                painter.setFont(font)
-                param_rect = QRect(
-                    int(x - self.node_radius * 1.5),  # 더 넓은 영역
-                    int(y + 5),
-                    int(3 * self.node_radius),  # 더 넓은 영역
-                    20
-                )
-                # 파라미터가 너무 길면 줄임
-                metrics = painter.fontMetrics()
-                params = metrics.elidedText(params, Qt.ElideMiddle, param_rect.width())
-                painter.drawText(param_rect, Qt.AlignCenter, params)
+                sprite = get_circle(bool(done_flags[node_id]), dark_mode, colors, radius, ratio)
+            painter.setOpacity(alphas[node_id])
+            painter.drawPixmap(int(xs[node_id]) - sprite.offset_x,
+                               int(ys[node_id]) - sprite.offset_y, sprite.pixmap)
+        painter.setOpacity(1.0)
 
     def drawHighlights(self, painter: QPainter):
         if (self.highlight_node is not None and 
@@ -290,31 +494,45 @@ class AnimationWidget(QWidget):
             painter.setFont(font)
             painter.drawText(msg_rect, Qt.AlignCenter, self.message)
 
-    def updateLayout(self):
-        """주기적으로 레이아웃 업데이트"""
-        if self.call_tree_manager and self.call_tree_manager.modified_nodes:
-            self.call_tree_manager.update_layout(self.width(), self.height())
-            self.update()  # 화면 갱신 
+    def nodeAt(self, x: float, y: float) -> Optional[int]:
+        """화면 좌표에 그려진 노드 id (없으면 None)"""
+        manager = self.call_tree_manager
+        if not manager or not manager.call_id_counter:
+            return None
+        self.node_grid.set_radius(self._pick_radius())
+        return self.node_grid.node_at(x, y)
+
+    def _pick_radius(self) -> float:
+        """고르는 범위: 현재 세부 표현 수준에서 그려지는 노드 크기"""
+        lod = self._level_of_detail()
+        if lod == LOD_FULL:
+            radius = self.node_radius
+        elif lod == LOD_SIMPLE:
+            radius = self._circle_radius()
+        else:
+            radius = self._dot_size() / 2
+        return max(radius, MIN_PICK_RADIUS)
 
     def mouseMoveEvent(self, event):
         """마우스 이동 시 노드 정보 표시"""
-        if not self.call_tree_manager:
+        node_id = self.nodeAt(event.x(), event.y())
+        if node_id is None:
+            self.setToolTip("재귀 호출 트리 시각화")
             return
-        
-        pos = event.pos()
-        for node in self.call_tree_manager.nodes.values():
-            if self._is_point_in_node(pos.x(), pos.y(), node):
-                status = "완료" if node.done else "진행 중"
-                self.setToolTip(
-                    f"함수: {node.function}\n"
-                    f"상태: {status}\n"
-                    f"깊이: {node.depth}"
-                )
-                return
-        self.setToolTip("재귀 호출 트리 시각화")
+        node = self.call_tree_manager.nodes[node_id]
+        status = "완료" if node.done else "진행 중"
+        self.setToolTip(
+            f"함수: {node.function}\n"
+            f"상태: {status}\n"
+            f"깊이: {node.depth}"
+        )
 
-    def _is_point_in_node(self, x: int, y: int, node: 'Node') -> bool:
-        """주어진 좌표가 노드 영역 내에 있는지 확인"""
-        dx = x - node.x
-        dy = y - node.y
-        return (dx * dx + dy * dy) <= self.node_radius * self.node_radius 
\ No newline at end of file
+    def mousePressEvent(self, event):
+        """클릭한 노드를 강조하고 nodeClicked로 알림"""
+        if event.button() == Qt.LeftButton:
+            node_id = self.nodeAt(event.x(), event.y())
+            if node_id is not None:
+                self.highlightNode(node_id)
+                self.nodeClicked.emit(node_id)
+                return
+        super().mousePressEvent(event)
@@ -0,0 +1,144 @@
+import math
+import time
+from typing import Callable, Dict, List, Optional
+
+from PyQt5.QtCore import QObject, QTimer, Qt, pyqtSignal
+from PyQt5.QtGui import QGuiApplication
+from PyQt5.QtWidgets import QWidget
+
+from config.settings import Settings
+
+class _Job:
+    """스케줄러에 등록된 작업 하나"""
+    __slots__ = ('callback', 'interval', 'repeat', 'pending', 'due', 'last_run')
+
+    def __init__(self, callback: Callable[[], None], interval: float, repeat: bool):
+        self.callback = callback
+        self.interval = interval
+        self.repeat = repeat
+        self.pending = False
+        self.due = 0.0
+        self.last_run = -math.inf
+
+class FrameScheduler(QObject):
+    """단계 진행, 레이아웃/애니메이션, 로그 갱신, 다시 그리기를 하나의 타이머로 처리
+
+    작업은 이름으로 등록하고 wake()로 깨운다. 한 번 실행하는 작업은 실행되면
+    잠들고, 반복 작업(repeat=True)은 sleep()할 때까지 interval마다 실행된다.
+    타이머는 가장 이른 작업 시각에 한 번만 울리도록 다시 맞추므로 할 일이 없으면
+    멈춰 있고, 틱 사이 간격은 화면 주사율보다 짧아지지 않는다.
+    다시 그리기 요청은 틱이 끝날 때 위젯마다 한 번씩만 반영한다.
+    """
+
+    # 다른 스레드에서 깨울 때 사용 (GUI 스레드로 전달된다)
+    _wakeRequested = pyqtSignal(str)
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.frame_interval = 1.0 / self._display_rate()
+        self._jobs: Dict[str, _Job] = {}
+        self._repaint: Dict[int, QWidget] = {}
+        self._last_tick = -math.inf
+        self._ticking = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._tick)
+        self._scheduled: Optional[float] = None
+        self._wakeRequested.connect(self.wake)
+
+    @staticmethod
+    def _display_rate() -> float:
+        """주 화면의 주사율 (알 수 없으면 설정의 기본값)"""
+        screen = QGuiApplication.primaryScreen()
+        rate = screen.refreshRate() if screen is not None else 0.0
+        if rate <= 0:
+            rate = Settings.UI.FRAME_RATE
+        return rate
+
+    def add(self, name: str, callback: Callable[[], None],
+            interval: float = 0.0, repeat: bool = False) -> None:
+        """작업 등록 (같은 틱에서는 등록한 순서대로 실행, interval은 초)"""
+        self._jobs[name] = _Job(callback, interval, repeat)
+
+    def set_interval(self, name: str, interval: float) -> None:
+        job = self._jobs[name]
+        job.interval = interval
+        if job.pending:
+            job.due = max(time.perf_counter(), job.last_run + interval)
+            self._schedule()
+
+    def is_pending(self, name: str) -> bool:
+        return self._jobs[name].pending
+
+    def wake(self, name: str) -> None:
+        """작업을 실행 대기 상태로 (마지막 실행 후 interval이 지나면 실행)"""
+        job = self._jobs[name]
+        if job.pending:
+            return
+        job.pending = True
+        job.due = max(time.perf_counter(), job.last_run + job.interval)
+        self._schedule()
+
+    def wake_threadsafe(self, name: str) -> None:
+        """작업 스레드에서도 호출할 수 있는 wake"""
+        if not self._jobs[name].pending:
+            self._wakeRequested.emit(name)
+
+    def sleep(self, name: str) -> None:
+        self._jobs[name].pending = False
+
+    def request_repaint(self, widget: QWidget) -> None:
+        """다음 틱이 끝날 때 위젯을 다시 그림 (여러 번 요청해도 한 번)"""
+        self._repaint[id(widget)] = widget
+        self._schedule()
+
+    @property
+    def active(self) -> bool:
+        """대기 중인 작업이나 다시 그리기 요청이 있는지"""
+        return bool(self._repaint) or any(job.pending for job in self._jobs.values())
+
+    def _tick(self) -> None:
+        self._scheduled = None
+        self._ticking = True
+        now = time.perf_counter()
+        self._last_tick = now
+        try:
+            for job in list(self._jobs.values()):
+                # 타이머 해상도만큼 일찍 깨어난 경우도 이번 틱에 실행
+                if not job.pending or job.due > now + 0.001:
+                    continue
+                job.last_run = now
+                if job.repeat:
+                    job.due = now + job.interval
+                else:
+                    job.pending = False
+                job.callback()
+            widgets: List[QWidget] = list(self._repaint.values())
+            self._repaint.clear()
+            for widget in widgets:
+                widget.update()
+        finally:
+            self._ticking = False
+            self._schedule()
+
+    def _schedule(self) -> None:
+        """가장 이른 작업 시각(과 프레임 간격 제한)에 맞춰 타이머를 다시 설정"""
+        if self._ticking:
+            return  # 틱이 끝날 때 한 번에 맞춘다
+        due = math.inf
+        if self._repaint:
+            due = 0.0
+        for job in self._jobs.values():
+            if job.pending and job.due < due:
+                due = job.due
+        if due == math.inf:
+            self._timer.stop()
+            self._scheduled = None
+            return
+        due = max(due, self._last_tick + self.frame_interval)
+        if self._scheduled is not None and self._scheduled <= due:
+            return  # 이미 그보다 이르게 예약되어 있음
+        delay = max(0, math.ceil((due - time.perf_counter()) * 1000))
+        self._scheduled = due
+        self._timer.start(delay)
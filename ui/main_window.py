@@ -1,15 +1,21 @@
 import sys
+import time
 from typing import Optional, Dict, Any
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QComboBox, QSlider, QPushButton, QGroupBox, QListWidget,
-    QTextEdit, QLabel, QLineEdit, QFormLayout
+    QTextEdit, QPlainTextEdit, QLabel, QLineEdit, QFormLayout, QCheckBox, QDialog,
+    QFileDialog
 )
-from PyQt5.QtCore import QTimer, Qt
+from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont
 
 from ..models.call_tree import CallTreeManager
-from ..models.simulation_step import SimulationStep
+from ..engine.admission import Admission, admit
+from ..engine.producer import StepProducer
+from ..engine.timeline import Timeline
+from ..models.simulation_step import SimulationStep, StepType
+from ..models.value_preview import format_full, is_large, preview
 from ..simulations import (
     FibonacciSimulation,
     HanoiSimulation,
@@ -23,15 +29,19 @@ from ..simulations import (
     CombinationSimulation
 )
 from .animation_widget import AnimationWidget
+from .frame_scheduler import FrameScheduler
 from .styles import Styles
-from ..utils.logger import Logger
+from .summary_worker import SummaryWorker
 from ui.components.tree_view import TreeView
+from utils.logger import Logger
+from utils.metrics import Metrics
 from config.settings import Settings
 
 class RecursionVisualizer(QMainWindow):
     def __init__(self):
         super().__init__()
         self.logger = Logger()
+        self.metrics = Metrics()
         self.logger.info("RecursionVisualizer 초기화 시작")
         
         self.setWindowTitle("재귀 호출 시각화 도구")
@@ -39,28 +49,41 @@ class RecursionVisualizer(QMainWindow):
 
         # 상태 관리
         self.dark_mode = False
-        self.simulation_generator = None
+        self.turbo_mode = False
+        self.timeline: Optional[Timeline] = None
+        self.producer: Optional[StepProducer] = None
+        self.summary_worker: Optional[SummaryWorker] = None
+        self._summary_counts = False  # 요약 모드 결과가 개수인지 (순열/조합)
+        self._last_result: Any = None
+        self._log_cursor = 0  # 로그 뷰어에 표시한 마지막 기록 다음 순번
         self.call_tree_manager = CallTreeManager()
+
+        # 단계 종류별 처리 함수 (StepType 값으로 인덱싱)
+        self._step_handlers = (
+            self._handle_push,
+            self._handle_pop,
+            self._handle_highlight,
+            self._handle_animate,
+            self._handle_result,
+        )
         
-        # 타이머 초기화
-        self.simulation_timer = QTimer(self)
-        self.simulation_timer.timeout.connect(self.process_next_step)
-        
-        self.log_update_timer = QTimer(self)
-        self.log_update_timer.timeout.connect(self.update_log_viewer)
-        
-        self.layout_update_timer = QTimer(self)
-        self.layout_update_timer.timeout.connect(self.update_layout)
+        # 단계 진행, 애니메이션, 로그 갱신을 하나의 프레임 스케줄러로 처리
+        # (애니메이션 작업은 AnimationWidget이 등록하며, 단계 다음에 실행된다)
+        self.scheduler = FrameScheduler(self)
+        self.scheduler.add('steps', self.process_next_step, repeat=True)
 
         self.initUI()
-        self._initialize_timers()
+        self.scheduler.add(
+            'logs', self.update_log_viewer,
+            interval=Settings.UI.LOG_UPDATE_INTERVAL / 1000
+        )
+        self.logger.add_listener(self._on_log_record)
         self.applyStyles()
         self.logger.info("RecursionVisualizer 초기화 완료")
 
-    def _initialize_timers(self):
-        """타이머 초기화 및 시작"""
-        self.log_update_timer.start(Settings.UI.LOG_UPDATE_INTERVAL)
-        self.layout_update_timer.start(Settings.UI.LAYOUT_UPDATE_INTERVAL)
+    def _on_log_record(self):
+        """새 로그가 생기면 로그 뷰어 갱신 예약 (작업 스레드에서도 호출됨)"""
+        self.scheduler.wake_threadsafe('logs')
 
     def initUI(self):
         mainWidget = QWidget()
@@ -104,6 +127,8 @@ class RecursionVisualizer(QMainWindow):
         self.algorithmCombo = QComboBox()
         self.algorithmCombo.addItems([
             "피보나치 수열",
+            "피보나치 수열 (메모이제이션)",
+            "피보나치 수열 (빠른 배가)",
             "하노이 탑",
             "누적합",
             "누적곱",
@@ -112,7 +137,9 @@ class RecursionVisualizer(QMainWindow):
             "최대공약수",
             "거듭제곱",
             "순열",
-            "조합"
+            "순열 (스트리밍)",
+            "조합",
+            "조합 (스트리밍)"
         ])
         self.algorithmCombo.setFixedWidth(200)
         self.algorithmCombo.currentIndexChanged.connect(self.loadCodeTemplate)
@@ -151,8 +178,19 @@ class RecursionVisualizer(QMainWindow):
         )
         self.speedSlider.setValue(Settings.UI.SIMULATION_SPEED_DEFAULT)
         self.speedSlider.setFixedWidth(150)
+        self.turboCheck = QCheckBox("터보 모드")
+        self.turboCheck.toggled.connect(self.toggleTurboMode)
         rightLayout.addWidget(speedLabel)
         rightLayout.addWidget(self.speedSlider)
+        rightLayout.addWidget(self.turboCheck)
+
+        # 성능 지표 표시와 저장
+        self.hudCheck = QCheckBox("성능 표시")
+        self.hudCheck.toggled.connect(self.toggleHud)
+        self.metricsButton = QPushButton("지표 저장")
+        self.metricsButton.clicked.connect(self.saveMetrics)
+        rightLayout.addWidget(self.hudCheck)
+        rightLayout.addWidget(self.metricsButton)
         toolBarLayout.addWidget(rightGroup)
 
         return toolBar
@@ -194,16 +232,37 @@ class RecursionVisualizer(QMainWindow):
         # 애니메이션 뷰어
         animGroup = QGroupBox("재귀 트리 시각화")
         animLayout = QVBoxLayout(animGroup)
-        self.animationWidget = AnimationWidget()
+        self.animationWidget = AnimationWidget(scheduler=self.scheduler)
         self.animationWidget.setCallTreeManager(self.call_tree_manager)
+        self.animationWidget.nodeClicked.connect(self._on_node_clicked)
         animLayout.addWidget(self.animationWidget)
+
+        # 진행 위치 (기록된 단계 사이를 임의로 이동)
+        seekLayout = QHBoxLayout()
+        seekLabel = QLabel("진행 위치:")
+        self.seekSlider = QSlider(Qt.Horizontal)
+        self.seekSlider.setRange(0, 0)
+        self.seekSlider.valueChanged.connect(self.seekSimulation)
+        self.positionLabel = QLabel("0 / 0")
+        self.stepBackButton = QPushButton("◀ 이전")
+        self.stepForwardButton = QPushButton("다음 ▶")
+        self.stepBackButton.clicked.connect(self.stepBack)
+        self.stepForwardButton.clicked.connect(self.stepForward)
+        seekLayout.addWidget(seekLabel)
+        seekLayout.addWidget(self.stepBackButton)
+        seekLayout.addWidget(self.seekSlider)
+        seekLayout.addWidget(self.stepForwardButton)
+        seekLayout.addWidget(self.positionLabel)
+        animLayout.addLayout(seekLayout)
         rightLayout.addWidget(animGroup)
         
         # 로그 뷰어
         logGroup = QGroupBox("로그")
         logLayout = QVBoxLayout(logGroup)
-        self.logViewer = QTextEdit()
+        self.logViewer = QPlainTextEdit()
         self.logViewer.setReadOnly(True)
+        # 오래된 줄은 문서에서 자동으로 제거된다
+        self.logViewer.setMaximumBlockCount(Settings.LOG.VIEWER_MAX_LINES)
         self.logViewer.setMaximumHeight(150)
         logLayout.addWidget(self.logViewer)
         rightLayout.addWidget(logGroup)
@@ -214,6 +273,12 @@ class RecursionVisualizer(QMainWindow):
         self.resultLabel = QLabel("결과: ")
         self.resultLabel.setFont(QFont("Arial", 12))
         resultLayout.addWidget(self.resultLabel)
+        resultLayout.addStretch()
+        # 요약된 큰 결과의 전체 값은 요청할 때만 변환
+        self.fullResultButton = QPushButton("전체 보기")
+        self.fullResultButton.setEnabled(False)
+        self.fullResultButton.clicked.connect(self.showFullResult)
+        resultLayout.addWidget(self.fullResultButton)
         rightLayout.addWidget(resultGroup)
         
         return rightPanel
@@ -242,6 +307,35 @@ class RecursionVisualizer(QMainWindow):
         return n
     # 재귀 호출: 두 개의 재귀 호출을 통해 결과를 구함
     return fibonacci(n-1) + fibonacci(n-2)
+"""
+        elif algo == "피보나치 수열 (메모이제이션)":
+            code = """def fibonacci(n, memo):
+    # 메모 확인: 이미 계산한 값이면 바로 돌려줌
+    if n in memo:
+        return memo[n]
+    # 기저 조건: n이 0 또는 1이면 그대로 반환
+    if n <= 1:
+        return n
+    # 재귀 호출: 두 결과를 더해 메모에 저장
+    memo[n] = fibonacci(n-1, memo) + fibonacci(n-2, memo)
+    # 반환: 저장한 값을 돌려줌
+    return memo[n]
+"""
+        elif algo == "피보나치 수열 (빠른 배가)":
+            code = """def fib_pair(n):
+    # 기저 조건: (F(0), F(1)) 반환
+    if n == 0:
+        return (0, 1)
+    # 재귀 호출: n // 2에 대한 쌍을 먼저 구함
+    a, b = fib_pair(n // 2)
+    # 배가 공식: F(2k) = F(k)(2F(k+1) - F(k)), F(2k+1) = F(k)^2 + F(k+1)^2
+    c = a * (2 * b - a)
+    d = a * a + b * b
+    # 반환: n이 짝수면 (c, d), 홀수면 (d, c + d)
+    return (c, d) if n % 2 == 0 else (d, c + d)
+
+def fibonacci(n):
+    return fib_pair(n)[0]
 """
         elif algo == "하노이 탑":
             code = """def hanoi(n, source, target, auxiliary):
@@ -320,6 +414,41 @@ class RecursionVisualizer(QMainWindow):
         for p in permutation(remaining, current + [elem]):
             results.append(p)
     return results
+"""
+        elif algo == "순열 (스트리밍)":
+            code = """def permutation(elements, current, used):
+    # 기저 조건: 모든 원소를 사용했으면 완성된 순열을 한 번만 내보냄
+    if all(used):
+        yield tuple(current)
+        return 1
+    # 재귀 호출: 남은 원소를 공유 목록에 붙였다가 되돌림 (개수만 반환)
+    count = 0
+    for i, elem in enumerate(elements):
+        if used[i]:
+            continue
+        used[i] = True
+        current.append(elem)
+        count += yield from permutation(elements, current, used)
+        current.pop()
+        used[i] = False
+    return count
+"""
+        elif algo == "조합 (스트리밍)":
+            code = """def combination(elements, k, start, current):
+    # 기저 조건: k개를 모두 선택했으면 완성된 조합을 한 번만 내보냄
+    if len(current) == k:
+        yield tuple(current)
+        return 1
+    # 더 이상 선택할 원소가 없으면 0개
+    if start >= len(elements):
+        return 0
+    # 재귀 호출: 원소를 공유 목록에 붙였다가 되돌림 (개수만 반환)
+    count = 0
+    for i in range(start, len(elements)):
+        current.append(elements[i])
+        count += yield from combination(elements, k, i + 1, current)
+        current.pop()
+    return count
 """
         else:  # 조합
             code = """def combination(elements, k, start=0, current=[]):
@@ -365,157 +494,470 @@ class RecursionVisualizer(QMainWindow):
         
         try:
             n = int(self.paramEdit.text())
+            strategy = None
             
             if algo == "피보나치 수열":
-                self.simulation_generator = FibonacciSimulation.run(n)
+                simulation, args = FibonacciSimulation, (n,)
+
+            elif algo == "피보나치 수열 (메모이제이션)":
+                simulation, args = FibonacciSimulation, (n,)
+                strategy = FibonacciSimulation.MEMO
+
+            elif algo == "피보나치 수열 (빠른 배가)":
+                simulation, args = FibonacciSimulation, (n,)
+                strategy = FibonacciSimulation.FAST_DOUBLING
             
             elif algo == "하노이 탑":
-                self.simulation_generator = HanoiSimulation.run(n, "A", "C", "B")
+                simulation, args = HanoiSimulation, (n, "A", "C", "B")
             
             elif algo == "누적합":
-                self.simulation_generator = AccumulateSumSimulation.run(n)
+                simulation, args = AccumulateSumSimulation, (n,)
             
             elif algo == "누적곱":
-                self.simulation_generator = AccumulateProductSimulation.run(n)
+                simulation, args = AccumulateProductSimulation, (n,)
             
             elif algo == "팩토리얼":
-                self.simulation_generator = FactorialSimulation.run(n)
+                simulation, args = FactorialSimulation, (n,)
             
             elif algo == "이항계수":
                 k = min(n // 2, n)  # 기본값으로 n과 n//2 중 작은 값 사용
-                self.simulation_generator = BinomialCoefficientSimulation.run(n, k)
+                simulation, args = BinomialCoefficientSimulation, (n, k)
             
             elif algo == "최대공약수":
                 b = n // 2  # 기본값으로 n/2 사용
-                self.simulation_generator = GCDSimulation.run(n, b)
+                simulation, args = GCDSimulation, (n, b)
             
             elif algo == "거듭제곱":
                 exponent = 2  # 기본값으로 제곱 사용
-                self.simulation_generator = PowerSimulation.run(n, exponent)
+                simulation, args = PowerSimulation, (n, exponent)
             
-            elif algo == "순열":
+            elif algo in ("순열", "순열 (스트리밍)"):
                 elements = list(range(1, n + 1))  # 1부터 n까지의 숫자로 순열 생성
-                self.simulation_generator = PermutationSimulation.run(elements)
+                simulation, args = PermutationSimulation, (elements,)
+                if algo == "순열 (스트리밍)":
+                    strategy = PermutationSimulation.STREAM
             
-            elif algo == "조합":
+            elif algo in ("조합", "조합 (스트리밍)"):
                 elements = list(range(1, n + 1))
                 k = min(n // 2, n)  # 기본값으로 n과 n//2 중 작은 값 사용
-                self.simulation_generator = CombinationSimulation.run(elements, k)
-
-            self.simulation_timer.setInterval(self.speedSlider.value())
-            self.simulation_timer.start()
+                simulation, args = CombinationSimulation, (elements, k)
+                if algo == "조합 (스트리밍)":
+                    strategy = CombinationSimulation.STREAM
+
+            # 실행 전에 비용을 예측해 예산에 따라 실행 방식 결정
+            kwargs = {} if strategy is None else {'strategy': strategy}
+            estimate = simulation.estimate(*args, **kwargs)
+            admission = admit(estimate)
+            self.logger.info("%s - %s", algo, estimate.format())
+            self.animationWidget.setMessage(estimate.format())
+
+            if admission is Admission.REFUSED:
+                self.logger.warning("예상 비용이 예산을 초과해 실행하지 않습니다: %s", algo)
+                self.resultLabel.setText("결과: 예상 비용이 너무 커서 실행하지 않습니다.")
+                return
+
+            if admission is Admission.HEADLESS:
+                self.runSummarized(simulation, args, kwargs)
+                return
+
+            # 단계 계산은 작업 스레드에서, 재생은 타이머 틱마다 큐를 비워 진행
+            self.producer = StepProducer(simulation.start(*args, **kwargs))
+            self.timeline = Timeline(
+                None, self.call_tree_manager, expected_steps=estimate.steps
+            )
+            self.producer.start()
+            self._update_seek_slider()
+            self._start_stepping()
             self.pauseButton.setText("일시정지")
             
         except ValueError as e:
-            self.logger.error(f"입력값 오류: {str(e)}")
+            self.logger.error("입력값 오류: %s", e)
             self.resultLabel.setText("결과: 유효한 정수를 입력하세요.")
         except Exception as e:
-            self.logger.error(f"시뮬레이션 시작 오류: {str(e)}")
+            self.logger.error("시뮬레이션 시작 오류: %s", e)
             self.resultLabel.setText(f"결과: 오류 발생 - {str(e)}")
-            self.simulation_timer.stop()
+            self.scheduler.sleep('steps')
+
+    def runSummarized(self, simulation, args, kwargs):
+        """요약 모드: 트리와 애니메이션 없이 결과와 통계만 계산"""
+        self.logger.info("예상 노드 수가 많아 요약 모드로 실행합니다")
+        stream = getattr(simulation, 'STREAM', None)
+        if stream is not None:
+            # 순열/조합은 결과 목록을 모으지 않고 개수만 센다
+            kwargs = dict(kwargs, strategy=stream)
+        # 수천만 단계까지 걸릴 수 있으므로 작업 스레드에서 실행 (리셋하면 취소)
+        self._summary_counts = stream is not None
+        self.summary_worker = SummaryWorker(
+            simulation.start(*args, **kwargs), simulation.__name__, parent=self
+        )
+        self.summary_worker.completed.connect(self._on_summary_completed)
+        self.summary_worker.failed.connect(self._on_summary_failed)
+        self.summary_worker.finished.connect(self.summary_worker.deleteLater)
+        self.summary_worker.start()
+        self.animationWidget.setMessage("요약 모드로 계산 중…")
+
+    def _on_summary_completed(self, report):
+        if self.sender() is not self.summary_worker:
+            return  # 취소된 이전 실행
+        self.summary_worker = None
+        self.animationWidget.setMessage(
+            f"요약 모드: {report.steps:,}단계, {report.nodes:,}노드, "
+            f"최대 깊이 {report.max_depth:,} ({report.elapsed:.2f}초)"
+        )
+        if self._summary_counts:
+            self.resultLabel.setText(f"결과: {report.result:,}개")
+        else:
+            self._set_result(report.result)
+            self.resultLabel.setText(f"결과: {preview(report.result)}")
+
+    def _on_summary_failed(self, message: str):
+        if self.sender() is not self.summary_worker:
+            return
+        self.summary_worker = None
+        self.animationWidget.setMessage("")
+        self.resultLabel.setText(f"결과: 오류 발생 - {message}")
+
+    def _cancel_summary(self):
+        if self.summary_worker is not None:
+            self.summary_worker.cancel()
+            self.summary_worker = None
 
     def pauseSimulation(self):
-        if self.simulation_timer.isActive():
+        if self.scheduler.is_pending('steps'):
             self.logger.info("시뮬레이션 일시정지")
-            self.simulation_timer.stop()
+            self.scheduler.sleep('steps')
+            if self.producer is not None:
+                self.producer.pause()
             self.pauseButton.setText("재개")
         else:
             self.logger.info("시뮬레이션 재개")
-            self.simulation_timer.start()
+            if self.producer is not None:
+                self.producer.resume()
+            self._start_stepping()
             self.pauseButton.setText("일시정지")
 
     def resetSimulation(self):
         self.logger.info("시뮬레이션 리셋")
-        self.simulation_timer.stop()
-        self.simulation_generator = None
+        self.scheduler.sleep('steps')
+        self._cancel_producer()
+        self._cancel_summary()
+        self.timeline = None
         self.callStackList.clear()
         self.call_tree_manager = CallTreeManager()
         self.animationWidget.setCallTreeManager(self.call_tree_manager)
         self.animationWidget.setMessage("")
         self.resultLabel.setText("결과: ")
+        self._set_result(None)
         self.showCodeWithHighlight("")
         self.pauseButton.setText("일시정지")
+        self._update_seek_slider()
+
+    def toggleTurboMode(self, enabled: bool):
+        self.turbo_mode = enabled
+        self.scheduler.set_interval('steps', self._simulation_interval())
+        self.logger.info("터보 모드 %s", "켜짐" if enabled else "꺼짐")
+
+    def toggleHud(self, enabled: bool):
+        self.animationWidget.setShowHud(enabled)
+
+    def saveMetrics(self):
+        """성능 지표를 JSON 파일로 저장"""
+        path, _ = QFileDialog.getSaveFileName(
+            self, "성능 지표 저장", "metrics.json", "JSON (*.json)"
+        )
+        if not path:
+            return
+        try:
+            self.metrics.dump(path)
+            self.logger.info("성능 지표 저장: %s", path)
+        except OSError as e:
+            self.logger.error("성능 지표 저장 실패: %s", e)
+
+    def _simulation_interval(self) -> float:
+        """단계 진행 간격 (초)"""
+        if self.turbo_mode:
+            return Settings.UI.TURBO_FRAME_INTERVAL / 1000
+        return self.speedSlider.value() / 1000
+
+    def _start_stepping(self):
+        self.scheduler.set_interval('steps', self._simulation_interval())
+        self.scheduler.wake('steps')
+
+    def _cancel_producer(self):
+        if self.producer is not None:
+            self.producer.cancel()
+            self.producer = None
+
+    def _drain_producer(self):
+        """작업 스레드가 만든 단계를 타임라인 기록으로 옮김"""
+        producer = self.producer
+        if producer is None:
+            return
+        self.timeline.feed(producer.drain())
+        if producer.finished:
+            self.producer = None
+            if producer.error is not None:
+                raise producer.error
+            self.timeline.close(producer.result)
 
     def process_next_step(self):
+        if self.turbo_mode:
+            self.process_frame()
+            return
+        self._apply_next_step()
+
+    def _apply_next_step(self):
+        """정확히 한 단계를 진행 (터보 모드와 무관)"""
+        start = time.perf_counter()
         try:
-            step = next(self.simulation_generator)
+            self._drain_producer()
+            step = self.timeline.step_forward()
+            if step is None:
+                # 생산자가 아직 다음 단계를 만들지 못했으면 다음 틱에 다시 시도
+                if self.timeline.finished:
+                    self.logger.info("시뮬레이션 완료")
+                    self.scheduler.sleep('steps')
+                return
             self.handle_simulation_step(step)
-        except StopIteration:
-            self.logger.info("시뮬레이션 완료")
-            self.simulation_generator = None
-            self.simulation_timer.stop()
+            self._update_seek_slider()
+            self.metrics.counter('steps').inc()
+            self.metrics.histogram('steps.ms').observe((time.perf_counter() - start) * 1000)
+        except Exception as e:
+            self.logger.error("시뮬레이션 단계 처리 오류: %s", e)
+            self.resultLabel.setText(f"결과: 에러 발생 - {str(e)}")
+            self.scheduler.sleep('steps')
+
+    def process_frame(self):
+        """터보 모드: 시간 예산 안에서 최대한 많은 단계를 처리하고 화면은 한 번만 갱신"""
+        timeline = self.timeline
+        stack = self.call_tree_manager.stack
+        low = len(stack)  # 이번 프레임에서 스택이 가장 얕았던 깊이
+        start = time.perf_counter()
+        deadline = start + Settings.UI.TURBO_FRAME_BUDGET_MS / 1000
+        pop = StepType.POP
+        processed = 0
+        finished = False
+        try:
+            self._drain_producer()
+            while True:
+                step = timeline.step_forward()
+                if step is None:
+                    finished = timeline.finished
+                    break
+                if step.kind == pop and len(stack) < low:
+                    low = len(stack)
+                processed += 1
+                # 시간 확인은 일정 단계마다 한 번만
+                if processed & 0x3F == 0 and time.perf_counter() >= deadline:
+                    break
         except Exception as e:
-            self.logger.error(f"시뮬레이션 단계 처리 오류: {str(e)}")
+            self.logger.error("시뮬레이션 단계 처리 오류: %s", e)
             self.resultLabel.setText(f"결과: 에러 발생 - {str(e)}")
-            self.simulation_timer.stop()
+            self.scheduler.sleep('steps')
+
+        if processed:
+            self._flush_frame(low)
+            # 단계 처리와 화면 반영을 합친 시간
+            self.metrics.counter('steps').inc(processed)
+            self.metrics.histogram('steps.ms').observe((time.perf_counter() - start) * 1000)
+        if finished:
+            self.logger.info("시뮬레이션 완료")
+            self.scheduler.sleep('steps')
+
+    def _flush_frame(self, low: int):
+        """프레임 동안 누적된 변경을 화면에 한 번에 반영"""
+        # 호출 스택 목록은 변하지 않은 앞부분(low까지)을 남기고 나머지만 교체
+        nodes = self.call_tree_manager.nodes
+        stack = self.call_tree_manager.stack
+        for row in range(self.callStackList.count() - 1, low - 1, -1):
+            self.callStackList.takeItem(row)
+        self.callStackList.addItems([nodes[node_id].function for node_id in stack[low:]])
+        if stack:
+            self.animationWidget.highlightNode(stack[-1])
+        self._sync_view_state()
+        self._update_seek_slider()
 
     def handle_simulation_step(self, step: SimulationStep):
         try:
-            if step.step_type == "push":
-                func_name = step.details.get("function", "")
-                self.callStackList.addItem(func_name)
-                node_id = self.call_tree_manager.push(func_name)
-                self.animationWidget.highlightNode(node_id)
-                self.logger.debug(f"함수 호출 추가: {func_name}")
-
-            elif step.step_type == "pop":
-                func_name = step.details.get("function", "")
-                for row in range(self.callStackList.count() - 1, -1, -1):
-                    if self.callStackList.item(row).text() == func_name:
-                        self.callStackList.takeItem(row)
-                        break
-                self.call_tree_manager.pop()
-                self.logger.debug(f"함수 호출 완료: {func_name}")
-
-            elif step.step_type == "highlight":
-                keyword = step.details.get("keyword", "")
-                self.showCodeWithHighlight(keyword)
-                msg = step.details.get("message", "")
-                self.animationWidget.setMessage(msg)
-                self.logger.debug(f"코드 하이라이트: {keyword}")
-
-            elif step.step_type == "animate":
-                msg = step.details.get("message", "")
-                self.animationWidget.setMessage(msg)
-                self.logger.debug(f"애니메이션 메시지: {msg}")
-
-            elif step.step_type == "result":
-                result = step.details.get("result", "")
-                func_name = step.details.get("function", "")
-                self.resultLabel.setText(f"결과: {func_name} = {result}")
-                self.logger.debug(f"결과 업데이트: {func_name} = {result}")
-
-            self.animationWidget.update()
+            self._step_handlers[step.kind](step)
+            self.animationWidget.scheduleFrame()
         except Exception as e:
-            self.logger.error(f"시뮬레이션 단계 처리 중 오류: {str(e)}")
+            self.logger.error("시뮬레이션 단계 처리 중 오류: %s", e)
             raise
 
-    def update_layout(self):
-        """레이아웃 업데이트"""
+    def _handle_push(self, step: SimulationStep):
+        func_name = step.function
+        self.callStackList.addItem(func_name)
+        self.animationWidget.highlightNode(self.call_tree_manager.stack[-1])
+        self.logger.debug("함수 호출 추가: %s", func_name)
+
+    def _handle_pop(self, step: SimulationStep):
+        func_name = step.function
+        for row in range(self.callStackList.count() - 1, -1, -1):
+            if self.callStackList.item(row).text() == func_name:
+                self.callStackList.takeItem(row)
+                break
+        self.logger.debug("함수 호출 완료: %s", func_name)
+
+    def _handle_highlight(self, step: SimulationStep):
+        keyword = step.keyword
+        self.showCodeWithHighlight(keyword)
+        self.animationWidget.setMessage(step.message)
+        self.logger.debug("코드 하이라이트: %s", keyword)
+
+    def _handle_animate(self, step: SimulationStep):
+        msg = step.message
+        self.animationWidget.setMessage(msg)
+        self.logger.debug("애니메이션 메시지: %s", msg)
+
+    def _handle_result(self, step: SimulationStep):
+        result = step.result
+        func_name = step.function
+        text = preview(result)
+        self._set_result(result)
+        self.resultLabel.setText(f"결과: {func_name} = {text}")
+        self.logger.debug("결과 업데이트: %s = %s", func_name, text)
+
+    def _set_result(self, result: Any):
+        """전체 보기용으로 마지막 결과를 보관"""
+        self._last_result = result
+        self.fullResultButton.setEnabled(is_large(result))
+
+    def showFullResult(self):
+        """요약된 결과의 전체 값을 별도 창에 표시"""
+        if self._last_result is None:
+            return
+        dialog = QDialog(self)
+        dialog.setWindowTitle("전체 결과")
+        dialog.resize(600, 400)
+        layout = QVBoxLayout(dialog)
+        text = QTextEdit()
+        text.setReadOnly(True)
+        text.setPlainText(format_full(self._last_result))
+        layout.addWidget(text)
+        dialog.exec_()
+
+    def seekSimulation(self, position: int):
+        """슬라이더로 선택한 위치로 이동"""
+        if self.timeline is None or position == self.timeline.position:
+            return
         try:
-            self.animationWidget.call_tree.update_layout(
-                self.animationWidget.width(),
-                self.animationWidget.height()
-            )
-            self.animationWidget.update()
+            self._drain_producer()
+            self.timeline.seek(position)
+            self._sync_view_from_timeline()
+            self._update_seek_slider()
         except Exception as e:
-            self.logger.error(f"레이아웃 업데이트 실패: {str(e)}")
+            self.logger.error("진행 위치 이동 실패: %s", e)
+
+    def stepBack(self):
+        """한 단계 뒤로 (되돌리기 로그 사용)"""
+        if self.timeline is None:
+            return
+        self._pause_for_stepping()
+        try:
+            step = self.timeline.step_back()
+            if step is None:
+                return
+            if step.kind == StepType.PUSH:
+                self.callStackList.takeItem(self.callStackList.count() - 1)
+            elif step.kind == StepType.POP:
+                self.callStackList.addItem(step.function)
+            stack = self.call_tree_manager.stack
+            if stack:
+                self.animationWidget.highlightNode(stack[-1])
+            self._sync_view_state()
+            self._update_seek_slider()
+        except Exception as e:
+            self.logger.error("이전 단계 이동 실패: %s", e)
+
+    def stepForward(self):
+        """한 단계 앞으로 (기록된 단계는 다시 실행하지 않음)"""
+        if self.timeline is None:
+            return
+        self._pause_for_stepping()
+        if self.producer is not None:
+            # 직접 진행할 때는 큐가 찰 때까지 다시 생산
+            self.producer.resume()
+        # 터보 모드에서도 프레임 예산 없이 한 단계만
+        self._apply_next_step()
+
+    def _on_node_clicked(self, node_id: int):
+        """클릭한 노드가 진행 중인 호출이면 호출 스택 목록에서 그 항목을 선택"""
+        stack = self.call_tree_manager.stack
+        row = stack.index(node_id) if node_id in stack else -1
+        if 0 <= row < self.callStackList.count():
+            self.callStackList.setCurrentRow(row)
+        else:
+            self.callStackList.clearSelection()
+
+    def _pause_for_stepping(self):
+        if self.scheduler.is_pending('steps'):
+            self.scheduler.sleep('steps')
+            if self.producer is not None:
+                self.producer.pause()
+            self.pauseButton.setText("재개")
+
+    def _sync_view_from_timeline(self):
+        """타임라인의 현재 상태로 화면을 다시 구성"""
+        nodes = self.call_tree_manager.nodes
+        stack = self.call_tree_manager.stack
+        self.callStackList.clear()
+        self.callStackList.addItems([nodes[node_id].function for node_id in stack])
+        if stack:
+            self.animationWidget.highlightNode(stack[-1])
+        self._sync_view_state()
+
+    def _sync_view_state(self):
+        """코드 강조, 메시지, 결과 표시를 타임라인의 화면 상태로 맞춤"""
+        view = self.timeline.view
+        self.showCodeWithHighlight(view.highlight.keyword if view.highlight else "")
+        self.animationWidget.setMessage(view.message.message if view.message else "")
+        if view.result is not None:
+            self._set_result(view.result.result)
+            self.resultLabel.setText(f"결과: {view.result.function} = {preview(view.result.result)}")
+        else:
+            self._set_result(None)
+            self.resultLabel.setText("결과: ")
+        self.animationWidget.scheduleFrame()
+
+    def _update_seek_slider(self):
+        """슬라이더 범위와 위치를 타임라인에 맞춤"""
+        total = position = 0
+        if self.timeline is not None:
+            # 예상 단계 수를 알면 처음부터 전체 범위를 보여준다
+            total = max(len(self.timeline), self.timeline.expected_steps)
+            position = self.timeline.position
+        self.seekSlider.blockSignals(True)
+        self.seekSlider.setRange(0, total)
+        self.seekSlider.setValue(position)
+        self.seekSlider.blockSignals(False)
+        self.positionLabel.setText(f"{position} / {total}")
 
     def update_log_viewer(self):
-        """로그 뷰어 업데이트"""
+        """로그 뷰어에 지난 갱신 이후의 기록만 추가"""
         try:
-            current_text = self.logViewer.toPlainText()
-            new_text = self.logger.get_logs()
-            
-            if current_text != new_text:
-                self.logViewer.setText(new_text)
-                scrollbar = self.logViewer.verticalScrollBar()
-                scrollbar.setValue(scrollbar.maximum())
-                
+            entries, self._log_cursor, skipped = self.logger.records_since(self._log_cursor)
+            # 뷰어에 남지 못할 오래된 기록은 형식화하지 않는다
+            # (생략 표시 한 줄을 위한 자리를 남긴다)
+            limit = Settings.LOG.VIEWER_MAX_LINES - 1
+            if len(entries) > limit:
+                skipped += len(entries) - limit
+                entries = entries[-limit:]
+            if not entries:
+                return
+            lines = [self.logger.format_entry(entry) for entry in entries]
+            if skipped:
+                lines.insert(0, f"… 로그 {skipped:,}줄 생략")
+            self.logViewer.appendPlainText("\n".join(lines))
+            scrollbar = self.logViewer.verticalScrollBar()
+            scrollbar.setValue(scrollbar.maximum())
         except Exception as e:
-            self.logger.error(f"로그 뷰어 업데이트 실패: {str(e)}")
+            self.logger.error("로그 뷰어 업데이트 실패: %s", e)
 
     def closeEvent(self, event):
         self.logger.info("프로그램 종료")
+        self.logger.remove_listener(self._on_log_record)
+        self._cancel_producer()
+        self._cancel_summary()
         self.logger.cleanup()
         super().closeEvent(event) 
\ No newline at end of file
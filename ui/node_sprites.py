@@ -0,0 +1,145 @@
+import math
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Tuple
+
+from PyQt5.QtCore import QRect, Qt
+from PyQt5.QtGui import QColor, QFont, QPainter, QPen, QPixmap, QRadialGradient
+
+from config.settings import Settings
+
+class NodeSprite(NamedTuple):
+    """미리 그려 둔 노드 이미지와 노드 중심까지의 거리 (논리 픽셀)"""
+    pixmap: QPixmap
+    offset_x: int
+    offset_y: int
+
+class NodeSpriteCache:
+    """노드(그림자, 원, 함수 이름, 인자)를 한 번만 그려 두고 다시 쓰는 캐시
+
+    (라벨, 완료 여부, 테마, 반지름, 화면 배율)마다 픽스맵을 하나 만들고,
+    전체 크기가 max_bytes를 넘으면 가장 오래 쓰지 않은 것부터 버린다.
+    """
+
+    def __init__(self, max_bytes: int = Settings.UI.NODE_SPRITE_CACHE_KB * 1024):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._sprites: 'OrderedDict[Tuple, NodeSprite]' = OrderedDict()
+        self._name_font = QFont("Arial", 10)
+        self._name_font.setBold(True)
+        self._param_font = QFont("Arial", 8)
+        self._param_font.setBold(True)
+
+    def __len__(self) -> int:
+        return len(self._sprites)
+
+    def clear(self) -> None:
+        self._sprites.clear()
+        self.bytes = 0
+
+    def get(self, label: str, done: bool, dark_mode: bool, colors: Dict[str, QColor],
+            radius: int, device_pixel_ratio: float) -> NodeSprite:
+        key = (label, done, dark_mode, radius, device_pixel_ratio)
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._sprites.move_to_end(key)
+            self.hits += 1
+            return sprite
+        return self._store(key, self._render(label, done, colors, radius, device_pixel_ratio))
+
+    def get_circle(self, done: bool, dark_mode: bool, colors: Dict[str, QColor],
+                   radius: int, device_pixel_ratio: float) -> NodeSprite:
+        """이름과 그림자 없이 원만 그린 노드 (세부 표현을 줄일 때)"""
+        key = (None, done, dark_mode, radius, device_pixel_ratio)
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._sprites.move_to_end(key)
+            self.hits += 1
+            return sprite
+        return self._store(key, self._render_circle(done, colors, radius, device_pixel_ratio))
+
+    def _store(self, key: Tuple, sprite: NodeSprite) -> NodeSprite:
+        self.misses += 1
+        self._sprites[key] = sprite
+        self.bytes += self._size_of(sprite)
+        while self.bytes > self.max_bytes and len(self._sprites) > 1:
+            _, evicted = self._sprites.popitem(last=False)
+            self.bytes -= self._size_of(evicted)
+        return sprite
+
+    @staticmethod
+    def _size_of(sprite: NodeSprite) -> int:
+        return sprite.pixmap.width() * sprite.pixmap.height() * 4
+
+    def _render(self, label: str, done: bool, colors: Dict[str, QColor],
+                radius: int, device_pixel_ratio: float) -> NodeSprite:
+        shadow_radius = radius + 5
+        # 인자 글자는 원보다 넓게(지름의 1.5배) 그린다
+        half_width = max(shadow_radius, math.ceil(radius * 1.5))
+        half_height = max(shadow_radius, 25)
+        pixmap = QPixmap(
+            math.ceil(2 * half_width * device_pixel_ratio),
+            math.ceil(2 * half_height * device_pixel_ratio)
+        )
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        x, y = half_width, half_height
+
+        # 노드 그림자
+        shadow = QRadialGradient(x, y, shadow_radius)
+        shadow.setColorAt(0, QColor(0, 0, 0, 50))
+        shadow.setColorAt(1, QColor(0, 0, 0, 0))
+        painter.setBrush(shadow)
+        painter.setPen(Qt.NoPen)
+        painter.drawEllipse(x - shadow_radius, y - shadow_radius,
+                            2 * shadow_radius, 2 * shadow_radius)
+
+        # 노드 본체
+        if done:
+            color = colors['node_inactive']
+            border_color = QColor(150, 150, 150)
+            text_color = QColor(100, 100, 100)
+        else:
+            color = colors['node_active']
+            border_color = QColor(255, 255, 255)
+            text_color = colors['text']
+        painter.setBrush(color)
+        painter.setPen(QPen(border_color, 2))
+        painter.drawEllipse(x - radius, y - radius, 2 * radius, 2 * radius)
+
+        # 함수 이름과 파라미터 분리
+        painter.setPen(QPen(text_color, 1))
+        func_name, paren, params = label.partition('(')
+        params = paren + params
+
+        painter.setFont(self._name_font)
+        painter.drawText(QRect(x - radius, y - 10, 2 * radius, 20), Qt.AlignCenter, func_name)
+
+        # 파라미터 그리기 (작은 폰트, 너무 길면 가운데를 줄임)
+        if params:
+            painter.setFont(self._param_font)
+            param_rect = QRect(x - int(radius * 1.5), y + 5, int(3 * radius), 20)
+            params = painter.fontMetrics().elidedText(params, Qt.ElideMiddle, param_rect.width())
+            painter.drawText(param_rect, Qt.AlignCenter, params)
+        painter.end()
+        return NodeSprite(pixmap, half_width, half_height)
+
+    def _render_circle(self, done: bool, colors: Dict[str, QColor],
+                       radius: int, device_pixel_ratio: float) -> NodeSprite:
+        half = radius + 1
+        pixmap = QPixmap(math.ceil(2 * half * device_pixel_ratio),
+                         math.ceil(2 * half * device_pixel_ratio))
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setBrush(colors['node_inactive'] if done else colors['node_active'])
+        painter.setPen(QPen(QColor(150, 150, 150) if done else QColor(255, 255, 255), 1))
+        painter.drawEllipse(half - radius, half - radius, 2 * radius, 2 * radius)
+        painter.end()
+        return NodeSprite(pixmap, half, half)
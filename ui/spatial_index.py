@@ -0,0 +1,153 @@
+import math
+from array import array
+from typing import Dict, List, Optional, Set
+
+from models.call_tree import CallTreeManager, NO_NODE
+
+try:
+    import numpy as np
+except ImportError:  # NumPy가 없으면 칸 번호를 노드별 반복으로 계산
+    np = None
+
+class NodeGrid:
+    """노드 좌표의 균일 격자 색인 (마우스 위치의 노드를 주변 칸만 보고 찾는다)
+
+    칸 크기는 찾는 반지름의 두 배 이상이므로 한 점에서 반지름 안의 노드는 많아야
+    2×2칸에 있다. 노드가 움직이면 invalidate()로 표시만 해 두고, 다음 조회 때
+    칸이 바뀐 노드만 옮긴다 (추가/제거된 노드도 그 수에 비례하는 비용으로 반영).
+    칸 크기는 2의 거듭제곱으로 맞춰 반지름이 조금씩 바뀔 때마다 다시 채우지 않는다.
+    """
+
+    def __init__(self):
+        self.manager: Optional[CallTreeManager] = None
+        self.radius = 0.0
+        self.cell_size = 0.0
+        # 칸 번호 → 그 칸에 있는 노드 id
+        self._cells: Dict[int, Set[int]] = {}
+        # 노드별 현재 칸 번호 (id 순서)
+        self._keys = array('q')
+        self._dirty = True
+
+    def reset(self, manager: Optional[CallTreeManager]) -> None:
+        self.manager = manager
+        self._cells = {}
+        self._keys = array('q')
+        self._dirty = True
+
+    def invalidate(self) -> None:
+        """노드가 추가/제거되거나 움직였음 (다음 조회 때 반영)"""
+        self._dirty = True
+
+    def set_radius(self, radius: float) -> None:
+        """찾는 반지름 변경 (칸 크기가 바뀌면 처음부터 다시 채운다)"""
+        self.radius = radius
+        cell_size = 2.0 ** math.ceil(math.log2(2.0 * radius)) if radius > 0 else 0.0
+        if cell_size != self.cell_size:
+            self.cell_size = cell_size
+            self.reset(self.manager)
+
+    def node_at(self, x: float, y: float) -> Optional[int]:
+        """(x, y)에서 radius 안에 있는 가장 가까운 노드 (아직 나타나지 않은 노드 제외)"""
+        manager = self.manager
+        if manager is None or self.radius <= 0:
+            return None
+        if self._dirty:
+            self._sync()
+        size = self.cell_size
+        radius = self.radius
+        xs, ys, alphas = manager.xs, manager.ys, manager.alphas
+        best = NO_NODE
+        best_distance = radius * radius
+        for cx in range(math.floor((x - radius) / size), math.floor((x + radius) / size) + 1):
+            for cy in range(math.floor((y - radius) / size), math.floor((y + radius) / size) + 1):
+                for node_id in self._cells.get(self._key(cx, cy), ()):
+                    dx = x - xs[node_id]
+                    dy = y - ys[node_id]
+                    distance = dx * dx + dy * dy
+                    # 같은 거리면 나중에 그려지는(위에 있는) 노드
+                    if (distance < best_distance or
+                            (distance == best_distance and node_id > best)) and alphas[node_id] > 0:
+                        best = node_id
+                        best_distance = distance
+        return None if best == NO_NODE else best
+
+    def nodes_in(self, left: float, top: float, right: float, bottom: float) -> List[int]:
+        """사각형에 걸치는 칸의 노드 id (칸 단위이므로 사각형 밖의 노드도 섞여 있다)"""
+        if self.manager is None or self.cell_size <= 0:
+            return []
+        if self._dirty:
+            self._sync()
+        size = self.cell_size
+        cells = self._cells
+        key = self._key
+        found: List[int] = []
+        rows = range(math.floor(top / size), math.floor(bottom / size) + 1)
+        for cx in range(math.floor(left / size), math.floor(right / size) + 1):
+            for cy in rows:
+                cell = cells.get(key(cx, cy))
+                if cell:
+                    found.extend(cell)
+        return found
+
+    @staticmethod
+    def _key(cx: int, cy: int) -> int:
+        """칸 좌표 → 정수 칸 번호 (음수 좌표도 겹치지 않는다)"""
+        return (cy << 32) + cx
+
+    def _sync(self) -> None:
+        """색인을 노드의 현재 좌표에 맞춤 (칸이 바뀐 노드만 옮긴다)"""
+        self._dirty = False
+        count = self.manager.call_id_counter
+        keys = self._keys
+        cells = self._cells
+        # 제거된 노드
+        for node_id in range(len(keys) - 1, count - 1, -1):
+            self._discard(node_id, keys[node_id])
+        del keys[count:]
+
+        known = len(keys)
+        if np is not None:
+            new_keys = self._cell_keys_vectorized(count)
+            old_keys = np.frombuffer(keys, dtype=np.int64, count=known)
+            moved = np.flatnonzero(new_keys[:known] != old_keys)
+            moves = list(zip(moved.tolist(), old_keys[moved].tolist(), new_keys[moved].tolist()))
+            added = new_keys[known:].tolist()
+            del old_keys  # 버퍼를 놓아야 keys에 추가할 수 있다
+        else:
+            new_keys = self._cell_keys(count)
+            moves = (
+                (node_id, keys[node_id], new_keys[node_id])
+                for node_id in range(known) if keys[node_id] != new_keys[node_id]
+            )
+            added = new_keys[known:]
+
+        for node_id, old_key, new_key in moves:
+            self._discard(node_id, old_key)
+            cells.setdefault(new_key, set()).add(node_id)
+            keys[node_id] = new_key
+        for node_id, key in enumerate(added, known):
+            cells.setdefault(key, set()).add(node_id)
+            keys.append(key)
+
+    def _discard(self, node_id: int, key: int) -> None:
+        cell = self._cells[key]
+        cell.discard(node_id)
+        if not cell:
+            del self._cells[key]
+
+    def _cell_keys_vectorized(self, count: int):
+        manager = self.manager
+        xs = np.frombuffer(manager.xs, dtype=np.float32, count=count)
+        ys = np.frombuffer(manager.ys, dtype=np.float32, count=count)
+        cx = np.floor(xs / self.cell_size).astype(np.int64)
+        cy = np.floor(ys / self.cell_size).astype(np.int64)
+        return (cy << 32) + cx
+
+    def _cell_keys(self, count: int) -> array:
+        xs, ys = self.manager.xs, self.manager.ys
+        size = self.cell_size
+        key = self._key
+        return array('q', (
+            key(math.floor(xs[node_id] / size), math.floor(ys[node_id] / size))
+            for node_id in range(count)
+        ))
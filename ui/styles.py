@@ -32,7 +32,7 @@ class Styles:
                 }
             """,
             'text_edit': """
-                QTextEdit, QListWidget {
+                QTextEdit, QPlainTextEdit, QListWidget {
                     background-color: #2d2d2d;
                     color: #e0e0e0;
                     border: 1px solid #555555;
@@ -80,7 +80,7 @@ class Styles:
                 }
             """,
             'text_edit': """
-                QTextEdit, QListWidget {
+                QTextEdit, QPlainTextEdit, QListWidget {
                     background-color: white;
                     border: 1px solid #cccccc;
                 }
@@ -0,0 +1,38 @@
+from typing import Any, Generator, Optional
+
+from PyQt5.QtCore import QObject, QThread, pyqtSignal
+
+from engine.runner import HeadlessRunner
+from models.simulation_step import SimulationStep
+
+class SummaryWorker(QThread):
+    """요약 모드 실행(HeadlessRunner)을 GUI 스레드 밖에서 수행
+
+    끝나면 completed(RunReport), 오류가 나면 failed(메시지)를 보낸다.
+    cancel()로 중단한 실행은 아무 신호도 보내지 않는다.
+    """
+    completed = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, steps: Generator[SimulationStep, None, Any], name: str,
+                 parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._steps = steps
+        self._name = name
+        self._runner = HeadlessRunner()
+
+    def run(self) -> None:
+        try:
+            report = self._runner.run(self._steps, name=self._name)
+        except Exception as e:
+            self._runner.logger.error("요약 모드 실행 오류: %s", e)
+            self.failed.emit(str(e))
+            return
+        if not report.cancelled:
+            self.completed.emit(report)
+
+    def cancel(self, timeout_ms: int = 1000) -> None:
+        """실행을 중단하고 스레드가 끝나기를 기다림"""
+        self._runner.cancel()
+        if self.isRunning():
+            self.wait(timeout_ms)
@@ -1,9 +1,66 @@
 import logging
 import logging.handlers
-from io import StringIO
-from typing import Optional
+import queue
+from collections import deque
+from itertools import islice
+from typing import Callable, Deque, List, NamedTuple, Optional, Tuple
 from config.settings import Settings
 
+class LogEntry(NamedTuple):
+    """메모리에 보관하는 로그 기록 하나"""
+    seq: int
+    created: float
+    levelno: int
+    name: str
+    message: str
+
+class LogBuffer(logging.Handler):
+    """최근 로그 기록을 정해진 개수만큼 보관하는 링 버퍼 핸들러
+
+    기록마다 증가하는 순번을 붙여 두므로 읽는 쪽은 마지막으로 읽은 순번(커서)
+    이후의 기록만 가져갈 수 있다. 새 기록이 생기면 등록된 함수들에 알린다.
+    """
+
+    def __init__(self, capacity: int):
+        super().__init__()
+        self.entries: Deque[LogEntry] = deque(maxlen=capacity)
+        self.next_seq = 0
+        self.listeners: List[Callable[[], None]] = []
+
+    def emit(self, record: logging.LogRecord):
+        # Handler.handle이 잠금을 잡은 상태에서 호출된다
+        self.entries.append(LogEntry(
+            self.next_seq, record.created, record.levelno, record.name, record.getMessage()
+        ))
+        self.next_seq += 1
+        for listener in self.listeners:
+            listener()
+
+    def since(self, cursor: int) -> Tuple[List[LogEntry], int, int]:
+        """cursor 이후의 기록, 새 커서, 버퍼에서 밀려나 건너뛴 기록 수"""
+        self.acquire()
+        try:
+            end = self.next_seq
+            first = end - len(self.entries)
+            start = max(cursor, first)
+            # 새 기록만큼만 뒤에서부터 꺼낸다
+            entries = list(islice(reversed(self.entries), end - start))
+        finally:
+            self.release()
+        entries.reverse()
+        return entries, end, start - cursor
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """기록을 그대로 큐에 넣는 핸들러
+
+    기본 QueueHandler는 넣기 전에 메시지를 형식화하지만, 여기서는 %-인자를
+    그대로 두어 형식화를 리스너 스레드에서 한다 (인자로 변경 가능한 객체를
+    넘기지 않는다는 전제).
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
 class Logger:
     _instance: Optional['Logger'] = None
     
@@ -15,13 +72,14 @@ class Logger:
 
     def _initialize_logger(self):
         self.logger = logging.getLogger('RecursionVisualizer')
-        self.logger.setLevel(logging.DEBUG)
+        # 기준 수준 미만의 호출은 형식화 없이 바로 버려진다
+        self.logger.setLevel(Settings.LOG.LEVEL)
+        # 루트 로거의 핸들러에서 다시 동기적으로 기록되지 않도록
+        self.logger.propagate = False
 
-        # 메모리 기반 로그 핸들러
-        self.log_stream = StringIO()
-        memory_handler = logging.StreamHandler(self.log_stream)
-        memory_handler.setFormatter(logging.Formatter(Settings.LOG.LOG_FORMAT))
-        self.logger.addHandler(memory_handler)
+        # 메모리 기반 로그 핸들러 (최근 기록만 보관)
+        self.formatter = logging.Formatter(Settings.LOG.LOG_FORMAT)
+        self.buffer = LogBuffer(Settings.LOG.MEMORY_MAX_RECORDS)
 
         # 파일 핸들러 (임시 파일에 저장)
         import tempfile
@@ -33,48 +91,103 @@ class Logger:
         )
         file_handler = logging.FileHandler(self.temp_log_file.name)
         file_handler.setFormatter(logging.Formatter(Settings.LOG.LOG_FORMAT))
-        self.logger.addHandler(file_handler)
+
+        # 호출한 스레드는 큐에 넣기만 하고, 형식화와 기록은 리스너 스레드에서
+        self._queue: queue.Queue = queue.Queue()
+        self.logger.addHandler(_DeferredQueueHandler(self._queue))
+        self._listener = logging.handlers.QueueListener(
+            self._queue, self.buffer, file_handler
+        )
+        self._listener.start()
+        self._listening = True
+
+    def flush(self):
+        """지금까지 기록 요청된 로그가 모두 처리될 때까지 대기"""
+        if self._listening:
+            self._queue.join()
+
+    def is_enabled_for(self, level: int) -> bool:
+        """해당 수준의 로그가 기록되는지 (비싼 인자를 만들기 전에 확인)"""
+        return self.logger.isEnabledFor(level)
+
+    def add_listener(self, callback: Callable[[], None]):
+        """새 로그가 기록될 때마다 호출할 함수 등록 (기록한 스레드에서 호출됨)"""
+        self.buffer.listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[], None]):
+        if callback in self.buffer.listeners:
+            self.buffer.listeners.remove(callback)
+
+    def records_since(self, cursor: int) -> Tuple[List[LogEntry], int, int]:
+        """cursor 이후의 기록, 새 커서, 건너뛴 기록 수 (처음에는 cursor=0)"""
+        return self.buffer.since(cursor)
+
+    def format_entry(self, entry: LogEntry) -> str:
+        """기록 하나를 로그 형식의 한 줄로 변환"""
+        record = logging.makeLogRecord({
+            'created': entry.created,
+            'msecs': (entry.created % 1) * 1000,
+            'levelno': entry.levelno,
+            'levelname': logging.getLevelName(entry.levelno),
+            'name': entry.name,
+            'msg': entry.message,
+        })
+        return self.formatter.format(record)
 
     def get_logs(self) -> str:
-        """현재까지의 로그 내용 반환"""
-        return self.log_stream.getvalue()
+        """메모리에 남아 있는 로그 내용 반환"""
+        self.flush()
+        entries, _, _ = self.buffer.since(0)
+        return "\n".join(self.format_entry(entry) for entry in entries)
 
     def cleanup(self):
-        """프로그램 종료 시 임시 파일 정리"""
+        """프로그램 종료 시 남은 로그를 기록하고 임시 파일 정리"""
         import os
+        if self._listening:
+            self._listening = False
+            self._listener.stop()
         try:
             self.temp_log_file.close()
             os.unlink(self.temp_log_file.name)
         except:
             pass
-        self.log_stream.close()
 
     def log_performance(self, operation: str, duration: float):
-        self.logger.debug(f"성능 측정 - {operation}: {duration:.3f}초")
+        self.logger.debug("성능 측정 - %s: %.3f초", operation, duration)
 
     def log_layout_update(self, node_count: int, modified_count: int):
         self.logger.debug(
-            f"레이아웃 업데이트 - 전체 노드: {node_count}, "
-            f"수정된 노드: {modified_count}"
+            "레이아웃 업데이트 - 전체 노드: %d, 수정된 노드: %d",
+            node_count, modified_count
         )
 
-    def error(self, message: str):
-        self.logger.error(message)
+    # 메시지는 %-형식 문자열로 넘기면 수준 확인을 통과한 경우에만 형식화된다
+    def error(self, message: str, *args):
+        self.logger.error(message, *args)
 
-    def info(self, message: str):
-        self.logger.info(message)
+    def info(self, message: str, *args):
+        self.logger.info(message, *args)
 
-    def debug(self, message: str):
-        self.logger.debug(message)
+    def debug(self, message: str, *args):
+        self.logger.debug(message, *args)
 
-    def warning(self, message: str):
-        self.logger.warning(message)
+    def warning(self, message: str, *args):
+        self.logger.warning(message, *args)
 
     def log_animation_state(self, widget_id: str, progress: float):
         """애니메이션 상태 로깅"""
-        self.logger.debug(f"애니메이션 상태 - 위젯: {widget_id}, 진행도: {progress:.2f}")
+        self.logger.debug("애니메이션 상태 - 위젯: %s, 진행도: %.2f", widget_id, progress)
 
-    def log_cache_status(self, hit: bool, cache_size: int):
+    def log_cache_status(self, hit: bool, cache_size: int,
+                         hits: Optional[int] = None, misses: Optional[int] = None):
         """캐시 상태 로깅"""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         status = "히트" if hit else "미스"
-        self.logger.debug(f"캐시 상태 - {status}, 크기: {cache_size}") 
\ No newline at end of file
+        if hits is not None and misses is not None:
+            self.logger.debug(
+                "캐시 상태 - %s, 크기: %d, 누적 히트: %d, 누적 미스: %d",
+                status, cache_size, hits, misses
+            )
+        else:
+            self.logger.debug("캐시 상태 - %s, 크기: %d", status, cache_size)
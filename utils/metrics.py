@@ -0,0 +1,167 @@
+import json
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, Optional, Tuple
+
+# 히스토그램 구간 상한 (밀리초, 마지막 구간은 그 이상 전체)
+HISTOGRAM_BOUNDS_MS = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 33.0, 66.0, 133.0, 266.0)
+# 분위수 계산에 쓰는 최근 관측값 수
+HISTOGRAM_WINDOW = 240
+# 초당 비율 계산에 쓰는 구간 (초)
+RATE_WINDOW = 1.0
+
+class Counter:
+    """누적 횟수와 최근 초당 증가량"""
+    __slots__ = ('value', '_samples')
+
+    def __init__(self):
+        self.value = 0
+        # (시각, 누적값) 표본 (RATE_WINDOW의 1/10 간격으로만 추가)
+        self._samples: Deque[Tuple[float, int]] = deque(maxlen=12)
+
+    def inc(self, amount: int = 1) -> None:
+        self.value += amount
+        now = time.perf_counter()
+        samples = self._samples
+        if not samples or now - samples[-1][0] >= RATE_WINDOW / 10:
+            samples.append((now, self.value))
+
+    def rate(self) -> float:
+        """최근 RATE_WINDOW초 동안의 초당 증가량"""
+        now = time.perf_counter()
+        samples = self._samples
+        for when, value in samples:
+            if now - when <= RATE_WINDOW:
+                elapsed = now - when
+                return (self.value - value) / elapsed if elapsed > 0 else 0.0
+        return 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'value': self.value, 'rate': self.rate()}
+
+class Gauge:
+    """마지막으로 설정한 값"""
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'value': self.value}
+
+class Histogram:
+    """관측값(밀리초)의 구간별 개수, 합계, 최소/최대와 최근 값들의 분위수"""
+    __slots__ = ('count', 'total', 'min', 'max', 'buckets', '_recent')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+        self.buckets = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        self._recent: Deque[float] = deque(maxlen=HISTOGRAM_WINDOW)
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.buckets[bisect_left(HISTOGRAM_BOUNDS_MS, value)] += 1
+        self._recent.append(value)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """최근 HISTOGRAM_WINDOW개 관측값의 분위수"""
+        if not self._recent:
+            return 0.0
+        values = sorted(self._recent)
+        return values[min(len(values) - 1, int(q * len(values)))]
+
+    @property
+    def last(self) -> float:
+        return self._recent[-1] if self._recent else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'mean_ms': self.mean,
+            'min_ms': self.min if self.count else 0.0,
+            'max_ms': self.max,
+            'p50_ms': self.quantile(0.5),
+            'p95_ms': self.quantile(0.95),
+            'buckets': {
+                **{f"le_{bound:g}ms": n for bound, n in zip(HISTOGRAM_BOUNDS_MS, self.buckets)},
+                'inf': self.buckets[-1],
+            },
+        }
+
+class Metrics:
+    """이름으로 찾는 카운터/게이지/히스토그램 모음 (Logger처럼 하나만 존재)
+
+    값 갱신은 GUI 스레드에서만 한다고 가정하므로 잠금을 쓰지 않는다.
+    """
+    _instance: Optional['Metrics'] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance.reset()
+        return cls._instance
+
+    def reset(self) -> None:
+        self.counters: Dict[str, Counter] = {}
+        self.gauges: Dict[str, Gauge] = {}
+        self.histograms: Dict[str, Histogram] = {}
+        self.started = time.time()
+
+    def counter(self, name: str) -> Counter:
+        counter = self.counters.get(name)
+        if counter is None:
+            counter = self.counters[name] = Counter()
+        return counter
+
+    def gauge(self, name: str) -> Gauge:
+        gauge = self.gauges.get(name)
+        if gauge is None:
+            gauge = self.gauges[name] = Gauge()
+        return gauge
+
+    def histogram(self, name: str) -> Histogram:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        return histogram
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """블록 실행 시간(밀리초)을 히스토그램 name에 기록"""
+        histogram = self.histogram(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            histogram.observe((time.perf_counter() - start) * 1000)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'started': self.started,
+            'time': time.time(),
+            'counters': {name: c.to_dict() for name, c in sorted(self.counters.items())},
+            'gauges': {name: g.to_dict() for name, g in sorted(self.gauges.items())},
+            'histograms': {name: h.to_dict() for name, h in sorted(self.histograms.items())},
+        }
+
+    def dump(self, path: str) -> None:
+        """현재 값을 JSON 파일로 저장"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.snapshot(), f, ensure_ascii=False, indent=2)